@@ -1,8 +1,13 @@
-import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog, scrolledtext
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
+# Tk is bound by load_tk() and matplotlib by ensure_chart(), so importing this
+# module doesn't pay for either.
+tk = ttk = messagebox = simpledialog = scrolledtext = None
+
+
+def load_tk():
+    global tk, ttk, messagebox, simpledialog, scrolledtext
+    if tk is None:
+        from tkinter import ttk, messagebox, simpledialog, scrolledtext
+        import tkinter as tk
 
 class Process:
     def __init__(self, pid, arrival_time, burst_time, priority=0):
@@ -16,6 +21,7 @@ class Process:
 
 class ProcessSchedulerApp:
     def __init__(self, root):
+        load_tk()
         self.root = root
         self.root.title("Process Scheduler Simulator")
         self.root.geometry("900x700")
@@ -110,7 +116,18 @@ class ProcessSchedulerApp:
         self.gantt_frame = ttk.LabelFrame(self.output_frame, text="Gantt Chart")
         self.gantt_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        # Initialize empty figure for Gantt chart
+        # The figure is created by ensure_chart() when the first chart is drawn
+        self.fig = self.ax = self.canvas = None
+        self.gantt_placeholder = ttk.Label(self.gantt_frame, text="No data available", anchor=tk.CENTER)
+        self.gantt_placeholder.pack(fill=tk.BOTH, expand=True)
+        
+    def ensure_chart(self):
+        if self.canvas is not None:
+            return
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+
+        self.gantt_placeholder.destroy()
         self.fig = Figure(figsize=(8, 3), dpi=100)
         self.ax = self.fig.add_subplot(111)
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.gantt_frame)
@@ -157,6 +174,8 @@ class ProcessSchedulerApp:
         self.metrics_text.delete(1.0, tk.END)
         
     def clear_gantt_chart(self):
+        if self.canvas is None:
+            return
         self.ax.clear()
         self.ax.set_title("No data available")
         self.canvas.draw()
@@ -181,6 +200,7 @@ class ProcessSchedulerApp:
         self.metrics_text.insert(tk.END, output)
         
     def show_gantt_chart(self, processes):
+        self.ensure_chart()
         self.ax.clear()
         
         if not processes:
@@ -331,6 +351,7 @@ class ProcessSchedulerApp:
         self.show_gantt_chart(processes_copy)
 
 if __name__ == "__main__":
+    load_tk()
     root = tk.Tk()
     app = ProcessSchedulerApp(root)
     root.mainloop()
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""Many small workloads: one simulate() per workload vs one simulate_batch().
+
+Run from the repository root::
+
+    python benchmarks/bench_batch.py [workloads] [processes per workload]
+
+The per-workload loop is what a capacity-planning job does today: build a
+``Schedule`` and its full metrics dict for each workload. Before any timing
+is reported, the batch averages are checked against the loop's.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from process_scheduler.batch import WorkloadBatch, simulate_batch  # noqa: E402
+from process_scheduler.engine import simulate  # noqa: E402
+from process_scheduler.synthetic import generate_workload  # noqa: E402
+
+ALGORITHMS = ("FCFS", "SJF", "Round Robin", "SRTF")
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def main(count, size):
+    workloads = [generate_workload(size, seed=k) for k in range(count)]
+    batch = WorkloadBatch.from_workloads(workloads)
+    print(f"{count:,} workloads of {size} processes")
+    print(f"{'algorithm':<14}{'loop s':>10}{'batch s':>10}{'speedup':>10}")
+    for algorithm in ALGORITHMS:
+        loop_s, expected = timed(lambda: [simulate(algorithm, w, quantum=4).metrics() for w in workloads])
+        batch_s, metrics = timed(simulate_batch, algorithm, batch, quantum=4)
+        for name in ('TAT', 'WT', 'RT'):
+            if any(abs(m[name] - value) > 1e-9 for m, value in zip(expected, metrics[name])):
+                raise SystemExit(f"{algorithm}: batch {name} differs from simulate()")
+        print(f"{algorithm:<14}{loop_s:>10.3f}{batch_s:>10.3f}{loop_s / batch_s:>9.1f}x")
+
+
+if __name__ == "__main__":
+    args = [int(float(a)) for a in sys.argv[1:]]
+    main(*(args + [10000, 24][len(args):]))
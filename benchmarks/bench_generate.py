@@ -0,0 +1,57 @@
+"""Synthetic workload generation throughput, and the runners on what it makes.
+
+Run from the repository root::
+
+    python benchmarks/bench_generate.py [n ...]
+
+Every arrival model is generated with Pareto bursts, then SJF and Round
+Robin are run on the result. Before any timing is reported, each workload is
+checked for the properties the generator promises: unique PIDs, arrivals
+in PID order, bursts of at least 1, and an arrival rate near the one asked
+for.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from process_scheduler.engine import run_rr, run_sjf  # noqa: E402
+from process_scheduler.synthetic import ARRIVALS, generate_workload  # noqa: E402
+
+LOAD = 0.9
+MEAN_BURST = 10
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def check(workload, n, arrivals):
+    pids, arrival = workload.pid, workload.arrival
+    if len(workload) != n or pids[0] != 1 or pids[-1] != n:
+        raise SystemExit(f"{arrivals} n={n}: PIDs are not 1..n")
+    if any(a > b for a, b in zip(arrival, arrival[1:])) or min(workload.burst) < 1:
+        raise SystemExit(f"{arrivals} n={n}: arrivals out of order or a burst below 1")
+    rate = n / max(arrival[-1], 1)
+    if n >= 10000 and abs(rate * MEAN_BURST / LOAD - 1) > 0.1:
+        raise SystemExit(f"{arrivals} n={n}: arrival rate {rate:.4f} is off target")
+
+
+def main(sizes):
+    print(f"{'arrivals':<10}{'n':>12}{'generate s':>12}{'rows/s':>14}{'SJF s':>10}{'RR s':>10}")
+    for n in sizes:
+        for arrivals in ARRIVALS:
+            gen_s, workload = timed(generate_workload, n, arrivals=arrivals, bursts='pareto',
+                                    mean_burst=MEAN_BURST, load=LOAD)
+            check(workload, n, arrivals)
+            sjf_s, _ = timed(run_sjf, workload)
+            rr_s, _ = timed(run_rr, workload, quantum=4)
+            print(f"{arrivals:<10}{n:>12,}{gen_s:>12.3f}{n / gen_s:>14,.0f}{sjf_s:>10.2f}{rr_s:>10.2f}")
+
+
+if __name__ == "__main__":
+    main([int(float(a)) for a in sys.argv[1:]] or [100000, 1000000])
@@ -0,0 +1,65 @@
+"""Multi-CPU simulation throughput and queue-layout comparison.
+
+Run from the repository root::
+
+    python benchmarks/bench_multicore.py [cpus] [n]
+
+Arrivals are spread so the CPUs run at about 90% load. Every algorithm is
+run with a global queue, per-CPU queues, and per-CPU queues with work
+stealing. Before any timing is reported, each algorithm's single-CPU
+multicore run is checked against its single-CPU runner.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from process_scheduler.engine import simulate  # noqa: E402
+from process_scheduler.multicore import simulate_multicore  # noqa: E402
+from process_scheduler.workload import Workload  # noqa: E402
+
+LOAD = 0.9
+MEAN_BURST = 10
+LAYOUTS = (("global", False), ("per-cpu", False), ("per-cpu", True))
+
+
+def make_workload(n, cpus, seed=0):
+    rng = random.Random(seed)
+    horizon = int(n * MEAN_BURST / (cpus * LOAD))
+    return Workload(range(n), sorted(rng.randint(0, horizon) for _ in range(n)),
+                    [rng.randint(1, 2 * MEAN_BURST - 1) for _ in range(n)],
+                    [rng.randint(0, 9) for _ in range(n)])
+
+
+def check_single_cpu(algorithm):
+    workload = make_workload(2000, 1, seed=1)
+    reference = simulate(algorithm, workload, quantum=4)
+    schedule = simulate_multicore(algorithm, workload, cpus=1, quantum=4)
+    if list(reference.start) != list(schedule.start) or list(reference.completion) != list(schedule.completion):
+        raise SystemExit(f"{algorithm}: one-CPU multicore schedule differs from the single-CPU runner")
+
+
+def main(cpus, n):
+    workload = make_workload(n, cpus)
+    workload.arrival_order()
+    print(f"{cpus} CPUs, {n:,} processes")
+    print(f"{'algorithm':<22}{'queues':<10}{'steal':<7}{'s':>8}{'jobs/s':>12}{'avg WT':>10}"
+          f"{'util min':>10}{'util max':>10}{'migrations':>12}")
+    for algorithm in ("FCFS", "SJF", "Priority", "Round Robin", "SRTF", "Preemptive Priority"):
+        check_single_cpu(algorithm)
+        for queues, steal in LAYOUTS:
+            start = time.perf_counter()
+            schedule = simulate_multicore(algorithm, workload, cpus=cpus, queues=queues, steal=steal, quantum=4)
+            elapsed = time.perf_counter() - start
+            m = schedule.metrics()
+            print(f"{algorithm:<22}{queues:<10}{'yes' if steal else 'no':<7}{elapsed:>8.2f}{n / elapsed:>12,.0f}"
+                  f"{m['WT']:>10.2f}{m['core_utilization_min']:>10.1%}{m['core_utilization_max']:>10.1%}"
+                  f"{m['migrations']:>12,}")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    main(args[0] if args else 64, args[1] if len(args) > 1 else 1000000)
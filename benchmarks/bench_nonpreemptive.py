@@ -0,0 +1,87 @@
+"""Throughput benchmark: heap-based SJF/Priority vs the original rescanning loop.
+
+Run from the repository root::
+
+    python benchmarks/bench_nonpreemptive.py [n ...]
+
+For every size the legacy loop (kept verbatim below as the reference) is run
+only while it stays affordable; whenever both run, their schedules are checked
+for identical output before any timing is reported.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from process_scheduler.engine import Process, run_priority, run_sjf  # noqa: E402
+
+LEGACY_LIMIT = 2000
+
+
+def legacy_run(processes, key):
+    processes_copy = [p.copy() for p in processes]
+    time_ = 0
+    completed = 0
+    n = len(processes_copy)
+    ready_queue = []
+
+    while completed < n:
+        for p in processes_copy:
+            if p.arrival_time <= time_ and p not in ready_queue and p.completion_time == 0:
+                ready_queue.append(p)
+
+        if ready_queue:
+            ready_queue.sort(key=key)
+            current = ready_queue.pop(0)
+            current.start_time = time_
+            time_ += current.burst_time
+            current.completion_time = time_
+            completed += 1
+        else:
+            time_ += 1
+    return processes_copy
+
+
+def make_workload(n, seed=0, gap=1):
+    """``gap`` stretches inter-arrival times so the CPU sits idle between jobs."""
+    rng = random.Random(seed)
+    return [Process(i, rng.randint(0, n * gap), rng.randint(1, 10), rng.randint(0, 9))
+            for i in range(n)]
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def snapshot(processes):
+    return [(p.pid, p.start_time, p.completion_time) for p in processes]
+
+
+def main(sizes):
+    cases = [
+        ("SJF", run_sjf, lambda x: x.burst_time),
+        ("Priority", run_priority, lambda x: (x.priority, x.arrival_time)),
+    ]
+    print(f"{'algorithm':<10}{'n':>10}{'gap':>5}{'legacy s':>12}{'heap s':>10}{'jobs/s':>14}{'speedup':>10}")
+    for n in sizes:
+        for gap in (1, 50):
+            workload = make_workload(n, gap=gap)
+            for name, fast, key in cases:
+                fast_s, schedule = timed(fast, workload)
+                legacy_s = None
+                if n <= LEGACY_LIMIT:
+                    legacy_s, reference = timed(legacy_run, workload, key)
+                    if snapshot(reference) != snapshot(schedule.processes):
+                        raise SystemExit(f"{name} n={n}: heap schedule differs from legacy")
+                legacy_col = f"{legacy_s:>12.4f}" if legacy_s is not None else f"{'-':>12}"
+                speedup = f"{legacy_s / fast_s:>9.1f}x" if legacy_s is not None else f"{'-':>10}"
+                print(f"{name:<10}{n:>10}{gap:>5}{legacy_col}{fast_s:>10.4f}{n / fast_s:>14,.0f}{speedup}")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [100, 1000, 2000, 100000])
@@ -0,0 +1,102 @@
+"""Startup-time benchmark for the GUI module and the headless package.
+
+Run from the repository root::
+
+    python benchmarks/bench_startup.py [--baseline REV] [--repeat N]
+
+Every measurement runs in a fresh interpreter so module caches don't leak
+between samples; the median of ``--repeat`` runs is reported. With
+``--baseline`` the same measurements are taken on a ``git archive`` of that
+revision, giving a before/after table. Import-to-first-window needs a display
+and is skipped without one.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GUI_FILE = "process_scheduler[1].py"
+
+_LOAD_GUI = f"""
+import importlib.util, sys, time
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location("gui", {GUI_FILE!r})
+gui = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(gui)
+"""
+
+PROBES = {
+    'import GUI module': _LOAD_GUI + "print(time.perf_counter() - start)",
+    'import engine': """
+import time
+start = time.perf_counter()
+import process_scheduler
+print(time.perf_counter() - start)
+""",
+    'import to first window': _LOAD_GUI + """
+tk = getattr(gui, 'tk', None)
+if tk is None:
+    import tkinter as tk
+root = tk.Tk()
+app = gui.ProcessSchedulerApp(root)
+root.update()
+print(time.perf_counter() - start)
+root.destroy()
+""",
+}
+
+
+def has_display():
+    return sys.platform in ('win32', 'darwin') or bool(os.environ.get('DISPLAY'))
+
+
+def measure(tree, probe, repeat):
+    samples = []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, '-c', probe], cwd=tree, capture_output=True, text=True)
+        if result.returncode != 0:
+            return None
+        samples.append(float(result.stdout.split()[-1]))
+    return statistics.median(samples)
+
+
+def export_revision(rev, dest):
+    archive = os.path.join(dest, 'tree.tar')
+    subprocess.run(['git', 'archive', '--format=tar', '-o', archive, rev], cwd=ROOT, check=True)
+    with tarfile.open(archive) as tar:
+        tar.extractall(dest)
+    return dest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--baseline', help="git revision to compare against")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    probes = dict(PROBES)
+    if not has_display():
+        print("no display: skipping 'import to first window'\n")
+        del probes['import to first window']
+
+    with tempfile.TemporaryDirectory() as tmp:
+        trees = [('current', ROOT)]
+        if args.baseline:
+            trees.insert(0, (args.baseline, export_revision(args.baseline, tmp)))
+
+        print(f"{'measurement':<26}" + "".join(f"{label:>14}" for label, _ in trees))
+        for name, probe in probes.items():
+            cells = []
+            for _, tree in trees:
+                seconds = measure(tree, probe, args.repeat)
+                cells.append(f"{seconds * 1000:>12.1f}ms" if seconds is not None else f"{'n/a':>14}")
+            print(f"{name:<26}" + "".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""Benchmark suite: every algorithm plus the GUI's hot paths, with a history.
+
+Run from the repository root::
+
+    python benchmarks/bench_suite.py [--sizes 10,1000,1e6] [--save-baseline]
+
+Each case runs on a seeded synthetic workload (Poisson arrivals,
+exponential bursts) at every size. Small cases are looped until a sample
+takes ``SAMPLE_SECONDS``; the best of ``--repeat`` samples is reported.
+
+Every run is appended to the ``--history`` JSON file with its commit and
+interpreter. When a ``--baseline`` file exists, each timing is compared with
+it and anything more than ``--tolerance`` slower (and slower by more than
+``NOISE_FLOOR`` seconds) is flagged; the script then exits with status 1.
+``--save-baseline`` stores this run as the new baseline instead.
+
+The process list case needs a display and is skipped without one; the Gantt
+case renders off-screen and needs matplotlib.
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from process_scheduler.engine import ALGORITHMS, calculate_metrics, simulate  # noqa: E402
+from process_scheduler.synthetic import generate_workload  # noqa: E402
+
+SIZES = (10, 100, 1000, 10000, 100000, 1000000)
+SAMPLE_SECONDS = 0.2
+NOISE_FLOOR = 0.0005
+HISTORY = os.path.join(ROOT, 'benchmarks', 'history.json')
+BASELINE = os.path.join(ROOT, 'benchmarks', 'baseline.json')
+
+
+def best_time(func, repeat):
+    """Best per-call time of ``repeat`` samples, each looping ``func`` for about ``SAMPLE_SECONDS``."""
+    start = time.perf_counter()
+    func()
+    first = time.perf_counter() - start
+    number = 1 if first >= SAMPLE_SECONDS else math.ceil(SAMPLE_SECONDS / max(first, 1e-9))
+    samples = [first] if number == 1 else []
+    while len(samples) < repeat:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+    return min(samples)
+
+
+def make_process_list():
+    """A ``VirtualProcessList`` on a real Treeview sorted by burst, or ``None`` without a display."""
+    try:
+        import tkinter as tk
+        from tkinter import ttk
+        root = tk.Tk()
+    except Exception:
+        return None
+    from process_scheduler.listview import COLUMNS, VirtualProcessList
+    from process_scheduler.workload import Workload
+
+    root.withdraw()
+    tree = ttk.Treeview(root, columns=list(COLUMNS), show='headings', height=20)
+    for column in COLUMNS:
+        tree.heading(column, text=column)
+    process_list = VirtualProcessList(tree, ttk.Scrollbar(root), Workload())
+    process_list.sort_by('Burst')
+    return process_list
+
+
+def make_gantt():
+    """An off-screen ``(chart, figure)`` the size of the GUI's, or ``None`` without matplotlib."""
+    try:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+    except ImportError:
+        return None
+    from process_scheduler.gantt import GanttChart
+
+    fig = Figure(figsize=(6, 4), dpi=100)
+    FigureCanvasAgg(fig)
+    return GanttChart(fig.add_subplot(111)), fig
+
+
+def cases(workload, process_list, gantt):
+    """``(name, func)`` for every case on ``workload``."""
+    for algorithm in ALGORITHMS:
+        yield algorithm, lambda algorithm=algorithm: simulate(algorithm, workload, quantum=4)
+    sjf = simulate("SJF", workload)
+    yield 'calculate_metrics', lambda: calculate_metrics(sjf)
+    if process_list is not None:
+        yield 'update_process_list', lambda: process_list.set_workload(workload)
+    if gantt is not None:
+        chart, fig = gantt
+        rr = simulate("Round Robin", workload, quantum=4)
+
+        def render():
+            chart.ax.clear()
+            chart.set_schedule(rr)
+            fig.canvas.draw()
+        yield 'show_gantt_chart', render
+
+
+def run(sizes, repeat):
+    """``{case: {size: seconds}}``, printing each timing as it is taken."""
+    process_list, gantt = make_process_list(), make_gantt()
+    if process_list is None:
+        print("no display: skipping update_process_list")
+    if gantt is None:
+        print("no matplotlib: skipping show_gantt_chart")
+    results = {}
+    for n in sizes:
+        workload = generate_workload(n, seed=0)
+        workload.arrival_order()
+        for name, func in cases(workload, process_list, gantt):
+            seconds = best_time(func, repeat)
+            results.setdefault(name, {})[str(n)] = seconds
+            print(f"{name:<22}{n:>10,}{seconds * 1000:>14.3f}ms", flush=True)
+    return results
+
+
+def git_commit():
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True, text=True)
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+
+def load_json(path, default):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+
+
+def save_json(path, data):
+    tmp = f"{path}.tmp"
+    with open(tmp, 'w') as f:
+        json.dump(data, f, indent=1)
+    os.replace(tmp, path)
+
+
+def compare(results, baseline, tolerance):
+    """Print current vs baseline timings; returns the regressed ``(case, size)`` pairs."""
+    regressions = []
+    print(f"\nagainst baseline {baseline.get('commit') or '?'} ({baseline.get('timestamp', '?')}):")
+    print(f"{'case':<22}{'n':>10}{'baseline ms':>14}{'now ms':>12}{'ratio':>8}")
+    for name, timings in results.items():
+        for size, seconds in timings.items():
+            before = baseline['results'].get(name, {}).get(size)
+            if before is None:
+                continue
+            ratio = seconds / before if before else float('inf')
+            regressed = ratio > 1 + tolerance and seconds - before > NOISE_FLOOR
+            if regressed:
+                regressions.append((name, size))
+            print(f"{name:<22}{int(size):>10,}{before * 1000:>14.3f}{seconds * 1000:>12.3f}{ratio:>7.2f}x"
+                  + ("  REGRESSION" if regressed else ""))
+    return regressions
+
+
+def _sizes(value):
+    return [int(float(part)) for part in value.split(',')]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=_sizes, default=list(SIZES), help="comma-separated, e.g. 10,1000,1e6")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--history', default=HISTORY, help="JSON file every run is appended to")
+    parser.add_argument('--baseline', default=BASELINE, help="JSON file of the run to compare against")
+    parser.add_argument('--save-baseline', action='store_true', help="store this run as the baseline")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="slowdown flagged as a regression, as a fraction (default: 0.25)")
+    args = parser.parse_args()
+
+    print(f"{'case':<22}{'n':>10}{'best':>16}")
+    record = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': run(args.sizes, args.repeat),
+    }
+    history = load_json(args.history, [])
+    history.append(record)
+    save_json(args.history, history)
+
+    if args.save_baseline:
+        save_json(args.baseline, record)
+        print(f"\nbaseline saved to {args.baseline}")
+        return
+    baseline = load_json(args.baseline, None)
+    if baseline is None:
+        print(f"\nno baseline at {args.baseline}; run with --save-baseline to create one")
+        return
+    regressions = compare(record['results'], baseline, args.tolerance)
+    if regressions:
+        raise SystemExit(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}")
+    print("\nno regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Schedule traces: writing one, mapping it back, and replaying it vs re-running.
+
+Run from the repository root::
+
+    python benchmarks/bench_trace.py [n ...]
+
+Round Robin on a synthetic workload gives a slice log several times the
+process count. Its trace is written, mapped and turned back into metrics
+and Gantt arrays; before any timing is reported, both are checked against
+the original schedule.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from process_scheduler.engine import run_rr  # noqa: E402
+from process_scheduler.gantt import slice_arrays  # noqa: E402
+from process_scheduler.synthetic import generate_workload  # noqa: E402
+from process_scheduler.trace import load_trace, save_trace  # noqa: E402
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def main(sizes):
+    print(f"{'n':>12}{'slices':>14}{'MB':>8}{'run s':>9}{'save s':>9}{'load s':>9}{'replay s':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'rr.pstr')
+        for n in sizes:
+            workload = generate_workload(n, seed=0)
+            run_s, schedule = timed(run_rr, workload, quantum=2)
+            save_s, _ = timed(save_trace, schedule, path)
+            load_s, trace = timed(load_trace, path)
+            replay_s, metrics = timed(lambda: trace.schedule().metrics())
+            if metrics != schedule.metrics():
+                raise SystemExit(f"n={n}: replayed metrics differ")
+            if any((a != b).any() for a, b in zip(slice_arrays(trace.schedule()), slice_arrays(schedule))):
+                raise SystemExit(f"n={n}: replayed slices differ")
+            size = os.path.getsize(path) / 1e6
+            print(f"{n:>12,}{len(schedule.timeline):>14,}{size:>8.0f}{run_s:>9.2f}{save_s:>9.2f}{load_s:>9.4f}"
+                  f"{replay_s:>10.2f}")
+            del trace
+
+
+if __name__ == "__main__":
+    main([int(float(a)) for a in sys.argv[1:]] or [100000, 1000000])
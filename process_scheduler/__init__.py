@@ -0,0 +1,19 @@
+"""Process scheduling simulator: headless engine plus the Tk front end."""
+
+from .engine import (
+    ALGORITHMS,
+    Process,
+    Schedule,
+    calculate_metrics,
+    compare,
+    run_fcfs,
+    run_preemptive_priority,
+    run_priority,
+    run_rr,
+    run_sjf,
+    run_srtf,
+    simulate,
+)
+from .jobs import Cancelled, Job
+from .parallel import compare_parallel
+from .workload import Workload
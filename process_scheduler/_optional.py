@@ -0,0 +1,13 @@
+"""Optional dependencies, imported on first use rather than at import time."""
+
+import functools
+
+
+@functools.lru_cache(maxsize=None)
+def numpy():
+    """The ``numpy`` module, or ``None`` when it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
@@ -0,0 +1,211 @@
+"""Simulate many small workloads in one call.
+
+A ``WorkloadBatch`` packs any number of workloads into one set of int64
+columns plus an ``offsets`` array: workload ``k`` is rows
+``offsets[k]:offsets[k + 1]``. ``simulate_batch`` runs one algorithm over
+every workload and returns per-workload metric arrays rather than a
+``Schedule`` and a metrics dict per workload, which is where the time goes
+when the workloads are small.
+
+With NumPy, FCFS is solved for the whole batch at once: within a workload
+sorted by arrival, completion ``c[i] = max(c[i - 1], a[i]) + b[i]``
+unrolls to ``B[i] + max(a[j] - B[j - 1] for j <= i)`` with ``B`` the running
+burst total, i.e. a cumulative sum and a cumulative maximum. Other
+algorithms run workload by workload on zero-copy views of the packed
+columns, and the metrics of all of them are reduced in one pass per
+column. Without NumPy every step is a plain loop over the packed columns.
+
+Batches simulate one CPU; only averages, maxima and the makespan-based
+metrics are reported, as percentiles do not reduce per segment cheaply.
+"""
+
+from array import array
+
+from ._optional import numpy
+from .engine import ALGORITHMS, accepted_params, resolve_algorithm
+from .workload import Workload, as_workload
+
+BATCH_METRICS = ('TAT', 'WT', 'RT', 'TAT_max', 'WT_max', 'RT_max', 'makespan', 'throughput', 'cpu_utilization')
+
+
+class WorkloadBatch:
+    """Packed PID, arrival, burst and priority columns of many workloads, split by ``offsets``."""
+
+    __slots__ = ('pid', 'arrival', 'burst', 'priority', 'offsets')
+
+    def __init__(self, pid=(), arrival=(), burst=(), priority=None, offsets=(0,)):
+        self.pid = array('q', pid)
+        self.arrival = array('q', arrival)
+        self.burst = array('q', burst)
+        self.priority = array('q', priority if priority is not None else bytes(8 * len(self.pid)))
+        self.offsets = array('q', offsets)
+        if not len(self.pid) == len(self.arrival) == len(self.burst) == len(self.priority):
+            raise ValueError("Batch columns must have the same length.")
+        if not self.offsets or self.offsets[0] != 0 or self.offsets[-1] != len(self.pid):
+            raise ValueError("Offsets must run from 0 to the number of processes.")
+        if any(lo >= hi for lo, hi in zip(self.offsets, self.offsets[1:])):
+            raise ValueError("Offsets must be increasing; every workload needs a process.")
+
+    @classmethod
+    def from_workloads(cls, workloads):
+        """Pack ``Workload`` objects (or sequences of ``Process``)."""
+        batch = cls()
+        for workload in workloads:
+            batch.add(workload)
+        return batch
+
+    def add(self, workload):
+        """Append one workload to the batch."""
+        workload = as_workload(workload)
+        if not len(workload):
+            raise ValueError("No processes to schedule!")
+        for column, values in zip((self.pid, self.arrival, self.burst, self.priority),
+                                  (workload.pid, workload.arrival, workload.burst, workload.priority)):
+            column.extend(values)
+        self.offsets.append(len(self.pid))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, k):
+        """Workload ``k`` as a read-only view of the packed columns."""
+        k = range(len(self))[k]
+        lo, hi = self.offsets[k], self.offsets[k + 1]
+        return Workload.from_buffers(*(memoryview(column)[lo:hi]
+                                       for column in (self.pid, self.arrival, self.burst, self.priority)))
+
+    def sizes(self):
+        return array('q', (hi - lo for lo, hi in zip(self.offsets, self.offsets[1:])))
+
+
+def _fcfs_numpy(np, batch):
+    if not len(batch):
+        return array('q'), array('q')
+    arrival = np.frombuffer(batch.arrival, dtype=np.int64)
+    burst = np.frombuffer(batch.burst, dtype=np.int64)
+    offsets = np.frombuffer(batch.offsets, dtype=np.int64)
+    sizes = np.diff(offsets)
+    segment = np.repeat(np.arange(len(sizes)), sizes)
+    # Stable, so equal arrivals keep workload order as in run_fcfs
+    order = np.lexsort((arrival, segment))
+    a, b = arrival[order], burst[order]
+
+    total = np.cumsum(b)
+    before = np.repeat(np.concatenate(([0], total[offsets[1:-1] - 1])), sizes)
+    ran = total - before
+    gap = a - (ran - b)
+    # Lift each workload above the previous one so one running maximum
+    # never carries across a boundary
+    low = np.minimum.reduceat(gap, offsets[:-1])
+    width = np.maximum.reduceat(gap, offsets[:-1]) - low + 1
+    lift = np.repeat(np.concatenate(([0], np.cumsum(width[:-1]))) - low, sizes)
+    completion = np.empty_like(a)
+    # The clock starts at 0, as in run_fcfs
+    completion[order] = ran + np.maximum(np.maximum.accumulate(gap + lift) - lift, 0)
+    start = completion - burst
+    return array('q', start.tobytes()), array('q', completion.tobytes())
+
+
+def _fcfs_python(batch):
+    arrival, burst, offsets = batch.arrival, batch.burst, batch.offsets
+    start, completion = array('q', bytes(8 * len(arrival))), array('q', bytes(8 * len(arrival)))
+    for k in range(len(offsets) - 1):
+        time = 0
+        lo, hi = offsets[k], offsets[k + 1]
+        for i in sorted(range(lo, hi), key=arrival.__getitem__):
+            if time < arrival[i]:
+                time = arrival[i]
+            start[i] = time
+            time += burst[i]
+            completion[i] = time
+    return start, completion
+
+
+def schedule_batch(algorithm, batch, progress=None, **params):
+    """Packed ``(start, completion)`` columns of ``algorithm`` run on every workload of ``batch``.
+
+    ``progress`` is called as ``progress(done, total)`` in workloads.
+    """
+    name = resolve_algorithm(algorithm)
+    params = accepted_params(name, params)
+    if params.get('cpus', 1) != 1:
+        raise ValueError("Batched runs simulate a single CPU.")
+    if name == "FCFS":
+        np = numpy()
+        return _fcfs_numpy(np, batch) if np is not None else _fcfs_python(batch)
+
+    runner = ALGORITHMS[name][0]
+    start, completion = array('q', bytes(8 * len(batch.pid))), array('q', bytes(8 * len(batch.pid)))
+    offsets = batch.offsets
+    for k in range(len(batch)):
+        if progress is not None:
+            progress(k, len(batch))
+        schedule = runner(batch[k], **params)
+        start[offsets[k]:offsets[k + 1]] = schedule.start
+        completion[offsets[k]:offsets[k + 1]] = schedule.completion
+    return start, completion
+
+
+def _metrics_numpy(np, batch, start, completion):
+    arrival = np.frombuffer(batch.arrival, dtype=np.int64)
+    burst = np.frombuffer(batch.burst, dtype=np.int64)
+    start = np.frombuffer(start, dtype=np.int64)
+    completion = np.frombuffer(completion, dtype=np.int64)
+    heads = np.frombuffer(batch.offsets, dtype=np.int64)[:-1]
+    sizes = np.diff(np.frombuffer(batch.offsets, dtype=np.int64))
+
+    tat, rt = completion - arrival, start - arrival
+    wt = tat - burst
+    busy = np.add.reduceat(burst, heads)
+    makespan = np.maximum.reduceat(completion, heads) - np.minimum.reduceat(arrival, heads)
+    span = np.where(makespan > 0, makespan, 1)
+    metrics = {}
+    for name, values in (('TAT', tat), ('WT', wt), ('RT', rt)):
+        metrics[name] = np.add.reduceat(values, heads) / sizes
+        metrics[f'{name}_max'] = np.maximum.reduceat(values, heads)
+    metrics['makespan'] = makespan
+    metrics['throughput'] = np.where(makespan > 0, sizes / span, 0.0)
+    metrics['cpu_utilization'] = np.where(makespan > 0, busy / span, 0.0)
+    return {name: array('d' if metrics[name].dtype.kind == 'f' else 'q', metrics[name].tobytes())
+            for name in BATCH_METRICS}
+
+
+def _metrics_python(batch, start, completion):
+    arrival, burst, offsets = batch.arrival, batch.burst, batch.offsets
+    metrics = {name: array('q' if name.endswith('_max') or name == 'makespan' else 'd') for name in BATCH_METRICS}
+    for k in range(len(offsets) - 1):
+        lo, hi = offsets[k], offsets[k + 1]
+        n = hi - lo
+        tat = [completion[i] - arrival[i] for i in range(lo, hi)]
+        wt = [t - burst[i] for t, i in zip(tat, range(lo, hi))]
+        rt = [start[i] - arrival[i] for i in range(lo, hi)]
+        for name, values in (('TAT', tat), ('WT', wt), ('RT', rt)):
+            metrics[name].append(sum(values) / n)
+            metrics[f'{name}_max'].append(max(values))
+        makespan = max(completion[lo:hi]) - min(arrival[lo:hi])
+        metrics['makespan'].append(makespan)
+        metrics['throughput'].append(n / makespan if makespan else 0.0)
+        metrics['cpu_utilization'].append(sum(burst[lo:hi]) / makespan if makespan else 0.0)
+    return metrics
+
+
+def batch_metrics(batch, start, completion):
+    """``{metric: array}`` with one entry per workload, for every name in ``BATCH_METRICS``.
+
+    Each entry matches the same key of ``schedule_metrics`` on that workload.
+    """
+    np = numpy()
+    if np is not None:
+        return _metrics_numpy(np, batch, start, completion)
+    return _metrics_python(batch, start, completion)
+
+
+def simulate_batch(algorithm, batch, progress=None, **params):
+    """Run ``algorithm`` on every workload of ``batch``; returns ``batch_metrics``.
+
+    ``batch`` is a ``WorkloadBatch`` or an iterable of workloads to pack.
+    """
+    if not isinstance(batch, WorkloadBatch):
+        batch = WorkloadBatch.from_workloads(batch)
+    start, completion = schedule_batch(algorithm, batch, progress, **params)
+    return batch_metrics(batch, start, completion)
@@ -0,0 +1,176 @@
+"""Memoized schedules and metrics.
+
+Results are keyed by the workload's content fingerprint plus the algorithm and
+the parameters it accepts (quantum, priority direction), so any change to the
+workload -- an added process, a cleared list, another import -- produces a
+new key and stale results are never hit again.
+
+Schedules and metrics live in one LRU store bounded by ``max_bytes``.
+With a ``directory``, metrics (small, and all a comparison needs) are also
+written there as JSON, so repeated batch comparisons over the same traces
+skip simulation entirely across runs. Cached schedules share their arrays
+between hits; like every ``Schedule``, treat them as read-only.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import threading
+from array import array
+from collections import OrderedDict
+
+from .engine import accepted_params, resolve_algorithm, simulate
+from .workload import as_workload
+
+DEFAULT_BUDGET = 256 * 1024 * 1024
+# Rough cost of one metrics dict
+METRICS_BYTES = 2048
+
+
+def _nbytes(column):
+    return len(column) * column.itemsize if column is not None else 0
+
+
+def _rebind(schedule, workload):
+    schedule = copy.copy(schedule)
+    schedule.workload = workload
+    return schedule
+
+
+def _schedule_bytes(schedule):
+    timeline = schedule.timeline
+    return (_nbytes(schedule.start) + _nbytes(schedule.completion) + _nbytes(schedule.order)
+            + sum(_nbytes(getattr(timeline, name, None)) for name in ('index', 'start', 'end', 'cpu')))
+
+
+class ScheduleCache:
+    """LRU cache of schedules and metrics under a memory budget (in bytes)."""
+
+    def __init__(self, max_bytes=DEFAULT_BUDGET, directory=None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.nbytes = 0
+        self._entries = OrderedDict()  # key -> (value, size)
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def key(self, algorithm, workload, params):
+        """``(fingerprint, algorithm, params)`` with only the params ``algorithm`` accepts."""
+        name = resolve_algorithm(algorithm)
+        params = accepted_params(name, params)
+        # Lists (e.g. MLFQ level quanta) become tuples so the key stays hashable
+        return (workload.fingerprint(), name,
+                tuple(sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in params.items())))
+
+    def simulate(self, algorithm, processes, progress=None, **params):
+        """``engine.simulate``, served from the cache when possible."""
+        workload = as_workload(processes)
+        schedule = self.lookup_schedule(algorithm, workload, params)
+        if schedule is None:
+            schedule = simulate(algorithm, workload, progress=progress, **params)
+            self.store_schedule(algorithm, workload, params, schedule)
+        return schedule
+
+    def lookup_schedule(self, algorithm, workload, params):
+        """The cached schedule of ``workload``, bound to it; ``None`` on a miss."""
+        cached = self._get(('schedule',) + self.key(algorithm, workload, params))
+        return _rebind(cached, workload) if cached is not None else None
+
+    def store_schedule(self, algorithm, workload, params, schedule):
+        # Stored without its workload, which the caller may go on to change, and
+        # with its own arrival order, which appends to the workload extend in place
+        stored = _rebind(schedule, None)
+        if stored.order is not None:
+            stored.order = array('q', stored.order)
+        self._put(('schedule',) + self.key(algorithm, workload, params), stored, _schedule_bytes(schedule))
+
+    def lookup_metrics(self, algorithm, workload, params):
+        """Cached metrics, derived from a cached schedule or read from disk; ``None`` on a miss."""
+        key = self.key(algorithm, workload, params)
+        metrics = self._get(('metrics',) + key)
+        if metrics is None:
+            schedule = self._get(('schedule',) + key)
+            if schedule is not None:
+                metrics = _rebind(schedule, workload).metrics()
+            else:
+                metrics = self._load(key)
+            if metrics is None:
+                return None
+            self._put(('metrics',) + key, metrics, METRICS_BYTES)
+        return dict(metrics)
+
+    def store_metrics(self, algorithm, workload, params, metrics):
+        key = self.key(algorithm, workload, params)
+        self._put(('metrics',) + key, dict(metrics), METRICS_BYTES)
+        self._save(key, metrics)
+
+    def metrics(self, algorithm, processes, progress=None, **params):
+        """``simulate(...).metrics()``, served from the cache when possible."""
+        workload = as_workload(processes)
+        metrics = self.lookup_metrics(algorithm, workload, params)
+        if metrics is None:
+            metrics = self.simulate(algorithm, workload, progress=progress, **params).metrics()
+            self.store_metrics(algorithm, workload, params, metrics)
+        return metrics
+
+    def clear(self):
+        """Drop every in-memory entry (files in ``directory`` are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def _put(self, key, value, size):
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[1]
+            self._entries[key] = (value, size)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+
+    def _path(self, key):
+        name = hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+        return os.path.join(self.directory, f"{name}.json")
+
+    def _load(self, key):
+        if not self.directory:
+            return None
+        try:
+            with open(self._path(key)) as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return record['metrics'] if record.get('key') == repr(key) else None
+
+    def _save(self, key, metrics):
+        if not self.directory:
+            return
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, 'w') as f:
+                json.dump({'key': repr(key), 'metrics': metrics}, f)
+            os.replace(tmp, path)
+        except OSError:
+            # A read-only or full cache directory only costs the speedup
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
@@ -0,0 +1,457 @@
+"""Command-line batch runner.
+
+    python -m process_scheduler run --algo sjf,rr --quantum 4 trace.csv
+    python -m process_scheduler sweep --quanta 1-20 --format json trace.pswl
+    tail -f trace.csv | python -m process_scheduler stream --algo srtf --input-format csv -
+    python -m process_scheduler generate 1e7 --arrivals bursty --bursts pareto -o big.pswl
+    python -m process_scheduler serve --port 8080 --cache-dir ~/.cache/process-scheduler
+    python -m process_scheduler run --algo rr --trace traces/ big.pswl && python -m process_scheduler replay traces/*.pstr
+
+Exit codes:
+    0  success
+    1  unexpected error
+    2  bad command line
+    3  unreadable or invalid workload (or trace) file
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import struct
+import sys
+
+from .cache import ScheduleCache
+from .engine import ALIASES, ALGORITHMS, resolve_algorithm, simulate
+from .instrument import format_stats, instrument
+from .metrics import format_comparison, format_summary
+from .multicore import PLACEMENTS, QUEUES, SUPPORTED
+from .online import ADVANCE, RollingMetrics, stream
+from .parallel import _tasks, compare_parallel
+from .synthetic import ARRIVALS, BURSTS, PRIORITIES, generate_workload
+from .trace import TraceError, load_trace, save_trace
+from .tuning import format_sweep, recommend, sweep_quantum, tune_quantum
+from .workload_io import FORMATS, WorkloadError, iter_records, load_workload, save_workload
+
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_USAGE = 2
+EXIT_WORKLOAD = 3
+
+
+def _algorithms(value):
+    if value.strip().lower() == 'all':
+        return list(ALGORITHMS)
+    try:
+        return [resolve_algorithm(name) for name in value.split(',') if name.strip()]
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"{e} (choose from {', '.join(ALIASES)} or all)") from None
+
+
+def _quanta(value):
+    """``4``, ``2,4,8``, ``1-20`` (inclusive range) or ``auto``."""
+    if value.strip().lower() == 'auto':
+        return 'auto'
+    quanta = []
+    try:
+        for part in value.split(','):
+            low, _, high = part.partition('-')
+            quanta.extend(range(int(low), int(high or low) + 1))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid quantum list: {value!r}") from None
+    if not quanta or min(quanta) <= 0:
+        raise argparse.ArgumentTypeError("time quanta must be greater than zero")
+    return quanta
+
+
+def _positive(value):
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+    return number
+
+
+def _cpus(value):
+    try:
+        cpus = int(value)
+    except ValueError:
+        cpus = 0
+    if cpus < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive number of CPUs, got {value!r}")
+    return cpus
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m process_scheduler',
+                                     description="Run CPU scheduling simulations on workload files.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('workloads', nargs='+', metavar='WORKLOAD',
+                        help="workload files (.csv, .jsonl, .ndjson or .pswl)")
+    common.add_argument('--format', choices=('text', 'json', 'csv'), default='text')
+    common.add_argument('-o', '--output', help="write results here instead of stdout")
+    common.add_argument('--workers', type=int, help="process pool size (default: CPU count)")
+
+    run = commands.add_parser('run', parents=[common], help="run algorithms and report metrics")
+    run.add_argument('--algo', type=_algorithms, default=list(ALGORITHMS),
+                     help="comma-separated algorithms or 'all' (default: all)")
+    run.add_argument('--quantum', type=_quanta, default=[2],
+                     help="RR quantum, a list such as 2,4,8, or 'auto' (default: 2)")
+    run.add_argument('--priority-order', choices=('lower', 'higher'), default='lower',
+                     help="whether a lower or higher priority value runs first (default: lower)")
+    run.add_argument('--levels', type=_levels, default=(2, 4, 8),
+                     help="MLFQ quantum of each level, highest first (default: 2,4,8)")
+    run.add_argument('--boost', type=int, default=100,
+                     help="MLFQ priority boost interval, 0 for none (default: 100)")
+    run.add_argument('--cpus', type=_cpus, default=1, help="number of CPUs to simulate (default: 1)")
+    run.add_argument('--queues', choices=QUEUES, default='global',
+                     help="one ready queue shared by all CPUs, or one per CPU (default: global)")
+    run.add_argument('--placement', choices=PLACEMENTS, default='least-loaded',
+                     help="how per-CPU queues receive arrivals (default: least-loaded)")
+    run.add_argument('--steal', action='store_true', help="let idle CPUs take work from the longest per-CPU queue")
+    run.add_argument('--cache-dir', metavar='DIR',
+                     help="reuse metrics stored here by earlier runs on the same workloads, and add new ones")
+    run.add_argument('--stats', action='store_true',
+                     help="report run statistics (dispatches, idle time, phase timings); runs in-process, uncached")
+    run.add_argument('--profile', metavar='DIR',
+                     help="with --stats, also write a cProfile dump of every run to DIR")
+    run.add_argument('--trace', metavar='DIR',
+                     help="save every run's schedule to DIR as a .pstr trace for replay; runs in-process, uncached")
+
+    sweep = commands.add_parser('sweep', parents=[common], help="sweep RR time quanta")
+    sweep.add_argument('--quanta', type=_quanta, default=None,
+                       help="quanta to try, e.g. 1-20 or 2,4,8 (default: 1 up to the longest burst)")
+    sweep.add_argument('--objective', choices=('WT', 'TAT', 'RT'), default='WT')
+
+    online = commands.add_parser('stream', help="schedule a trace online, reporting rolling metrics")
+    online.add_argument('source', metavar='WORKLOAD', help="workload file in arrival order, or - for stdin")
+    online.add_argument('--algo', type=_online_algorithm, default="FCFS",
+                        help=f"one of {', '.join(k for k, v in ALIASES.items() if v in ADVANCE)} (default: fcfs)")
+    online.add_argument('--quantum', type=_quantum, default=2, help="RR time quantum (default: 2)")
+    online.add_argument('--priority-order', choices=('lower', 'higher'), default='lower')
+    online.add_argument('--input-format', choices=[ext.lstrip('.') for ext in FORMATS],
+                        help="format of the source (default: from its extension)")
+    online.add_argument('--window', type=_positive, default=1000,
+                        help="average over this many latest completions (default: 1000)")
+    online.add_argument('--span', type=_positive, help="and only over those this recent, in time units")
+    online.add_argument('--every', type=_positive, default=10000,
+                        help="report after this many completions (default: 10000)")
+    online.add_argument('--format', choices=('text', 'json'), default='text',
+                        help="text lines or JSON Lines")
+    online.add_argument('-o', '--output', help="write reports here instead of stdout")
+
+    generate = commands.add_parser('generate', help="write a seeded synthetic workload file")
+    generate.add_argument('count', type=_count, help="number of processes, e.g. 1000000 or 1e6")
+    generate.add_argument('-o', '--output', type=_workload_path, required=True,
+                          help="workload file to write (.csv, .jsonl, .ndjson or .pswl)")
+    generate.add_argument('--seed', type=int, default=0, help="random seed (default: 0)")
+    generate.add_argument('--arrivals', choices=ARRIVALS, default='poisson')
+    generate.add_argument('--bursts', choices=BURSTS, default='exponential')
+    generate.add_argument('--priorities', choices=PRIORITIES, default='uniform')
+    generate.add_argument('--mean-burst', type=float, default=10, help="mean burst time (default: 10)")
+    generate.add_argument('--load', type=float, default=0.9,
+                          help="fraction of the CPUs' time the arrivals keep busy (default: 0.9)")
+    generate.add_argument('--cpus', type=_cpus, default=1, help="CPUs the load is spread over (default: 1)")
+    generate.add_argument('--rate', type=float, help="arrivals per time unit, instead of --load")
+    generate.add_argument('--batch', type=float, default=8, help="bursty: mean batch size (default: 8)")
+    generate.add_argument('--amplitude', type=float, default=0.8,
+                          help="diurnal: relative swing of the arrival rate, 0-1 (default: 0.8)")
+    generate.add_argument('--period', type=float,
+                          help="diurnal: length of one cycle (default: a quarter of the trace)")
+    generate.add_argument('--alpha', type=float, default=1.5, help="pareto: shape, > 1 (default: 1.5)")
+    generate.add_argument('--short-fraction', type=float, default=0.8,
+                          help="bimodal: fraction of short jobs (default: 0.8)")
+    generate.add_argument('--spread', type=float, default=20,
+                          help="bimodal: how many times longer long jobs are (default: 20)")
+    generate.add_argument('--levels', type=int, default=10, help="number of priority values (default: 10)")
+
+    replay = commands.add_parser('replay', help="report metrics of saved schedule traces without re-running them")
+    replay.add_argument('traces', nargs='+', metavar='TRACE', help=".pstr trace files")
+    replay.add_argument('--format', choices=('text', 'json', 'csv'), default='text')
+    replay.add_argument('-o', '--output', help="write results here instead of stdout")
+
+    service = commands.add_parser('serve', help="serve simulations over a local HTTP/JSON API")
+    service.add_argument('--host', default='127.0.0.1',
+                         help="address to bind; the API has no authentication (default: 127.0.0.1)")
+    service.add_argument('--port', type=int, default=8080, help="port to listen on (default: 8080)")
+    service.add_argument('--workers', type=int, help="process pool size (default: CPU count)")
+    service.add_argument('--queue-size', type=int,
+                         help="runs allowed to wait before requests get 503 (default: 256)")
+    service.add_argument('--batch-size', type=int,
+                         help="most small runs sent to a worker at once (default: 32)")
+    service.add_argument('--cache-dir', metavar='DIR', help="keep the metrics cache here across restarts")
+    return parser
+
+
+def _count(value):
+    try:
+        count = int(float(value)) if 'e' in value.lower() else int(value)
+    except ValueError:
+        count = -1
+    if count < 0:
+        raise argparse.ArgumentTypeError(f"expected a number of processes, got {value!r}")
+    return count
+
+
+def _workload_path(value):
+    ext = os.path.splitext(value)[1].lower()
+    if ext not in FORMATS:
+        raise argparse.ArgumentTypeError(f"unknown workload format {ext!r}; expected one of {', '.join(FORMATS)}")
+    return value
+
+
+def _online_algorithm(value):
+    algorithms = _algorithms(value)
+    if len(algorithms) != 1:
+        raise argparse.ArgumentTypeError("expected a single algorithm")
+    if algorithms[0] not in ADVANCE:
+        raise argparse.ArgumentTypeError(f"{algorithms[0]} cannot be run online")
+    return algorithms[0]
+
+
+def _levels(value):
+    """MLFQ level quanta, highest level first: ``2,4,8``."""
+    try:
+        levels = tuple(int(part) for part in value.split(','))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid level quanta: {value!r}") from None
+    if min(levels) <= 0:
+        raise argparse.ArgumentTypeError("level quanta must be greater than zero")
+    return levels
+
+
+def _quantum(value):
+    quanta = _quanta(value)
+    if quanta == 'auto' or len(quanta) != 1:
+        raise argparse.ArgumentTypeError("expected a single time quantum")
+    return quanta[0]
+
+
+def _stream_line(args, metrics, final=False):
+    if args.format == 'json':
+        return json.dumps(dict(metrics, final=final)) + "\n"
+    if final:
+        return (f"completed {metrics['count']} by {metrics['clock']}: average TAT {metrics['TAT_all']:.2f}, "
+                f"WT {metrics['WT_all']:.2f}, RT {metrics['RT_all']:.2f}\n")
+    return (f"{metrics['count']:>12} t={metrics['clock']:<12} TAT {metrics['TAT']:>10.2f}  "
+            f"WT {metrics['WT']:>10.2f}  RT {metrics['RT']:>10.2f}  (last {metrics['window']})\n")
+
+
+def _stream(args):
+    """Feed ``args.source`` through an online scheduler, writing a report line every ``args.every``."""
+    fmt = f".{args.input_format}" if args.input_format else None
+    rolling = RollingMetrics(args.window, args.span)
+    try:
+        out = open(args.output, 'w') if args.output else sys.stdout
+    except OSError as e:
+        print(f"error: {args.output}: {e}", file=sys.stderr)
+        return EXIT_ERROR
+    try:
+        completions = stream(args.algo, iter_records(args.source, fmt), quantum=args.quantum,
+                             lower_is_higher=args.priority_order == 'lower')
+        for p in completions:
+            rolling.add(p)
+            if rolling.count % args.every == 0:
+                out.write(_stream_line(args, rolling.metrics()))
+                out.flush()
+        if not rolling.count:
+            raise WorkloadError(f"{args.source} contains no processes.")
+        out.write(_stream_line(args, rolling.metrics(), final=True))
+    except (OSError, ValueError) as e:
+        # Unreadable input, a bad record or one out of arrival order
+        print(f"error: {args.source}: {e}", file=sys.stderr)
+        return EXIT_WORKLOAD
+    except Exception as e:
+        print(f"error: {args.source}: {e}", file=sys.stderr)
+        return EXIT_ERROR
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return EXIT_OK
+
+
+def _generate(args):
+    try:
+        workload = generate_workload(args.count, seed=args.seed, arrivals=args.arrivals, bursts=args.bursts,
+                                     priorities=args.priorities, mean_burst=args.mean_burst, load=args.load,
+                                     cpus=args.cpus, rate=args.rate, batch=args.batch, amplitude=args.amplitude,
+                                     period=args.period, alpha=args.alpha, short_fraction=args.short_fraction,
+                                     spread=args.spread, levels=args.levels)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return EXIT_USAGE
+    try:
+        save_workload(workload, args.output)
+    except OSError as e:
+        print(f"error: {args.output}: {e}", file=sys.stderr)
+        return EXIT_ERROR
+    return EXIT_OK
+
+
+def _run_in_process(args, path, workload, algorithms, params):
+    """``_run`` one algorithm at a time in this process, adding stats, profiles and traces as asked."""
+    quanta = [tune_quantum(workload, max_workers=args.workers)] if args.quantum == 'auto' else args.quantum
+    for directory in (args.profile, args.trace):
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    stem = os.path.splitext(os.path.basename(path))[0]
+    records = []
+    for label, name, task_params in _tasks(algorithms, quanta, params):
+        slug = "".join(c if c.isalnum() else '_' for c in label.lower())
+        if args.stats or args.profile:
+            profile = os.path.join(args.profile, f"{stem}-{slug}.prof") if args.profile else None
+            schedule, stats = instrument(name, workload, profile=profile, **task_params)
+            records.append({'algorithm': label, 'metrics': schedule.metrics(),
+                            'stats': {'counters': stats.counters, 'phases': stats.phases}})
+        else:
+            schedule = simulate(name, workload, **task_params)
+            records.append({'algorithm': label, 'metrics': schedule.metrics()})
+        if args.trace:
+            save_trace(schedule, os.path.join(args.trace, f"{stem}-{slug}.pstr"), metadata={'workload': path, 'label': label})
+    best = min(records, key=lambda record: record['metrics']['WT'])
+    for record in records:
+        record['best'] = record is best
+    return records
+
+
+def _run(args, workload, path):
+    cache = ScheduleCache(directory=args.cache_dir) if args.cache_dir else None
+    algorithms = args.algo
+    if args.cpus > 1:
+        algorithms = [name for name in algorithms if name in SUPPORTED]
+        for name in sorted(set(args.algo) - set(algorithms)):
+            print(f"warning: {name} has no multi-CPU model; skipped", file=sys.stderr)
+        if not algorithms:
+            raise ValueError("none of the selected algorithms can run on more than one CPU")
+    params = dict(lower_is_higher=args.priority_order == 'lower', level_quanta=args.levels,
+                  boost_interval=args.boost, cpus=args.cpus, queues=args.queues, placement=args.placement,
+                  steal=args.steal)
+    if args.stats or args.profile or args.trace:
+        return _run_in_process(args, path, workload, algorithms, params)
+    results, best = compare_parallel(workload, algorithms=algorithms, quanta=args.quantum,
+                                     max_workers=args.workers, cache=cache, **params)
+    return [{'algorithm': label, 'best': label == best, 'metrics': metrics} for label, metrics in results]
+
+
+def _sweep(args, workload, path):
+    quanta = None if args.quanta == 'auto' else args.quanta
+    points = sweep_quantum(workload, quanta, max_workers=args.workers)
+    best = recommend(points, args.objective)
+    return [dict(point, best=point is best) for point in points]
+
+
+def _render_text(args, path, records):
+    if args.command == 'sweep':
+        best = next(record for record in records if record['best'])
+        body = format_sweep(records, best, args.objective)
+    elif len(records) == 1:
+        body = f"{records[0]['algorithm']}\n{format_summary(records[0]['metrics'])}\n"
+    else:
+        best = next(record['algorithm'] for record in records if record['best'])
+        body = format_comparison([(r['algorithm'], r['metrics']) for r in records], best)
+    for record in records:
+        if 'stats' in record:
+            stats = record['stats']
+            body += "\n" + format_stats(f"{record['algorithm']} run statistics", stats['counters'], stats['phases'])
+    return f"== {path} ==\n{body}"
+
+
+def _flatten(path, record):
+    row = {'workload': path}
+    row.update((k, v) for k, v in record.items() if k not in ('metrics', 'stats'))
+    row.update(record.get('metrics', {}))
+    if 'stats' in record:
+        row.update(record['stats']['counters'])
+        row.update((f"{name}_s", seconds) for name, seconds in record['stats']['phases'].items())
+    return row
+
+
+def render(args, outputs):
+    """Format ``[(path, records)]`` as text, JSON or CSV."""
+    if args.format == 'json':
+        return json.dumps([{'workload': path, 'results': records} for path, records in outputs], indent=2) + "\n"
+    if args.format == 'csv':
+        rows = [_flatten(path, record) for path, records in outputs for record in records]
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=list(rows[0]) if rows else [], lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
+        return buffer.getvalue()
+    return "\n".join(_render_text(args, path, records) for path, records in outputs)
+
+
+def _write(args, text):
+    try:
+        if args.output:
+            with open(args.output, 'w', newline='') as f:
+                f.write(text)
+        else:
+            sys.stdout.write(text)
+    except OSError as e:
+        print(f"error: {args.output}: {e}", file=sys.stderr)
+        return EXIT_ERROR
+    return EXIT_OK
+
+
+def _replay(args):
+    """Metrics of each trace in ``args.traces``, from the saved schedule."""
+    outputs = []
+    for path in args.traces:
+        try:
+            trace = load_trace(path)
+        except (OSError, TraceError) as e:
+            print(f"error: {path}: {e}", file=sys.stderr)
+            return EXIT_WORKLOAD
+        label = trace.metadata.get('label', trace.algorithm)
+        outputs.append((path, [{'algorithm': label, 'metrics': trace.schedule().metrics()}]))
+    return _write(args, render(args, outputs))
+
+
+def main(argv=None):
+    parser = build_parser()
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as e:
+        return e.code
+
+    if args.command == 'stream':
+        return _stream(args)
+    if args.command == 'generate':
+        return _generate(args)
+    if args.command == 'replay':
+        return _replay(args)
+    if args.command == 'serve':
+        # Imported here so other commands do not pay for loading asyncio
+        from .service import serve
+        cache = ScheduleCache(directory=args.cache_dir) if args.cache_dir else None
+        sizes = {'queue_size': args.queue_size, 'batch_size': args.batch_size}
+        try:
+            serve(args.host, args.port, workers=args.workers, cache=cache,
+                  **{name: size for name, size in sizes.items() if size is not None})
+        except (OSError, ValueError) as e:
+            print(f"error: {e}", file=sys.stderr)
+            return EXIT_ERROR
+        return EXIT_OK
+    command = _run if args.command == 'run' else _sweep
+    outputs = []
+    for path in args.workloads:
+        try:
+            workload = load_workload(path)
+            if not len(workload):
+                raise WorkloadError(f"{path} contains no processes.")
+        except (OSError, WorkloadError, OverflowError, struct.error) as e:
+            # The last two only if a loader misses a malformed file
+            print(f"error: {path}: {e}", file=sys.stderr)
+            return EXIT_WORKLOAD
+        try:
+            outputs.append((path, command(args, workload, path)))
+        except Exception as e:
+            print(f"error: {path}: {e}", file=sys.stderr)
+            return EXIT_ERROR
+
+    return _write(args, render(args, outputs))
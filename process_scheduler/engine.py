@@ -0,0 +1,691 @@
+"""Headless scheduling engine.
+
+Every algorithm takes a workload (a ``Workload`` or a sequence of ``Process``)
+plus its parameters and returns a ``Schedule``. Nothing here touches Tk, so
+the same code drives the GUI, batch jobs and services on machines without a
+display.
+
+Runs never mutate the workload: per-run state (remaining, start, completion)
+lives in fresh int64 arrays indexed like the workload columns.
+
+Every runner also takes an optional ``progress`` callback, called as
+``progress(done, total)`` every ``PROGRESS_STEP`` scheduling steps. It may
+raise (e.g. ``jobs.Cancelled``) to abandon the run.
+"""
+
+import copy
+import heapq
+import inspect
+from array import array
+from collections import deque
+from itertools import islice
+
+from .metrics import schedule_metrics
+from .workload import as_workload
+
+PROGRESS_STEP = 16384
+
+
+class Process:
+    __slots__ = ('pid', 'arrival_time', 'burst_time', 'priority',
+                 'remaining_time', 'start_time', 'completion_time')
+
+    def __init__(self, pid, arrival_time, burst_time, priority=0):
+        self.pid = pid
+        self.arrival_time = arrival_time
+        self.burst_time = burst_time
+        self.priority = priority
+        self.remaining_time = burst_time
+        self.start_time = -1
+        self.completion_time = 0
+
+    def copy(self):
+        """Fresh, unscheduled copy of this process."""
+        return Process(self.pid, self.arrival_time, self.burst_time, self.priority)
+
+
+class Timeline:
+    """Compact log of CPU slices as parallel ``(index, start, end)`` arrays.
+
+    ``index`` is a workload index. Back-to-back slices of the same process
+    are coalesced as they are appended, so the log grows with the number of
+    context switches rather than the number of quanta, at 24 bytes per entry.
+    """
+
+    __slots__ = ('index', 'start', 'end')
+
+    def __init__(self):
+        self.index = array('q')
+        self.start = array('q')
+        self.end = array('q')
+
+    def append(self, index, start, end):
+        if self.index and self.index[-1] == index and self.end[-1] == start:
+            self.end[-1] = end
+            return
+        self.index.append(index)
+        self.start.append(start)
+        self.end.append(end)
+
+    def __len__(self):
+        return len(self.index)
+
+    def __iter__(self):
+        return zip(self.index, self.start, self.end)
+
+    def copy(self):
+        timeline = Timeline()
+        timeline.index = array('q', self.index)
+        timeline.start = array('q', self.start)
+        timeline.end = array('q', self.end)
+        return timeline
+
+    def mark(self):
+        """``(length, last end)``: enough for ``truncate`` to rewind to this point."""
+        return len(self.index), self.end[-1] if self.end else 0
+
+    def truncate(self, length, last_end):
+        """Rewind to a ``mark()``, undoing later appends and coalescing."""
+        for column in (self.index, self.start, self.end):
+            del column[length:]
+        if length:
+            self.end[-1] = last_end
+
+    def context_switches(self):
+        """Number of dispatches that change the running process."""
+        index = self.index
+        return sum(1 for k in range(1, len(index)) if index[k] != index[k - 1])
+
+
+class Schedule:
+    """Result of one simulation.
+
+    ``start`` and ``completion`` are indexed like the workload columns;
+    ``order`` lists workload indices in display order (``None`` keeps workload
+    order). ``timeline`` is the slice log for preemptive algorithms;
+    non-preemptive ones run each process in a single slice and leave it as
+    ``None``.
+    """
+
+    def __init__(self, algorithm, workload, start, completion, order=None, params=None, timeline=None):
+        self.algorithm = algorithm
+        self.workload = workload
+        self.start = start
+        self.completion = completion
+        self.order = order
+        self.params = params or {}
+        self.timeline = timeline
+
+    def __len__(self):
+        return len(self.workload)
+
+    def indices(self):
+        return self.order if self.order is not None else range(len(self.workload))
+
+    def rows(self):
+        """Yield ``(pid, arrival, burst, priority, start, completion)`` in display order."""
+        w = self.workload
+        for i in self.indices():
+            yield w.pid[i], w.arrival[i], w.burst[i], w.priority[i], self.start[i], self.completion[i]
+
+    @property
+    def processes(self):
+        """The schedule as ``Process`` objects, for callers that want them."""
+        processes = []
+        for pid, arrival, burst, priority, start, completion in self.rows():
+            p = Process(pid, arrival, burst, priority)
+            p.remaining_time = 0
+            p.start_time = start
+            p.completion_time = completion
+            processes.append(p)
+        return processes
+
+    def copy(self):
+        """A copy with its own columns, unaffected by later changes to these."""
+        schedule = copy.copy(self)
+        schedule.workload = self.workload.copy()
+        schedule.start = array('q', self.start)
+        schedule.completion = array('q', self.completion)
+        schedule.order = array('q', self.order) if self.order is not None else None
+        schedule.params = dict(self.params)
+        schedule.timeline = self.timeline.copy() if self.timeline is not None else None
+        return schedule
+
+    def metrics(self):
+        return schedule_metrics(self)
+
+    def slices(self):
+        """Yield ``(pid, start, end)`` for every CPU slice in time order."""
+        pid = self.workload.pid
+        if self.timeline is not None:
+            for index, start, end in self.timeline:
+                yield pid[index], start, end
+            return
+        for i in sorted(range(len(pid)), key=self.start.__getitem__):
+            yield pid[i], self.start[i], self.completion[i]
+
+
+def calculate_metrics(processes):
+    if isinstance(processes, Schedule):
+        return processes.metrics()
+    n = len(processes)
+    tat_total = wt_total = rt_total = 0
+
+    for p in processes:
+        turnaround = p.completion_time - p.arrival_time
+        waiting = turnaround - p.burst_time
+        response = p.start_time - p.arrival_time
+
+        tat_total += turnaround
+        wt_total += waiting
+        rt_total += response
+
+    return {
+        'TAT': tat_total / n,
+        'WT': wt_total / n,
+        'RT': rt_total / n
+    }
+
+
+def _prepare(processes):
+    """Workload plus fresh ``start`` / ``completion`` columns for one run."""
+    workload = as_workload(processes)
+    n = len(workload)
+    if not n:
+        raise ValueError("No processes to schedule!")
+    return workload, array('q', [-1]) * n, array('q', bytes(8 * n))
+
+
+def _checkpoint(progress, checkpoints=None, step=0):
+    """First step after ``step`` at which to report progress or save a checkpoint.
+
+    Never (``-1``) when there is nothing to report to.
+    """
+    if progress is None and checkpoints is None:
+        return -1
+    return (step // PROGRESS_STEP + 1) * PROGRESS_STEP
+
+
+def _run_fcfs(workload, start, completion, progress=None, checkpoints=None, state=None):
+    order = workload.arrival_order()
+    arrival = workload.arrival
+    burst = workload.burst
+    n = len(order)
+    first, time = state or (0, 0)
+    # A resumed run records the checkpoint it resumed from again, like the other runners
+    checkpoint = _checkpoint(progress, checkpoints, first - 1 if state else 0)
+
+    for step, i in enumerate(islice(order, first, None), first):
+        if step == checkpoint:
+            checkpoint += PROGRESS_STEP
+            if progress is not None:
+                progress(step, n)
+            if checkpoints is not None:
+                checkpoints.append((time, (step, time)))
+        if time < arrival[i]:
+            time = arrival[i]
+        start[i] = time
+        time += burst[i]
+        completion[i] = time
+    if checkpoints is not None:
+        checkpoints.append((time, (n, time)))
+
+
+def run_fcfs(processes, progress=None):
+    workload, start, completion = _prepare(processes)
+    _run_fcfs(workload, start, completion, progress)
+    return Schedule("FCFS", workload, start, completion, workload.arrival_order())
+
+
+def _run_nonpreemptive(workload, start, completion, key, progress=None, checkpoints=None, state=None):
+    """Dispatch ready processes in ``key`` order until all complete.
+
+    Arrivals are admitted through an arrival-sorted cursor into a heap, and an
+    idle CPU jumps straight to the next arrival. Heap entries carry the
+    admission epoch and workload index after ``key(i)`` so ties resolve
+    exactly as the original stable-sorted ready list did: earlier-admitted
+    first, then workload order.
+    """
+    order = workload.arrival_order()
+    arrival = workload.arrival
+    burst = workload.burst
+    n = len(order)
+    time, cursor, epoch, ready_queue = state or (0, 0, 0, ())
+    ready_queue = list(ready_queue)
+    checkpoint = _checkpoint(progress, checkpoints, epoch)
+
+    while cursor < n or ready_queue:
+        epoch += 1
+        if epoch == checkpoint:
+            checkpoint += PROGRESS_STEP
+            if progress is not None:
+                progress(cursor - len(ready_queue), n)
+            if checkpoints is not None:
+                checkpoints.append((time, (time, cursor, epoch - 1, tuple(ready_queue))))
+        while cursor < n and arrival[order[cursor]] <= time:
+            i = order[cursor]
+            heapq.heappush(ready_queue, (key(i), epoch, i))
+            cursor += 1
+
+        if ready_queue:
+            i = heapq.heappop(ready_queue)[2]
+            start[i] = time
+            time += burst[i]
+            completion[i] = time
+        else:
+            time = arrival[order[cursor]]
+    if checkpoints is not None:
+        checkpoints.append((time, (time, n, epoch, ())))
+
+
+def run_sjf(processes, progress=None):
+    workload, start, completion = _prepare(processes)
+    _run_nonpreemptive(workload, start, completion, workload.burst.__getitem__, progress)
+    return Schedule("SJF", workload, start, completion)
+
+
+def _priority_key(workload, lower_is_higher, with_arrival):
+    priority = workload.priority
+    arrival = workload.arrival
+    sign = 1 if lower_is_higher else -1
+    if with_arrival:
+        return lambda i: (sign * priority[i], arrival[i])
+    return lambda i: sign * priority[i]
+
+
+def run_priority(processes, lower_is_higher=True, progress=None):
+    """Non-preemptive priority; ``lower_is_higher`` picks the direction."""
+    workload, start, completion = _prepare(processes)
+    _run_nonpreemptive(workload, start, completion, _priority_key(workload, lower_is_higher, True), progress)
+    return Schedule("Priority", workload, start, completion, params={'lower_is_higher': lower_is_higher})
+
+
+def _restore(workload, start, remaining, cursor, saved, timeline, timeline_state):
+    """Rewind per-process state to a checkpoint before resuming a preemptive run.
+
+    Processes not yet admitted at the checkpoint get their full burst back;
+    ``saved`` holds index, remaining and start arrays for the admitted ones
+    still in flight. Everything else had finished and is untouched.
+    """
+    order = workload.arrival_order()
+    burst = workload.burst
+    for k in range(cursor, len(order)):
+        i = order[k]
+        remaining[i] = burst[i]
+        start[i] = -1
+    for i, left, started in zip(*saved):
+        remaining[i] = left
+        start[i] = started
+    timeline.truncate(*timeline_state)
+
+
+# Checkpoints are built outside the loops: a closure over the loop's locals
+# would turn them into cell variables and slow every iteration.
+
+def _in_flight(indices, remaining, start):
+    indices = array('q', indices)
+    return (indices, array('q', map(remaining.__getitem__, indices)),
+            array('q', map(start.__getitem__, indices)))
+
+
+def _rr_snapshot(step, time, i, completed, queue, remaining, start, timeline):
+    saved = _in_flight(queue, remaining, start)
+    return (time, (step, time, i, completed, saved[0], saved, timeline.mark()))
+
+
+def _preemptive_snapshot(step, time, cursor, current, slice_start, completed, ready_queue,
+                         remaining, start, timeline):
+    in_flight = [entry[2] for entry in ready_queue] + ([current] if current != -1 else [])
+    return (time, (step, time, cursor, current, slice_start, completed, tuple(ready_queue),
+                   _in_flight(in_flight, remaining, start), timeline.mark()))
+
+
+def _run_rr(workload, start, completion, remaining, quantum, timeline,
+            progress=None, checkpoints=None, state=None):
+    order = workload.arrival_order()
+    arrival = workload.arrival
+    n = len(order)
+    if state is None:
+        queue = deque([order[0]])
+        i = 1
+        time = arrival[order[0]]
+        completed = step = 0
+    else:
+        step, time, i, completed, queue, saved, timeline_state = state
+        queue = deque(queue)
+        _restore(workload, start, remaining, i, saved, timeline, timeline_state)
+    checkpoint = _checkpoint(progress, checkpoints, step)
+
+    while completed < n:
+        step += 1
+        if step == checkpoint:
+            checkpoint += PROGRESS_STEP
+            if progress is not None:
+                progress(completed, n)
+            if checkpoints is not None:
+                checkpoints.append(_rr_snapshot(step - 1, time, i, completed, queue, remaining, start, timeline))
+        if queue:
+            index = queue.popleft()
+            if start[index] == -1:
+                start[index] = time
+            slice_start = time
+            if remaining[index] <= quantum:
+                time += remaining[index]
+                remaining[index] = 0
+                completion[index] = time
+                completed += 1
+            else:
+                time += quantum
+                remaining[index] -= quantum
+            timeline.append(index, slice_start, time)
+
+            while i < n and arrival[order[i]] <= time:
+                queue.append(order[i])
+                i += 1
+
+            if remaining[index] > 0:
+                queue.append(index)
+        else:
+            queue.append(order[i])
+            time = arrival[order[i]]
+            i += 1
+    if checkpoints is not None:
+        checkpoints.append(_rr_snapshot(step, time, i, completed, queue, remaining, start, timeline))
+
+
+def run_rr(processes, quantum=2, progress=None):
+    """Round Robin over a deque of workload indices, logging every slice."""
+    if quantum <= 0:
+        raise ValueError("Time quantum must be greater than zero.")
+    workload, start, completion = _prepare(processes)
+    timeline = Timeline()
+    _run_rr(workload, start, completion, array('q', workload.burst), quantum, timeline, progress)
+    return Schedule("Round Robin", workload, start, completion, workload.arrival_order(),
+                    {'quantum': quantum}, timeline)
+
+
+def _run_preemptive(workload, start, completion, remaining, key, timeline,
+                    progress=None, checkpoints=None, state=None):
+    """Preemptive dispatch in ``key`` order on a discrete-event core.
+
+    The clock only moves between events: the next arrival (from an
+    arrival-sorted cursor) or the running process's completion, whichever
+    comes first. Ready processes wait in a heap keyed by ``(key(i), arrival,
+    index)``; an arrival preempts the running process only when its key is
+    strictly better, so each event costs O(log n).
+    """
+    order = workload.arrival_order()
+    arrival = workload.arrival
+    n = len(order)
+    if state is None:
+        ready_queue = []
+        time = cursor = completed = step = slice_start = 0
+        current = -1
+    else:
+        step, time, cursor, current, slice_start, completed, ready_queue, saved, timeline_state = state
+        ready_queue = list(ready_queue)
+        _restore(workload, start, remaining, cursor, saved, timeline, timeline_state)
+    checkpoint = _checkpoint(progress, checkpoints, step)
+
+    def admit():
+        nonlocal cursor
+        while cursor < n and arrival[order[cursor]] <= time:
+            i = order[cursor]
+            heapq.heappush(ready_queue, (key(i), arrival[i], i))
+            cursor += 1
+
+    while cursor < n or ready_queue or current != -1:
+        step += 1
+        if step == checkpoint:
+            checkpoint += PROGRESS_STEP
+            if progress is not None:
+                progress(completed, n)
+            if checkpoints is not None:
+                checkpoints.append(_preemptive_snapshot(step - 1, time, cursor, current, slice_start, completed,
+                                                        ready_queue, remaining, start, timeline))
+        if current == -1:
+            if not ready_queue:
+                time = max(time, arrival[order[cursor]])
+            admit()
+            current = heapq.heappop(ready_queue)[2]
+            if start[current] == -1:
+                start[current] = time
+            slice_start = time
+
+        finish = time + remaining[current]
+        if cursor == n or finish <= arrival[order[cursor]]:
+            time = finish
+            remaining[current] = 0
+            completion[current] = time
+            timeline.append(current, slice_start, time)
+            current = -1
+            completed += 1
+            continue
+
+        next_arrival = arrival[order[cursor]]
+        remaining[current] -= next_arrival - time
+        time = next_arrival
+        admit()
+        if ready_queue[0][0] < key(current):
+            timeline.append(current, slice_start, time)
+            heapq.heappush(ready_queue, (key(current), arrival[current], current))
+            current = heapq.heappop(ready_queue)[2]
+            if start[current] == -1:
+                start[current] = time
+            slice_start = time
+    if checkpoints is not None:
+        checkpoints.append(_preemptive_snapshot(step, time, cursor, current, slice_start, completed,
+                                                ready_queue, remaining, start, timeline))
+
+
+def run_srtf(processes, progress=None):
+    """Shortest Remaining Time First (preemptive SJF)."""
+    workload, start, completion = _prepare(processes)
+    remaining = array('q', workload.burst)
+    timeline = Timeline()
+    _run_preemptive(workload, start, completion, remaining, remaining.__getitem__, timeline, progress)
+    return Schedule("SRTF", workload, start, completion, timeline=timeline)
+
+
+def run_preemptive_priority(processes, lower_is_higher=True, progress=None):
+    workload, start, completion = _prepare(processes)
+    timeline = Timeline()
+    _run_preemptive(workload, start, completion, array('q', workload.burst),
+                    _priority_key(workload, lower_is_higher, False), timeline, progress)
+    return Schedule("Preemptive Priority", workload, start, completion,
+                    params={'lower_is_higher': lower_is_higher}, timeline=timeline)
+
+
+def _run_mlfq(workload, start, completion, remaining, level_quanta, boost_interval, timeline, progress=None):
+    """Multi-level feedback queue on one deque per level.
+
+    A bitmask of non-empty levels finds the highest ready level with one bit
+    trick, so a dispatch is O(1) whatever the number of levels.
+    """
+    order = workload.arrival_order()
+    arrival = workload.arrival
+    n = len(order)
+    bottom = len(level_quanta) - 1
+    queues = [deque() for _ in level_quanta]
+    ready = 0  # bit k set <=> queues[k] is non-empty
+    used = array('q', bytes(8 * len(remaining)))  # time run at the current level
+    next_boost = boost_interval or -1
+    time = cursor = completed = step = 0
+    checkpoint = _checkpoint(progress)
+
+    while completed < n:
+        step += 1
+        if step == checkpoint:
+            checkpoint += PROGRESS_STEP
+            progress(completed, n)
+        while cursor < n and arrival[order[cursor]] <= time:
+            queues[0].append(order[cursor])
+            ready |= 1
+            cursor += 1
+        if 0 < next_boost <= time:
+            # Everything waiting goes back to the top, in priority order
+            top = queues[0]
+            for k in range(1, bottom + 1):
+                top.extend(queues[k])
+                queues[k].clear()
+            for i in top:
+                used[i] = 0
+            ready = 1 if top else 0
+            next_boost = (time // boost_interval + 1) * boost_interval
+        if not ready:
+            time = arrival[order[cursor]]
+            continue
+
+        k = (ready & -ready).bit_length() - 1
+        queue = queues[k]
+        i = queue.popleft()
+        if not queue:
+            ready &= ~(1 << k)
+        if start[i] == -1:
+            start[i] = time
+        end = time + min(level_quanta[k] - used[i], remaining[i])
+        # A new arrival enters the top level and preempts anything below it
+        if k and cursor < n and arrival[order[cursor]] < end:
+            end = arrival[order[cursor]]
+        timeline.append(i, time, end)
+        remaining[i] -= end - time
+        used[i] += end - time
+        time = end
+        if not remaining[i]:
+            completion[i] = time
+            completed += 1
+            continue
+
+        # Arrivals during the slice queue ahead of the process it preempted
+        while cursor < n and arrival[order[cursor]] <= time:
+            queues[0].append(order[cursor])
+            ready |= 1
+            cursor += 1
+        if used[i] == level_quanta[k]:
+            used[i] = 0
+            if k < bottom:
+                k += 1
+        queues[k].append(i)
+        ready |= 1 << k
+
+
+def run_mlfq(processes, level_quanta=(2, 4, 8), boost_interval=100, progress=None):
+    """Multi-Level Feedback Queue.
+
+    New processes enter level 0. The highest non-empty level runs Round Robin
+    with ``level_quanta[level]``. Using up a level's quantum moves a process
+    one level down, and the bottom level stays Round Robin. An arrival
+    preempts a process running below level 0; the preempted process keeps
+    the time it has used at its level. Every ``boost_interval`` time units
+    (``None`` or 0 to disable) every waiting process returns to level 0, at
+    the first dispatch on or after the boost time.
+    """
+    level_quanta = tuple(level_quanta)
+    if not level_quanta or min(level_quanta) <= 0:
+        raise ValueError("MLFQ needs at least one level, and every quantum must be greater than zero.")
+    if boost_interval is not None and boost_interval < 0:
+        raise ValueError("Boost interval must be non-negative.")
+    workload, start, completion = _prepare(processes)
+    timeline = Timeline()
+    _run_mlfq(workload, start, completion, array('q', workload.burst), level_quanta, boost_interval,
+              timeline, progress)
+    return Schedule("MLFQ", workload, start, completion, workload.arrival_order(),
+                    {'level_quanta': level_quanta, 'boost_interval': boost_interval}, timeline)
+
+
+# Display name -> (runner, names of the parameters it accepts)
+ALGORITHMS = {
+    "FCFS": (run_fcfs, ()),
+    "SJF": (run_sjf, ()),
+    "Priority": (run_priority, ('lower_is_higher',)),
+    "Round Robin": (run_rr, ('quantum',)),
+    "SRTF": (run_srtf, ()),
+    "Preemptive Priority": (run_preemptive_priority, ('lower_is_higher',)),
+    "MLFQ": (run_mlfq, ('level_quanta', 'boost_interval')),
+}
+
+# Extra parameters every algorithm accepts when run on more than one CPU
+MULTICORE_PARAMS = ('cpus', 'queues', 'placement', 'steal')
+
+
+# Short names for command lines and APIs
+ALIASES = {
+    'fcfs': "FCFS",
+    'sjf': "SJF",
+    'priority': "Priority",
+    'rr': "Round Robin",
+    'srtf': "SRTF",
+    'ppriority': "Preemptive Priority",
+    'mlfq': "MLFQ",
+}
+
+
+def _scaled(progress, k, count):
+    """Report one run's progress as task ``k`` of ``count``."""
+    if progress is None:
+        return None
+    progress(k, count)
+    return lambda done, total: progress(k + done / total, count)
+
+
+def resolve_algorithm(name):
+    """Map a display name or short alias (case-insensitive) to its ``ALGORITHMS`` key."""
+    if name in ALGORITHMS:
+        return name
+    key = name.strip().lower()
+    for algorithm in ALGORITHMS:
+        if algorithm.lower() == key:
+            return algorithm
+    try:
+        return ALIASES[key]
+    except KeyError:
+        raise ValueError(f"Unknown algorithm: {name}") from None
+
+
+def resolve_params(algorithm, params):
+    """``(name, params)``: every parameter ``algorithm`` accepts, defaults filled in, the rest dropped."""
+    name = resolve_algorithm(algorithm)
+    func, accepted = ALGORITHMS[name]
+    defaults = inspect.signature(func).parameters
+    params = {key: params.get(key, defaults[key].default) for key in accepted}
+    if params.get('quantum', 1) <= 0:
+        raise ValueError("Time quantum must be greater than zero.")
+    return name, params
+
+
+def accepted_params(algorithm, params):
+    """The entries of ``params`` that affect ``algorithm``'s schedule."""
+    accepted = ALGORITHMS[resolve_algorithm(algorithm)][1]
+    if params.get('cpus', 1) != 1:
+        accepted += MULTICORE_PARAMS
+    return {k: v for k, v in params.items() if k in accepted}
+
+
+def simulate(algorithm, processes, progress=None, **params):
+    """Run ``algorithm`` (a key of ``ALGORITHMS`` or an alias) with the params it accepts.
+
+    ``cpus`` other than 1 runs it through ``multicore.simulate_multicore``.
+    """
+    name = resolve_algorithm(algorithm)
+    params = accepted_params(name, params)
+    if 'cpus' in params:
+        from .multicore import simulate_multicore
+        return simulate_multicore(name, processes, progress=progress, **params)
+    return ALGORITHMS[name][0](processes, progress=progress, **params)
+
+
+def compare(processes, algorithms=None, progress=None, **params):
+    """Run several algorithms on one workload.
+
+    Returns ``(results, best)`` where ``results`` is a list of
+    ``(name, metrics)`` and ``best`` is the name with the lowest average WT.
+    ``progress`` counts in algorithms.
+    """
+    workload = as_workload(processes)
+    names = list(algorithms or ALGORITHMS)
+    results = []
+    for k, name in enumerate(names):
+        results.append((name, simulate(name, workload, progress=_scaled(progress, k, len(names)),
+                                       **params).metrics()))
+    best = min(results, key=lambda x: x[1]['WT'])[0]
+    return results, best
@@ -0,0 +1,175 @@
+"""Scalable Gantt chart rendering.
+
+All CPU slices of a schedule are drawn as a single ``PolyCollection`` whose
+rectangles are rebuilt for the visible window only. When the window holds
+more slices than the axes have pixels to show, slices are binned to the pixel
+grid (time horizontally, process rows vertically) and overlapping cells are
+merged into runs, so the number of rectangles is bounded by the axes' pixel
+area rather than the schedule length. Panning or zooming re-bins the new
+viewport.
+
+matplotlib (and NumPy, which it requires) are imported when a chart is first
+built, not when this module is imported.
+"""
+
+from ._optional import numpy
+
+COLORS = ('tab:blue', 'tab:orange', 'tab:green', 'tab:red', 'tab:purple')
+# Row i occupies y in [ROW_PITCH * (i + 1) - 5, + BAR_HEIGHT], as the original chart did
+ROW_PITCH = 10
+BAR_HEIGHT = 9
+MAX_TICK_LABELS = 40
+
+
+def slice_arrays(schedule):
+    """``(rows, starts, ends, labels)`` for every slice of ``schedule``.
+
+    ``rows`` numbers processes in display order and ``labels[row]`` is the PID.
+    """
+    np = numpy()
+    order = np.fromiter(schedule.indices(), dtype=np.int64, count=len(schedule))
+    labels = np.frombuffer(schedule.workload.pid, dtype=np.int64)[order]
+    row_of = np.empty(len(order), dtype=np.int64)
+    row_of[order] = np.arange(len(order))
+    if schedule.timeline is not None:
+        timeline = schedule.timeline
+        index = np.frombuffer(timeline.index, dtype=np.int64)
+        starts = np.frombuffer(timeline.start, dtype=np.int64)
+        ends = np.frombuffer(timeline.end, dtype=np.int64)
+    else:
+        index = np.arange(len(order))
+        starts = np.frombuffer(schedule.start, dtype=np.int64)
+        ends = np.frombuffer(schedule.completion, dtype=np.int64)
+    return row_of[index], starts, ends, labels
+
+
+class GanttChart:
+    """Draws a schedule on ``ax`` and keeps it binned to the current viewport."""
+
+    def __init__(self, ax, max_bars=4000):
+        from matplotlib.colors import to_rgba_array
+
+        self.ax = ax
+        self.max_bars = max_bars
+        self.palette = to_rgba_array(COLORS)
+        self.collection = None
+        self._updating = False
+        self.rows = self.starts = self.ends = self.labels = None
+        self._callbacks = []
+
+    def set_schedule(self, schedule, title="Gantt Chart"):
+        from matplotlib.collections import PolyCollection
+
+        self.detach()
+        self.rows, self.starts, self.ends, self.labels = slice_arrays(schedule)
+        ax = self.ax
+        ax.set_title(title)
+        ax.set_xlabel("Time")
+        ax.set_ylabel("Processes")
+        ax.grid(True)
+        ax.set_axisbelow(True)
+        self.collection = PolyCollection([], edgecolors='none')
+        ax.add_collection(self.collection)
+
+        n_rows = len(self.labels)
+        t0, t1 = int(self.starts.min()), int(self.ends.max())
+        pad = max(1, (t1 - t0) // 50)
+        ax.set_xlim(t0 - pad, t1 + pad)
+        ax.set_ylim(0, ROW_PITCH * (n_rows + 1))
+        ax.autoscale(False)
+        self.update_view()
+        self._callbacks = [ax.callbacks.connect('xlim_changed', self._on_limits),
+                           ax.callbacks.connect('ylim_changed', self._on_limits)]
+
+    def detach(self):
+        for cid in self._callbacks:
+            self.ax.callbacks.disconnect(cid)
+        self._callbacks = []
+        if self.collection is not None and self.collection.axes is not None:
+            self.collection.remove()
+        self.collection = None
+
+    def _on_limits(self, ax):
+        # Tick updates can nudge the limits; don't recurse into ourselves
+        if not self._updating:
+            self.update_view()
+
+    def _pixel_size(self):
+        bbox = self.ax.get_window_extent()
+        return max(1, int(bbox.width)), max(1, int(bbox.height))
+
+    def update_view(self):
+        """Rebuild the collection's rectangles for the visible window."""
+        self._updating = True
+        try:
+            self._update_view()
+        finally:
+            self._updating = False
+
+    def _update_view(self):
+        np = numpy()
+        x0, x1 = self.ax.get_xlim()
+        y0, y1 = self.ax.get_ylim()
+        row_lo = max(0, int(y0 // ROW_PITCH) - 1)
+        row_hi = min(len(self.labels) - 1, int(y1 // ROW_PITCH))
+
+        visible = (self.ends > x0) & (self.starts < x1) & (self.rows >= row_lo) & (self.rows <= row_hi)
+        rows, starts, ends = self.rows[visible], self.starts[visible], self.ends[visible]
+
+        width_px, height_px = self._pixel_size()
+        if len(rows) <= self.max_bars:
+            left, right = starts.astype(float), ends.astype(float)
+            bottom = ROW_PITCH * (rows + 1) - 5.0
+            top = bottom + BAR_HEIGHT
+            color_key = rows
+        else:
+            left, right, bottom, top, color_key = self._binned(rows, starts, ends, x0, x1, row_lo, row_hi,
+                                                               width_px, height_px)
+
+        verts = np.empty((len(left), 4, 2))
+        verts[:, 0, 0] = verts[:, 1, 0] = left
+        verts[:, 2, 0] = verts[:, 3, 0] = right
+        verts[:, 0, 1] = verts[:, 3, 1] = bottom
+        verts[:, 1, 1] = verts[:, 2, 1] = top
+        self.collection.set_verts(verts)
+        self.collection.set_facecolors(self.palette[color_key % len(self.palette)])
+        self._label_rows(y0, y1)
+
+    def _binned(self, rows, starts, ends, x0, x1, row_lo, row_hi, width_px, height_px):
+        """Merge slices into per-pixel runs: one rectangle per occupied stretch of a row band."""
+        np = numpy()
+        bin_width = (x1 - x0) / width_px
+        rows_per_band = max(1, -(-(row_hi - row_lo + 1) // height_px))
+        band = (rows - row_lo) // rows_per_band
+        first = np.floor((np.maximum(starts, x0) - x0) / bin_width).astype(np.int64)
+        last = np.floor((np.minimum(ends, x1) - x0) / bin_width).astype(np.int64)
+
+        order = np.lexsort((first, band))
+        band, first, last = band[order], first[order], last[order]
+        # Offsetting each band by more than the bin count keeps the running max inside its band
+        offset = band * (width_px + 2)
+        reach = np.maximum.accumulate(last + offset) - offset
+        new_run = np.ones(len(band), dtype=bool)
+        new_run[1:] = (band[1:] != band[:-1]) | (first[1:] > reach[:-1] + 1)
+        run_start = np.flatnonzero(new_run)
+        run_end = np.append(run_start[1:], len(band)) - 1
+
+        run_band = band[run_start]
+        left = x0 + first[run_start] * bin_width
+        right = x0 + (reach[run_end] + 1) * bin_width
+        bottom = ROW_PITCH * (row_lo + run_band * rows_per_band + 1) - 5.0
+        top = bottom + ROW_PITCH * (rows_per_band - 1) + BAR_HEIGHT
+        return left, right, bottom, top, row_lo + run_band * rows_per_band
+
+    def _label_rows(self, y0, y1):
+        # Only rows whose tick lies inside the limits: set_yticks would widen them otherwise
+        row_lo = max(0, int(-(-y0 // ROW_PITCH)) - 1)
+        row_hi = min(len(self.labels) - 1, int(y1 // ROW_PITCH) - 1)
+        count = row_hi - row_lo + 1
+        if count <= 0:
+            self.ax.set_yticks([])
+            return
+        step = max(1, -(-count // MAX_TICK_LABELS))
+        ticks = range(row_lo, row_hi + 1, step)
+        self.ax.set_yticks([ROW_PITCH * (row + 1) for row in ticks])
+        self.ax.set_yticklabels([str(self.labels[row]) for row in ticks])
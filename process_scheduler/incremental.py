@@ -0,0 +1,188 @@
+"""Incremental rescheduling of a growing workload.
+
+Every algorithm in the engine is causal: a decision at time t depends only on
+processes that have arrived by t. So when processes are appended, whatever
+the previous run decided before the earliest new arrival still stands.
+
+``IncrementalScheduler`` keeps one algorithm's per-run arrays between runs,
+together with the loop-state checkpoints the engine saves every
+``PROGRESS_STEP`` steps and at the end of a run, and resumes from the latest
+checkpoint before that arrival. A process added at or past the current
+horizon costs next to nothing to schedule; one added early in the trace
+re-simulates from there on.
+"""
+
+from array import array
+from bisect import bisect_left
+
+from .engine import (
+    Schedule,
+    Timeline,
+    _priority_key,
+    _run_fcfs,
+    _run_nonpreemptive,
+    _run_preemptive,
+    _run_rr,
+    resolve_params,
+)
+from .workload import Workload
+
+# Checkpoints kept per scheduler: the newest RECENT_CHECKPOINTS at full
+# density, older ones thinned out as the run grows
+MAX_CHECKPOINTS = 32
+RECENT_CHECKPOINTS = 8
+# Appending more rows than this at once re-sorts the arrival order instead of inserting
+MAX_INSERTS = 64
+
+
+class _Checkpoints(list):
+    """``(clock, state)`` pairs in clock order."""
+
+    def append(self, entry):
+        super().append(entry)
+        if len(self) > MAX_CHECKPOINTS:
+            del self[1:len(self) - RECENT_CHECKPOINTS:2]
+
+
+def _resume_fcfs(s, state, progress):
+    _run_fcfs(s.workload, s.start, s.completion, progress, s.checkpoints, state)
+
+
+def _resume_sjf(s, state, progress):
+    _run_nonpreemptive(s.workload, s.start, s.completion, s.workload.burst.__getitem__,
+                       progress, s.checkpoints, state)
+
+
+def _resume_priority(s, state, progress):
+    _run_nonpreemptive(s.workload, s.start, s.completion,
+                       _priority_key(s.workload, s.params['lower_is_higher'], True),
+                       progress, s.checkpoints, state)
+
+
+def _resume_rr(s, state, progress):
+    _run_rr(s.workload, s.start, s.completion, s.remaining, s.params['quantum'], s.timeline,
+            progress, s.checkpoints, state)
+
+
+def _resume_srtf(s, state, progress):
+    _run_preemptive(s.workload, s.start, s.completion, s.remaining, s.remaining.__getitem__, s.timeline,
+                    progress, s.checkpoints, state)
+
+
+def _resume_preemptive_priority(s, state, progress):
+    _run_preemptive(s.workload, s.start, s.completion, s.remaining,
+                    _priority_key(s.workload, s.params['lower_is_higher'], False), s.timeline,
+                    progress, s.checkpoints, state)
+
+
+# Algorithm -> (resume function, whether it logs a timeline, whether its schedule lists arrival order)
+RESUMABLE = {
+    "FCFS": (_resume_fcfs, False, True),
+    "SJF": (_resume_sjf, False, False),
+    "Priority": (_resume_priority, False, False),
+    "Round Robin": (_resume_rr, True, True),
+    "SRTF": (_resume_srtf, True, False),
+    "Preemptive Priority": (_resume_preemptive_priority, True, False),
+}
+
+
+class IncrementalScheduler:
+    """One algorithm's schedule of a growing workload, kept up to date by resuming.
+
+    ``append``/``extend`` add processes; ``schedule()`` re-simulates from the
+    latest checkpoint before the earliest process added since the previous
+    call. The schedule it returns shares the scheduler's arrays, which grow
+    in place, so it is only valid until the next ``append``; ``copy()`` it
+    to keep it.
+    """
+
+    def __init__(self, algorithm, workload=None, **params):
+        self.algorithm, self.params = resolve_params(algorithm, params)
+        if self.algorithm not in RESUMABLE:
+            raise ValueError(f"{self.algorithm} cannot be rescheduled incrementally.")
+        self.workload = Workload()
+        self.workload.arrival_order()
+        self.start = array('q')
+        self.completion = array('q')
+        self.remaining = array('q')
+        self.timeline = Timeline()
+        self.checkpoints = _Checkpoints()
+        # Clock of the checkpoint the last run resumed from; None after a full run
+        self.resumed_at = None
+        self._earliest = None
+        if workload is not None:
+            self.extend_to(workload)
+
+    def __len__(self):
+        return len(self.workload)
+
+    def append(self, pid, arrival, burst, priority=0):
+        self.workload.append(pid, arrival, burst, priority)
+        self.start.append(-1)
+        self.completion.append(0)
+        self.remaining.append(burst)
+        self._earliest = arrival if self._earliest is None else min(self._earliest, arrival)
+
+    def extend(self, pid, arrival, burst, priority):
+        if len(pid) <= MAX_INSERTS:
+            for row in zip(pid, arrival, burst, priority):
+                self.append(*row)
+            return
+        self.workload.extend(pid, arrival, burst, priority)
+        self.workload.arrival_order()
+        self.start.extend(array('q', [-1]) * len(pid))
+        self.completion.extend(array('q', bytes(8 * len(pid))))
+        self.remaining.extend(burst)
+        earliest = min(arrival)
+        self._earliest = earliest if self._earliest is None else min(self._earliest, earliest)
+
+    def extend_to(self, workload):
+        """Append whatever ``workload`` has beyond the scheduler's own rows.
+
+        Returns ``False``, changing nothing, if ``workload`` doesn't start
+        with exactly those rows (it was edited rather than extended).
+        """
+        n = len(self.workload)
+        columns = (workload.pid, workload.arrival, workload.burst, workload.priority)
+        own = (self.workload.pid, self.workload.arrival, self.workload.burst, self.workload.priority)
+        if len(workload) < n or any(column[:n] != mine for column, mine in zip(columns, own)):
+            return False
+        if len(workload) > n:
+            self.extend(*(column[n:] for column in columns))
+        return True
+
+    def schedule(self, progress=None):
+        if not len(self.workload):
+            raise ValueError("No processes to schedule!")
+        if self._earliest is not None:
+            self._update(progress)
+        _, logs_timeline, ordered = RESUMABLE[self.algorithm]
+        return Schedule(self.algorithm, self.workload, self.start, self.completion,
+                        self.workload.arrival_order() if ordered else None, dict(self.params),
+                        self.timeline if logs_timeline else None)
+
+    def _update(self, progress):
+        k = bisect_left([clock for clock, _ in self.checkpoints], self._earliest) - 1
+        if k < 0:
+            state = self.resumed_at = None
+            self._reset()
+        else:
+            self.resumed_at, state = self.checkpoints[k]
+            # The resumed run records this checkpoint again on its way past
+            del self.checkpoints[k:]
+        try:
+            RESUMABLE[self.algorithm][0](self, state, progress)
+        except BaseException:
+            # Half-updated arrays can't be resumed from; start over next time
+            self.checkpoints.clear()
+            self._earliest = -1
+            raise
+        self._earliest = None
+
+    def _reset(self):
+        n = len(self.workload)
+        self.start = array('q', [-1]) * n
+        self.completion = array('q', bytes(8 * n))
+        self.remaining = array('q', self.workload.burst)
+        self.timeline = Timeline()
+        self.checkpoints.clear()
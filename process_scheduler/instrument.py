@@ -0,0 +1,188 @@
+"""Opt-in run statistics and profiling.
+
+``instrument`` wraps ``engine.simulate``: it times the phases of one run
+(sorting arrivals, the scheduling loop, metrics) and derives the scheduler's
+counters from the finished schedule instead of counting inside the loop, so
+the runners carry no instrumentation and a plain ``simulate`` costs exactly
+what it did. Every counter is exact for the schedule produced:
+
+    dispatches        CPU slices, back-to-back slices of one process counted once
+    preemptions       dispatches beyond one per process
+    context_switches  dispatches that follow a different process on the same CPU
+                      with no idle time in between
+    idle_periods      times a CPU jumped its clock forward to the next arrival
+    idle_time         time units skipped that way (the runners never tick idle)
+    ready_queue_max   most processes waiting at once, not counting the running ones
+
+``ready_queue_max`` assumes the schedule never leaves a CPU idle while
+something waits, which holds for every algorithm here except per-CPU queues
+without stealing, where it is a lower bound.
+
+With ``profile`` the scheduling loop also runs under ``cProfile``: ``True``
+keeps the top functions as text in ``stats.profile``, and a path also dumps
+the raw stats there for ``pstats`` or a viewer.
+"""
+
+import cProfile
+import functools
+import io
+import pstats
+import time
+from bisect import bisect_right
+
+from ._optional import numpy
+from .engine import resolve_algorithm, simulate
+from .workload import as_workload
+
+PROFILE_LINES = 20
+COUNTERS = ('dispatches', 'preemptions', 'context_switches', 'idle_periods', 'idle_time', 'ready_queue_max')
+
+
+class RunStats:
+    """Counters and phase timings (in seconds) of one instrumented run."""
+
+    def __init__(self, algorithm, processes, params):
+        self.algorithm = algorithm
+        self.processes = processes
+        self.params = params
+        self.counters = {}
+        self.phases = {}
+        self.profile = None
+
+    def as_dict(self):
+        return {'algorithm': self.algorithm, 'processes': self.processes, 'params': dict(self.params),
+                'counters': dict(self.counters), 'phases': dict(self.phases), 'profile': self.profile}
+
+    def format(self):
+        text = format_stats(f"Run statistics ({self.algorithm}, {self.processes} processes)",
+                            self.counters, self.phases)
+        return f"{text}\n{self.profile.rstrip()}\n" if self.profile else text
+
+
+def format_stats(title, counters, phases):
+    """A text block of ``counters`` and ``phases`` under ``title``."""
+    lines = [title]
+    lines += [f"  {name:<18}{value:>14,}" for name, value in counters.items()]
+    lines += [f"  {name + ' (ms)':<18}{seconds * 1000:>14.2f}" for name, seconds in phases.items()]
+    return "\n".join(lines) + "\n"
+
+
+def _slices(schedule):
+    """``(index, start, end, cpu)`` of every slice, ordered by CPU and then time; ``cpu`` may be ``None``."""
+    timeline = schedule.timeline
+    if timeline is None:
+        order = sorted(range(len(schedule.start)), key=schedule.start.__getitem__)
+        return (order, [schedule.start[i] for i in order], [schedule.completion[i] for i in order], None)
+    cpu = getattr(timeline, 'cpu', None)
+    if cpu is None:
+        return timeline.index, timeline.start, timeline.end, None
+    order = sorted(range(len(cpu)), key=lambda k: (cpu[k], timeline.start[k]))
+    return tuple([column[k] for k in order] for column in (timeline.index, timeline.start, timeline.end, cpu))
+
+
+def _slice_counters_numpy(schedule):
+    np = numpy()
+    timeline = schedule.timeline
+    if timeline is None:
+        start = np.frombuffer(schedule.start, dtype=np.int64)
+        order = np.argsort(start, kind='stable')
+        index, start, end = order, start[order], np.frombuffer(schedule.completion, dtype=np.int64)[order]
+        cpu = None
+    else:
+        index, start, end = (np.frombuffer(c, dtype=np.int64) for c in (timeline.index, timeline.start, timeline.end))
+        cpu = getattr(timeline, 'cpu', None)
+        if cpu is not None:
+            cpu = np.frombuffer(cpu, dtype=np.int64)
+            order = np.lexsort((start, cpu))
+            index, start, end, cpu = index[order], start[order], end[order], cpu[order]
+    same_cpu = cpu[1:] == cpu[:-1] if cpu is not None else np.ones(len(start) - 1, dtype=bool)
+    gaps = np.where(same_cpu, start[1:] - end[:-1], 0)
+    # A CPU's first slice may also follow a jump from time 0
+    first = np.concatenate(([True], ~same_cpu))
+    leading = start[first]
+    return {
+        'dispatches': len(start),
+        'context_switches': int(np.count_nonzero(same_cpu & (gaps == 0) & (index[1:] != index[:-1]))),
+        'idle_periods': int(np.count_nonzero(gaps) + np.count_nonzero(leading)),
+        'idle_time': int(gaps.sum() + leading.sum()),
+    }
+
+
+def _slice_counters_python(schedule):
+    index, start, end, cpu = _slices(schedule)
+    switches = periods = idle = 0
+    for k in range(len(start)):
+        if k and (cpu is None or cpu[k] == cpu[k - 1]):
+            gap = start[k] - end[k - 1]
+            if gap == 0 and index[k] != index[k - 1]:
+                switches += 1
+        else:
+            gap = start[k]
+        if gap:
+            periods += 1
+            idle += gap
+    return {'dispatches': len(start), 'context_switches': switches, 'idle_periods': periods, 'idle_time': idle}
+
+
+def _ready_queue_max(schedule, cpus):
+    """Most processes arrived and unfinished at once, less the CPUs running them."""
+    arrival, completion = schedule.workload.arrival, schedule.completion
+    np = numpy()
+    if np is not None:
+        arrivals = np.sort(np.frombuffer(arrival, dtype=np.int64))
+        completions = np.sort(np.frombuffer(completion, dtype=np.int64))
+        waiting = (np.searchsorted(arrivals, arrivals, 'right')
+                   - np.searchsorted(completions, arrivals, 'right'))
+        return max(0, int(waiting.max()) - cpus)
+    arrivals, completions = sorted(arrival), sorted(completion)
+    return max(0, max(bisect_right(arrivals, a) - bisect_right(completions, a) for a in arrivals) - cpus)
+
+
+def run_counters(schedule):
+    """The ``COUNTERS`` of a finished schedule."""
+    counters = (_slice_counters_numpy if numpy() is not None else _slice_counters_python)(schedule)
+    counters['preemptions'] = counters['dispatches'] - len(schedule)
+    counters['ready_queue_max'] = _ready_queue_max(schedule, getattr(schedule, 'cpus', 1))
+    return {name: counters[name] for name in COUNTERS}
+
+
+def _profiled(func, profile, stats):
+    profiler = cProfile.Profile()
+    try:
+        result = profiler.runcall(func)
+    finally:
+        text = io.StringIO()
+        pstats.Stats(profiler, stream=text).sort_stats('cumulative').print_stats(PROFILE_LINES)
+        stats.profile = text.getvalue()
+        if profile is not True:
+            profiler.dump_stats(profile)
+    return result
+
+
+def instrument(algorithm, processes, profile=None, progress=None, **params):
+    """``simulate`` plus a ``RunStats``; returns ``(schedule, stats)``.
+
+    ``profile`` is ``None``, ``True`` or a path to dump ``cProfile`` stats to.
+    """
+    name = resolve_algorithm(algorithm)
+    workload = as_workload(processes)
+    stats = RunStats(name, len(workload), params)
+
+    started = time.perf_counter()
+    workload.arrival_order()
+    stats.phases['arrival_order'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    run = functools.partial(simulate, name, workload, progress=progress, **params)
+    schedule = _profiled(run, profile, stats) if profile else run()
+    stats.phases['schedule'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    schedule.metrics()
+    stats.phases['metrics'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    stats.counters = run_counters(schedule)
+    stats.phases['counters'] = time.perf_counter() - started
+    stats.params = schedule.params
+    return schedule, stats
@@ -0,0 +1,38 @@
+"""Progress reporting and cooperative cancellation for background runs.
+
+A ``Job`` is passed as the ``progress`` callback of a simulation, comparison
+or sweep running on a worker thread. The worker updates ``done``/``total``
+through it; another thread reads them and may call ``cancel()``, after which
+the worker's next progress report raises ``Cancelled``.
+"""
+
+import threading
+
+
+class Cancelled(Exception):
+    """Raised inside a run whose job has been cancelled."""
+
+
+class Job:
+    """Progress and a cancel flag shared between a worker and its caller."""
+
+    def __init__(self):
+        self.done = 0
+        self.total = 0
+        self._cancelled = threading.Event()
+
+    def __call__(self, done, total):
+        self.done, self.total = done, total
+        if self._cancelled.is_set():
+            raise Cancelled()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    @property
+    def fraction(self):
+        return min(1.0, self.done / self.total) if self.total else 0.0
@@ -0,0 +1,152 @@
+"""Virtualized process list.
+
+A ``ttk.Treeview`` with a million items is unusable, and rebuilding it after
+every change is O(N) Tk calls. ``VirtualProcessList`` keeps only as many
+items as fit in the widget and rewrites their values from the workload
+whenever the list scrolls, grows or is re-sorted. Sorting keeps a permutation
+of workload indices (8 bytes a row) instead of copying the rows.
+
+The widgets are created by the caller, so this module never imports Tk.
+"""
+
+from array import array
+from bisect import bisect_right
+
+from ._optional import numpy
+
+# Treeview column id -> Workload column
+COLUMNS = {'PID': 'pid', 'Arrival': 'arrival', 'Burst': 'burst', 'Priority': 'priority'}
+WHEEL_ROWS = 3
+
+
+def sort_order(workload, field, descending=False):
+    """Workload indices stably sorted by ``field``."""
+    column = getattr(workload, field)
+    np = numpy()
+    if np is not None:
+        values = np.frombuffer(column, dtype=np.int64)
+        # Workload fields are non-negative, so negating cannot overflow;
+        # kind='stable' keeps equal values in workload order
+        order = np.argsort(-values if descending else values, kind='stable')
+        result = array('q')
+        result.frombytes(order.astype(np.int64).tobytes())
+        return result
+    return array('q', sorted(range(len(column)), key=column.__getitem__, reverse=descending))
+
+
+class VirtualProcessList:
+    """Shows ``workload`` through ``tree``, materializing only the visible rows."""
+
+    def __init__(self, tree, scrollbar, workload, rowheight=25):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.workload = workload
+        self.rowheight = rowheight
+        self.top = 0
+        self.page = int(tree.cget('height'))
+        self.sort_column = None
+        self.descending = False
+        self.order = None
+        self.headings = {column: tree.heading(column, 'text') for column in COLUMNS}
+
+        for column in COLUMNS:
+            tree.heading(column, command=lambda c=column: self.sort_by(c))
+        scrollbar.configure(command=self.yview)
+        tree.bind('<Configure>', self._on_resize)
+        tree.bind('<MouseWheel>', self._on_wheel)
+        tree.bind('<Button-4>', lambda e: self.scroll(-WHEEL_ROWS))
+        tree.bind('<Button-5>', lambda e: self.scroll(WHEEL_ROWS))
+        self.refresh()
+
+    def __len__(self):
+        return len(self.workload)
+
+    def set_workload(self, workload):
+        """Show a different (or rebuilt) workload, keeping the sort column."""
+        self.workload = workload
+        self.order = None
+        if self.sort_column is not None:
+            self.order = sort_order(workload, COLUMNS[self.sort_column], self.descending)
+        self.top = 0
+        self.refresh()
+
+    def appended(self):
+        """The workload grew by one row at the end; place it without re-sorting."""
+        i = row = len(self.workload) - 1
+        if self.order is not None:
+            column = getattr(self.workload, COLUMNS[self.sort_column])
+            key = (lambda k: -column[k]) if self.descending else column.__getitem__
+            row = bisect_right(self.order, key(i), key=key)
+            self.order.insert(row, i)
+        if row < self.top:
+            self.top += 1  # keep the same rows in view
+        if row < self.top + self.page:
+            self.refresh()
+        else:
+            self._update_scrollbar(min(self.page, len(self) - self.top))
+
+    def sort_by(self, column):
+        """Sort by ``column``; a second click on the same column reverses it."""
+        self.descending = column == self.sort_column and not self.descending
+        self.sort_column = column
+        self.order = sort_order(self.workload, COLUMNS[column], self.descending)
+        self.top = 0
+        for name, text in self.headings.items():
+            arrow = (" ▼" if self.descending else " ▲") if name == column else ""
+            self.tree.heading(name, text=text + arrow)
+        self.refresh()
+
+    def index(self, row):
+        """Workload index shown at list position ``row``."""
+        return self.order[row] if self.order is not None else row
+
+    def scroll(self, rows):
+        self.top += rows
+        self.refresh()
+        return 'break'
+
+    def yview(self, action, value, unit=None):
+        """Scrollbar command: ``moveto FRACTION`` or ``scroll N units|pages``."""
+        if action == 'moveto':
+            self.top = int(float(value) * len(self))
+        else:
+            self.top += int(value) * (self.page if unit == 'pages' else 1)
+        self.refresh()
+
+    def _on_wheel(self, event):
+        return self.scroll(-WHEEL_ROWS if event.delta > 0 else WHEEL_ROWS)
+
+    def _on_resize(self, event):
+        # One row's worth of height goes to the headings
+        page = max(1, event.height // self.rowheight - 1)
+        if page != self.page:
+            self.page = page
+            self.refresh()
+
+    def refresh(self):
+        """Rewrite the visible items for the current scroll position."""
+        n = len(self)
+        self.top = max(0, min(self.top, n - self.page))
+        count = min(self.page, n - self.top)
+
+        items = self.tree.get_children()
+        if len(items) > count:
+            self.tree.delete(*items[count:])
+            items = items[:count]
+        columns = (self.workload.pid, self.workload.arrival, self.workload.burst, self.workload.priority)
+        for k in range(count):
+            i = self.index(self.top + k)
+            values = tuple(column[i] for column in columns)
+            if k < len(items):
+                self.tree.item(items[k], values=values)
+            else:
+                self.tree.insert('', 'end', values=values)
+
+        self._update_scrollbar(count)
+
+    def _update_scrollbar(self, count):
+        n = len(self)
+        if n:
+            self.scrollbar.set(self.top / n, (self.top + count) / n)
+        else:
+            self.scrollbar.set(0, 1)
@@ -0,0 +1,140 @@
+"""Schedule metrics and text reports.
+
+Metrics are computed column-wise over a schedule's arrival/burst/start/
+completion arrays. When NumPy is installed, the columns are viewed in place
+with ``np.frombuffer`` and each statistic takes one vectorized pass.
+Matplotlib depends on NumPy, so the GUI always has it. NumPy is imported on
+first use. Without it, plain Python computes the same numbers.
+"""
+
+import math
+
+from ._optional import numpy
+
+PERCENTILES = (50, 95, 99)
+SERIES = ('TAT', 'WT', 'RT')
+
+
+def _columns(schedule):
+    w = schedule.workload
+    return w.arrival, w.burst, schedule.start, schedule.completion
+
+
+def _series_numpy(arrival, burst, start, completion):
+    np = numpy()
+    arrival = np.frombuffer(arrival, dtype=np.int64)
+    burst = np.frombuffer(burst, dtype=np.int64)
+    start = np.frombuffer(start, dtype=np.int64)
+    completion = np.frombuffer(completion, dtype=np.int64)
+    tat = completion - arrival
+    series = {'TAT': tat, 'WT': tat - burst, 'RT': start - arrival}
+    return series, int(burst.sum()), int(arrival.min()), int(completion.max())
+
+
+def _summarize_numpy(values):
+    np = numpy()
+    n = len(values)
+    summary = {'': int(values.sum()) / n, 'max': int(values.max()), 'std': float(values.std())}
+    for q, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+        summary[f'p{q}'] = float(value)
+    return summary
+
+
+def _percentile(ordered, q):
+    """Linear-interpolated percentile, matching NumPy's default method."""
+    position = (len(ordered) - 1) * q / 100
+    low = math.floor(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def _summarize_python(values):
+    n = len(values)
+    mean = sum(values) / n
+    ordered = sorted(values)
+    summary = {'': mean, 'max': ordered[-1],
+               'std': math.sqrt(sum((v - mean) ** 2 for v in values) / n)}
+    for q in PERCENTILES:
+        summary[f'p{q}'] = float(_percentile(ordered, q))
+    return summary
+
+
+def schedule_metrics(schedule):
+    """Averages, spread and throughput of one schedule.
+
+    ``TAT``, ``WT`` and ``RT`` are the averages; ``<series>_p50/_p95/_p99``,
+    ``_max`` and ``_std`` describe their distribution. ``makespan`` runs from
+    the first arrival to the last completion, over which ``throughput``
+    (jobs per time unit) and ``cpu_utilization`` (busy fraction) are measured.
+    """
+    arrival, burst, start, completion = _columns(schedule)
+    if numpy() is not None:
+        series, busy, first, last = _series_numpy(arrival, burst, start, completion)
+        summarize = _summarize_numpy
+    else:
+        tat = [c - a for a, c in zip(arrival, completion)]
+        series = {'TAT': tat,
+                  'WT': [t - b for t, b in zip(tat, burst)],
+                  'RT': [s - a for a, s in zip(arrival, start)]}
+        busy, first, last = sum(burst), min(arrival), max(completion)
+        summarize = _summarize_python
+
+    metrics = {}
+    for name in SERIES:
+        for stat, value in summarize(series[name]).items():
+            metrics[f'{name}_{stat}' if stat else name] = value
+    makespan = last - first
+    metrics['makespan'] = makespan
+    metrics['throughput'] = len(arrival) / makespan if makespan else 0.0
+    metrics['cpu_utilization'] = busy / makespan if makespan else 0.0
+    return metrics
+
+
+def format_summary(metrics):
+    lines = [
+        f"Average Turnaround Time: {metrics['TAT']:.2f}",
+        f"Average Waiting Time: {metrics['WT']:.2f}",
+        f"Average Response Time: {metrics['RT']:.2f}",
+        "",
+        f"{'':<12}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}{'std':>10}",
+    ]
+    for name in SERIES:
+        lines.append(f"{name:<12}" + "".join(
+            f"{metrics[f'{name}_{stat}']:>10.2f}" for stat in ('p50', 'p95', 'p99', 'max', 'std')))
+    lines += [
+        "",
+        f"Makespan: {metrics['makespan']}",
+        f"Throughput: {metrics['throughput']:.4f} processes/unit time",
+        f"CPU Utilization: {metrics['cpu_utilization']:.2%}",
+    ]
+    if 'cpus' in metrics:
+        lines.append(f"Per-CPU Utilization ({metrics['cpus']} CPUs): {metrics['core_utilization_min']:.2%}"
+                     f" to {metrics['core_utilization_max']:.2%}, {metrics['migrations']} migrations")
+    return "\n".join(lines)
+
+
+def format_report(schedule, metrics=None):
+    """Per-process table followed by the metrics summary, built with one join."""
+    if metrics is None:
+        metrics = schedule_metrics(schedule)
+    lines = ["", "PID\tArrival\tBurst\tStart\tCompletion\tTurnaround\tWaiting"]
+    lines.extend(
+        f"{pid}\t{arrival}\t{burst}\t{start}\t{completion}\t\t"
+        f"{completion - arrival}\t\t{completion - arrival - burst}"
+        for pid, arrival, burst, _, start, completion in schedule.rows()
+    )
+    lines.append("")
+    lines.append(format_summary(metrics))
+    lines.append("")
+    return "\n".join(lines)
+
+
+def format_comparison(results, best):
+    lines = ["Algorithm Comparison:",
+             f"{'Algorithm':<22}{'Avg TAT':<15}{'Avg WT':<15}{'Avg RT':<15}"]
+    for name, metric in results:
+        lines.append(f"{name:<22}{metric['TAT']:<15.2f}{metric['WT']:<15.2f}{metric['RT']:<15.2f}")
+    lines.append("")
+    lines.append(f"Best Algorithm (Lowest Avg WT): {best}")
+    lines.append("")
+    return "\n".join(lines)
@@ -0,0 +1,486 @@
+"""Scheduling on several identical CPUs.
+
+``simulate_multicore`` runs every algorithm on ``cpus`` CPUs as a
+discrete-event simulation. The clock jumps between arrivals (read through an
+arrival-sorted cursor) and CPU events -- completions and quantum expiries --
+kept in one heap. Each event therefore costs O(log cpus + log ready),
+whatever the number of cores.
+
+Ready processes wait in one of two places:
+
+* ``queues='global'``: one queue that every CPU serves. A preemptive arrival
+  displaces the worst process running on any CPU.
+* ``queues='per-cpu'``: one queue per CPU. Each arrival is placed by
+  ``placement``: ``'least-loaded'`` picks the CPU with the fewest queued and
+  running processes, ``'round-robin'`` deals arrivals out in turn. A
+  preemptive arrival only competes with the process on its own CPU. With
+  ``steal``, a CPU that runs out of work takes the next process from the
+  longest queue.
+
+A CPU that frees up serves its queue before idle CPUs do, so a Round Robin
+process keeps its core while nothing else is waiting. With one CPU and a
+global queue, every algorithm reproduces its single-CPU runner exactly.
+"""
+
+import heapq
+import itertools
+from array import array
+from collections import deque
+
+from ._optional import numpy
+from .engine import (
+    PROGRESS_STEP,
+    Schedule,
+    Timeline,
+    _checkpoint,
+    _prepare,
+    _priority_key,
+    resolve_algorithm,
+)
+
+# The algorithms with a multi-CPU model
+SUPPORTED = ("FCFS", "SJF", "Priority", "Round Robin", "SRTF", "Preemptive Priority")
+QUEUES = ('global', 'per-cpu')
+PLACEMENTS = ('least-loaded', 'round-robin')
+
+
+class CoreTimeline(Timeline):
+    """``Timeline`` with the CPU of every slice in a parallel ``cpu`` column.
+
+    Slices of different CPUs interleave, so a slice coalesces with the same
+    process's previous slice, provided that ran on the same CPU and ended
+    where this one starts.
+    """
+
+    __slots__ = ('cpu', '_last')
+
+    def __init__(self, n=0):
+        super().__init__()
+        self.cpu = array('q')
+        self._last = array('q', [-1]) * n
+
+    def append(self, index, start, end, cpu=0):
+        k = self._last[index]
+        if k != -1 and self.end[k] == start and self.cpu[k] == cpu:
+            self.end[k] = end
+            return
+        self._last[index] = len(self.index)
+        self.index.append(index)
+        self.start.append(start)
+        self.end.append(end)
+        self.cpu.append(cpu)
+
+    def finish(self):
+        """Drop the per-process coalescing index once the run is over."""
+        self._last = array('q')
+
+    def copy(self):
+        timeline = CoreTimeline()
+        for name in ('index', 'start', 'end', 'cpu', '_last'):
+            setattr(timeline, name, array('q', getattr(self, name)))
+        return timeline
+
+    def context_switches(self):
+        """Dispatches that change the process running on a CPU."""
+        previous = {}
+        switches = 0
+        for index, cpu in zip(self.index, self.cpu):
+            if previous.get(cpu, index) != index:
+                switches += 1
+            previous[cpu] = index
+        return switches
+
+
+class MulticoreSchedule(Schedule):
+    """A ``Schedule`` whose timeline records the CPU of every slice."""
+
+    def __init__(self, algorithm, workload, start, completion, order=None, params=None, timeline=None, cpus=1):
+        super().__init__(algorithm, workload, start, completion, order, params, timeline)
+        self.cpus = cpus
+
+    def core_busy(self):
+        """Busy time of each CPU."""
+        t = self.timeline
+        np = numpy()
+        if np is not None:
+            cpu = np.frombuffer(t.cpu, dtype=np.int64)
+            busy = np.frombuffer(t.end, dtype=np.int64) - np.frombuffer(t.start, dtype=np.int64)
+            return [int(b) for b in np.bincount(cpu, weights=busy, minlength=self.cpus)]
+        busy = [0] * self.cpus
+        for cpu, start, end in zip(t.cpu, t.start, t.end):
+            busy[cpu] += end - start
+        return busy
+
+    def migrations(self):
+        """Slices that resume a process on a different CPU from its previous slice."""
+        last = {}
+        moves = 0
+        for index, cpu in zip(self.timeline.index, self.timeline.cpu):
+            if last.get(index, cpu) != cpu:
+                moves += 1
+            last[index] = cpu
+        return moves
+
+    def metrics(self):
+        """``schedule_metrics`` with utilization per CPU.
+
+        ``cpu_utilization`` averages over all CPUs; ``core_utilization_min``
+        and ``_max`` give the spread between them.
+        """
+        metrics = super().metrics()
+        makespan = metrics['makespan']
+        utilization = [busy / makespan if makespan else 0.0 for busy in self.core_busy()]
+        metrics['cpus'] = self.cpus
+        metrics['cpu_utilization'] = sum(utilization) / self.cpus
+        metrics['core_utilization_min'] = min(utilization)
+        metrics['core_utilization_max'] = max(utilization)
+        metrics['migrations'] = self.migrations()
+        return metrics
+
+
+def _placer(placement, cpus, load):
+    """``place()`` -> the CPU whose queue takes the next arrival."""
+    if placement == 'least-loaded':
+        # min() and index() scan the array in C; ties go to the lowest CPU
+        return lambda: load.index(min(load))
+    turn = itertools.count()
+    return lambda: next(turn) % cpus
+
+
+class _Cores:
+    """State shared by the event loops: queues, load, idle CPUs, the event heap."""
+
+    def __init__(self, cpus, queues, placement, steal, make_queue):
+        self.shared = queues == 'global'
+        self.ready = [make_queue()] * cpus if self.shared else [make_queue() for _ in range(cpus)]
+        self.steal = steal and not self.shared
+        self.load = array('q', bytes(8 * cpus))  # queued + running per CPU (per-cpu queues only)
+        self.place = (lambda: 0) if self.shared else _placer(placement, cpus, self.load)
+        self.running = array('q', [-1]) * cpus
+        self.slice_start = array('q', bytes(8 * cpus))
+        self.idle = set(range(cpus))
+        self.queued = 0
+        self.events = []
+
+    def source(self, cpu):
+        """Queue ``cpu`` serves next: its own, or when stealing the longest; ``None`` if it has no work."""
+        queue = self.ready[cpu]
+        if queue or not (self.steal and self.queued):
+            return queue or None
+        lengths = list(map(len, self.ready))
+        victim = lengths.index(max(lengths))
+        self.load[victim] -= 1
+        self.load[cpu] += 1
+        return self.ready[victim]
+
+    def waiting(self, woken):
+        """Idle CPUs to dispatch after this event's arrivals, lowest first."""
+        if self.shared or self.steal:
+            while self.idle and self.queued:
+                cpu = min(self.idle)
+                self.idle.discard(cpu)
+                yield cpu
+        else:
+            for cpu in woken:
+                if cpu in self.idle:
+                    self.idle.discard(cpu)
+                    yield cpu
+
+
+def _run_nonpreemptive(workload, start, completion, key, timeline, cores, progress):
+    order = workload.arrival_order()
+    arrival = workload.arrival
+    burst = workload.burst
+    n = len(order)
+    ready, load, running, events = cores.ready, cores.load, cores.running, cores.events
+    place = cores.place
+    # Arrivals between two dispatches share an epoch, so equal keys run in workload order
+    cursor = completed = epoch = step = 0
+    checkpoint = _checkpoint(progress)
+
+    while completed < n:
+        step += 1
+        if step == checkpoint:
+            checkpoint += PROGRESS_STEP
+            progress(completed, n)
+        if events and (cursor == n or events[0][0] <= arrival[order[cursor]]):
+            time = events[0][0]
+        else:
+            time = arrival[order[cursor]]
+
+        freed = []
+        while events and events[0][0] == time:
+            cpu = heapq.heappop(events)[1]
+            i = running[cpu]
+            running[cpu] = -1
+            completion[i] = time
+            timeline.append(i, start[i], time, cpu)
+            load[cpu] -= 1
+            completed += 1
+            freed.append(cpu)
+
+        woken = []
+        while cursor < n and arrival[order[cursor]] <= time:
+            i = order[cursor]
+            cursor += 1
+            cpu = place()
+            load[cpu] += 1
+            heapq.heappush(ready[cpu], (key(i), epoch, i))
+            cores.queued += 1
+            woken.append(cpu)
+
+        for cpu in freed:
+            queue = cores.source(cpu)
+            if queue is None:
+                cores.idle.add(cpu)
+                continue
+            i = heapq.heappop(queue)[2]
+            cores.queued -= 1
+            running[cpu] = i
+            start[i] = time
+            heapq.heappush(events, (time + burst[i], cpu))
+            epoch += 1
+        for cpu in cores.waiting(woken):
+            i = heapq.heappop(cores.source(cpu))[2]
+            cores.queued -= 1
+            running[cpu] = i
+            start[i] = time
+            heapq.heappush(events, (time + burst[i], cpu))
+            epoch += 1
+
+
+def _run_rr(workload, start, completion, remaining, quantum, timeline, cores, progress):
+    order = workload.arrival_order()
+    arrival = workload.arrival
+    n = len(order)
+    ready, load, running, events = cores.ready, cores.load, cores.running, cores.events
+    slice_start, place = cores.slice_start, cores.place
+    cursor = completed = step = 0
+    checkpoint = _checkpoint(progress)
+
+    while completed < n:
+        step += 1
+        if step == checkpoint:
+            checkpoint += PROGRESS_STEP
+            progress(completed, n)
+        if events and (cursor == n or events[0][0] <= arrival[order[cursor]]):
+            time = events[0][0]
+        else:
+            time = arrival[order[cursor]]
+
+        freed = []
+        requeue = []
+        while events and events[0][0] == time:
+            cpu = heapq.heappop(events)[1]
+            i = running[cpu]
+            running[cpu] = -1
+            timeline.append(i, slice_start[cpu], time, cpu)
+            if remaining[i]:
+                requeue.append((cpu, i))
+            else:
+                completion[i] = time
+                load[cpu] -= 1
+                completed += 1
+            freed.append(cpu)
+
+        woken = []
+        while cursor < n and arrival[order[cursor]] <= time:
+            cpu = place()
+            load[cpu] += 1
+            ready[cpu].append(order[cursor])
+            cursor += 1
+            cores.queued += 1
+            woken.append(cpu)
+        # A preempted process rejoins behind this event's arrivals, on its own CPU's queue
+        for cpu, i in requeue:
+            ready[cpu].append(i)
+            cores.queued += 1
+
+        for cpu in freed:
+            queue = cores.source(cpu)
+            if queue is None:
+                cores.idle.add(cpu)
+                continue
+            i = queue.popleft()
+            cores.queued -= 1
+            running[cpu] = i
+            if start[i] == -1:
+                start[i] = time
+            slice_start[cpu] = time
+            run = min(quantum, remaining[i])
+            remaining[i] -= run
+            heapq.heappush(events, (time + run, cpu))
+        for cpu in cores.waiting(woken):
+            i = cores.source(cpu).popleft()
+            cores.queued -= 1
+            running[cpu] = i
+            if start[i] == -1:
+                start[i] = time
+            slice_start[cpu] = time
+            run = min(quantum, remaining[i])
+            remaining[i] -= run
+            heapq.heappush(events, (time + run, cpu))
+
+
+def _run_preemptive(workload, start, completion, remaining, key, shrinking, timeline, cores, progress):
+    """Preemptive dispatch in ``key`` order on every CPU.
+
+    ``remaining`` of a running process is only brought up to date when it
+    leaves its CPU. ``shrinking`` says ``key`` is the remaining time itself
+    (SRTF): running processes then rank by projected finish instead, which
+    orders them the same way at any moment.
+    """
+    order = workload.arrival_order()
+    arrival = workload.arrival
+    n = len(order)
+    cpus = len(cores.running)
+    ready, load, running, events = cores.ready, cores.load, cores.running, cores.events
+    slice_start, place, shared = cores.slice_start, cores.place, cores.shared
+    finish = array('q', bytes(8 * cpus))
+    version = array('q', bytes(8 * cpus))
+    worst = []  # global queues: (-rank, -arrival, -index, cpu, version), the process to preempt first
+    cursor = completed = step = 0
+    checkpoint = _checkpoint(progress)
+
+    def dispatch(cpu, queue, time):
+        i = heapq.heappop(queue)[2]
+        cores.queued -= 1
+        running[cpu] = i
+        if start[i] == -1:
+            start[i] = time
+        slice_start[cpu] = time
+        finish[cpu] = time + remaining[i]
+        version[cpu] += 1
+        heapq.heappush(events, (finish[cpu], cpu, version[cpu]))
+        if shared:
+            rank = finish[cpu] if shrinking else key(i)
+            heapq.heappush(worst, (-rank, -arrival[i], -i, cpu, version[cpu]))
+
+    def preempt(cpu, time):
+        i = running[cpu]
+        remaining[i] = finish[cpu] - time
+        timeline.append(i, slice_start[cpu], time, cpu)
+        heapq.heappush(ready[cpu], (key(i), arrival[i], i))
+        cores.queued += 1
+        dispatch(cpu, ready[cpu], time)
+
+    while completed < n:
+        step += 1
+        if step == checkpoint:
+            checkpoint += PROGRESS_STEP
+            progress(completed, n)
+        while events and events[0][2] != version[events[0][1]]:
+            heapq.heappop(events)
+        if events and (cursor == n or events[0][0] <= arrival[order[cursor]]):
+            time = events[0][0]
+        else:
+            time = arrival[order[cursor]]
+
+        freed = []
+        while events and events[0][0] == time:
+            _, cpu, v = heapq.heappop(events)
+            if v != version[cpu]:
+                continue
+            i = running[cpu]
+            running[cpu] = -1
+            version[cpu] += 1
+            remaining[i] = 0
+            completion[i] = time
+            timeline.append(i, slice_start[cpu], time, cpu)
+            load[cpu] -= 1
+            completed += 1
+            freed.append(cpu)
+
+        woken = []
+        while cursor < n and arrival[order[cursor]] <= time:
+            i = order[cursor]
+            cursor += 1
+            cpu = place()
+            load[cpu] += 1
+            heapq.heappush(ready[cpu], (key(i), arrival[i], i))
+            cores.queued += 1
+            woken.append(cpu)
+
+        for cpu in freed:
+            queue = cores.source(cpu)
+            if queue is None:
+                cores.idle.add(cpu)
+            else:
+                dispatch(cpu, queue, time)
+        for cpu in cores.waiting(woken):
+            dispatch(cpu, cores.source(cpu), time)
+
+        # Arrivals strictly better than a running process take its CPU
+        if shared:
+            queue = ready[0]
+            while queue and worst:
+                cpu, v = worst[0][3], worst[0][4]
+                if v != version[cpu]:
+                    heapq.heappop(worst)
+                    continue
+                i = running[cpu]
+                remaining[i] = finish[cpu] - time
+                if not queue[0][0] < key(i):
+                    break
+                heapq.heappop(worst)
+                preempt(cpu, time)
+        else:
+            for cpu in woken:
+                i = running[cpu]
+                if i == -1 or not ready[cpu]:
+                    continue
+                remaining[i] = finish[cpu] - time
+                if ready[cpu][0][0] < key(i):
+                    preempt(cpu, time)
+
+
+def simulate_multicore(algorithm, processes, cpus=2, queues='global', placement='least-loaded', steal=False,
+                       progress=None, quantum=2, lower_is_higher=True):
+    """Run ``algorithm`` on ``cpus`` CPUs; returns a ``MulticoreSchedule``.
+
+    ``quantum`` and ``lower_is_higher`` apply to the algorithms that take
+    them, as in ``engine.simulate``.
+    """
+    name = resolve_algorithm(algorithm)
+    if name not in SUPPORTED:
+        raise ValueError(f"{name} has no multi-CPU model.")
+    if cpus < 1:
+        raise ValueError("There must be at least one CPU.")
+    if queues not in QUEUES:
+        raise ValueError(f"Unknown queue layout {queues!r}; expected one of {', '.join(QUEUES)}.")
+    if placement not in PLACEMENTS:
+        raise ValueError(f"Unknown placement {placement!r}; expected one of {', '.join(PLACEMENTS)}.")
+    if name == "Round Robin" and quantum <= 0:
+        raise ValueError("Time quantum must be greater than zero.")
+
+    workload, start, completion = _prepare(processes)
+    timeline = CoreTimeline(len(workload))
+    params = {'cpus': cpus, 'queues': queues, 'placement': placement, 'steal': steal}
+    order = None
+    if name == "Round Robin":
+        cores = _Cores(cpus, queues, placement, steal, deque)
+        _run_rr(workload, start, completion, array('q', workload.burst), quantum, timeline, cores, progress)
+        params['quantum'] = quantum
+        order = workload.arrival_order()
+    elif name in ("SRTF", "Preemptive Priority"):
+        cores = _Cores(cpus, queues, placement, steal, list)
+        remaining = array('q', workload.burst)
+        if name == "SRTF":
+            key, shrinking = remaining.__getitem__, True
+        else:
+            key, shrinking = _priority_key(workload, lower_is_higher, False), False
+            params['lower_is_higher'] = lower_is_higher
+        _run_preemptive(workload, start, completion, remaining, key, shrinking, timeline, cores, progress)
+    else:
+        cores = _Cores(cpus, queues, placement, steal, list)
+        if name == "FCFS":
+            key = workload.arrival.__getitem__
+            order = workload.arrival_order()
+        elif name == "SJF":
+            key = workload.burst.__getitem__
+        else:
+            key = _priority_key(workload, lower_is_higher, True)
+            params['lower_is_higher'] = lower_is_higher
+        _run_nonpreemptive(workload, start, completion, key, timeline, cores, progress)
+    timeline.finish()
+    return MulticoreSchedule(name, workload, start, completion, order, params, timeline, cpus)
@@ -0,0 +1,300 @@
+"""Online scheduling of an unbounded arrival stream.
+
+The engine's runners need the whole workload up front. ``OnlineScheduler``
+takes processes one at a time, in arrival order, and hands each one back as
+soon as its completion is certain -- that is, once no later arrival can
+change it. It only holds processes that have arrived but not finished, so
+memory follows the ready queue rather than the length of the trace.
+
+A decision at time t can depend on every arrival up to t, so the scheduler
+only runs ahead to the latest arrival it has seen. ``finish()`` declares the
+stream over and drains the rest. Given the same processes in the same order,
+the completions match ``engine.simulate`` exactly.
+
+``stream`` and ``astream`` drive it from an iterator or an async iterator.
+``RollingMetrics`` keeps TAT/WT/RT averages over a sliding window of
+completions.
+"""
+
+import heapq
+from collections import deque
+
+from .engine import Process, resolve_params
+
+
+def _fields(record):
+    if isinstance(record, Process):
+        return record.pid, record.arrival_time, record.burst_time, record.priority
+    return record
+
+
+def _complete(p, time, done):
+    p.remaining_time = 0
+    p.completion_time = time
+    done.append(p)
+
+
+class OnlineScheduler:
+    """One algorithm run over processes fed in arrival order.
+
+    ``add`` returns the processes it lets complete, and ``finish`` returns the
+    rest. Both return them in completion order, as ``Process`` objects with
+    ``start_time`` and ``completion_time`` set.
+    """
+
+    def __init__(self, algorithm, **params):
+        self.algorithm, self.params = resolve_params(algorithm, params)
+        if self.algorithm not in ADVANCE:
+            raise ValueError(f"{self.algorithm} cannot be run online.")
+        self._advance = getattr(self, ADVANCE[self.algorithm])
+        sign = 1 if self.params.get('lower_is_higher', True) else -1
+        self._key = {
+            "SJF": lambda p: p.burst_time,
+            "Priority": lambda p: (sign * p.priority, p.arrival_time),
+            "SRTF": lambda p: p.remaining_time,
+            "Preemptive Priority": lambda p: sign * p.priority,
+        }.get(self.algorithm)
+        self.time = 0
+        self.added = 0
+        self.finished = False
+        self._latest = 0            # latest arrival seen; later ones can't come before it
+        self._pending = deque()     # added but not yet admitted
+        self._ready = deque() if self.algorithm == "Round Robin" else []
+        self._admitted = 0          # admission sequence number, breaks ties like workload order
+        self._epoch = 0
+        self._current = None        # preemptive: (sequence, process) on the CPU
+        self._slice_start = 0
+        self._requeue = None        # Round Robin: process waiting to rejoin behind new arrivals
+
+    def __len__(self):
+        """Processes added but not yet returned."""
+        running = self._current is not None or self._requeue is not None
+        return len(self._pending) + len(self._ready) + running
+
+    def add(self, pid, arrival, burst, priority=0):
+        """Feed the next process of the stream; returns the processes now complete."""
+        if self.finished:
+            raise ValueError("The stream has already finished.")
+        if arrival < self._latest:
+            raise ValueError(f"Process {pid} arrives at {arrival}, before an earlier process at "
+                             f"{self._latest}; the stream must be in arrival order.")
+        self._latest = arrival
+        self._pending.append(Process(pid, arrival, burst, priority))
+        self.added += 1
+        return self._advance(False)
+
+    def finish(self):
+        """End the stream; returns every process still to complete."""
+        self.finished = True
+        return self._advance(True)
+
+    def _run_fcfs(self, final):
+        done = []
+        time = self.time
+        pending = self._pending
+        while pending:
+            p = pending.popleft()
+            if time < p.arrival_time:
+                time = p.arrival_time
+            p.start_time = time
+            time += p.burst_time
+            _complete(p, time, done)
+        self.time = time
+        return done
+
+    def _run_nonpreemptive(self, final):
+        done = []
+        time = self.time
+        pending, ready, key = self._pending, self._ready, self._key
+        while True:
+            # Arrivals up to now join the next dispatch's admission epoch
+            while pending and pending[0].arrival_time <= time:
+                p = pending.popleft()
+                heapq.heappush(ready, (key(p), self._epoch + 1, self._admitted, p))
+                self._admitted += 1
+            # Dispatching at `time` must wait until nothing more can arrive by then
+            if not final and time >= self._latest:
+                break
+            if ready:
+                self._epoch += 1
+                p = heapq.heappop(ready)[3]
+                p.start_time = time
+                time += p.burst_time
+                _complete(p, time, done)
+            elif pending:
+                time = pending[0].arrival_time
+            else:
+                break
+        self.time = time
+        return done
+
+    def _run_rr(self, final):
+        done = []
+        time = self.time
+        pending, queue, quantum = self._pending, self._ready, self.params['quantum']
+        while True:
+            while pending and pending[0].arrival_time <= time:
+                queue.append(pending.popleft())
+            if self._requeue is not None:
+                # A preempted process rejoins behind everything that arrived during its slice
+                if not final and time >= self._latest:
+                    break
+                queue.append(self._requeue)
+                self._requeue = None
+            if queue:
+                p = queue.popleft()
+                if p.start_time == -1:
+                    p.start_time = time
+                if p.remaining_time <= quantum:
+                    time += p.remaining_time
+                    _complete(p, time, done)
+                else:
+                    time += quantum
+                    p.remaining_time -= quantum
+                    self._requeue = p
+            elif pending:
+                time = pending[0].arrival_time
+            else:
+                break
+        self.time = time
+        return done
+
+    def _admit_preemptive(self, time):
+        pending, ready, key = self._pending, self._ready, self._key
+        while pending and pending[0].arrival_time <= time:
+            p = pending.popleft()
+            heapq.heappush(ready, (key(p), p.arrival_time, self._admitted, p))
+            self._admitted += 1
+
+    def _run_preemptive(self, final):
+        done = []
+        time = self.time
+        pending, ready, key = self._pending, self._ready, self._key
+        current = self._current
+        while True:
+            if current is None:
+                if ready:
+                    dispatch = time
+                elif pending:
+                    dispatch = max(time, pending[0].arrival_time)
+                else:
+                    break
+                if not final and dispatch >= self._latest:
+                    break
+                time = dispatch
+                self._admit_preemptive(time)
+                _, _, seq, p = heapq.heappop(ready)
+                current = (seq, p)
+                if p.start_time == -1:
+                    p.start_time = time
+                self._slice_start = time
+
+            seq, p = current
+            finish = time + p.remaining_time
+            if pending:
+                next_arrival = pending[0].arrival_time
+            elif final or finish <= self._latest:
+                next_arrival = finish
+            else:
+                break
+            if finish <= next_arrival:
+                time = finish
+                _complete(p, time, done)
+                current = None
+                continue
+            if not final and next_arrival >= self._latest:
+                break
+
+            p.remaining_time -= next_arrival - time
+            time = next_arrival
+            self._admit_preemptive(time)
+            if ready[0][0] < key(p):
+                heapq.heappush(ready, (key(p), p.arrival_time, seq, p))
+                _, _, seq, p = heapq.heappop(ready)
+                current = (seq, p)
+                if p.start_time == -1:
+                    p.start_time = time
+                self._slice_start = time
+        self._current = current
+        self.time = time
+        return done
+
+
+# Algorithm -> OnlineScheduler method that advances it
+ADVANCE = {
+    "FCFS": '_run_fcfs',
+    "SJF": '_run_nonpreemptive',
+    "Priority": '_run_nonpreemptive',
+    "Round Robin": '_run_rr',
+    "SRTF": '_run_preemptive',
+    "Preemptive Priority": '_run_preemptive',
+}
+
+
+def stream(algorithm, arrivals, **params):
+    """Yield completed processes as ``arrivals`` is consumed.
+
+    ``arrivals`` yields ``Process`` objects or ``(pid, arrival, burst[,
+    priority])`` tuples in arrival order, and may be unbounded.
+    """
+    scheduler = OnlineScheduler(algorithm, **params)
+    for record in arrivals:
+        yield from scheduler.add(*_fields(record))
+    yield from scheduler.finish()
+
+
+async def astream(algorithm, arrivals, **params):
+    """``stream`` over an async iterator (a socket reader, a queue consumer...)."""
+    scheduler = OnlineScheduler(algorithm, **params)
+    async for record in arrivals:
+        for p in scheduler.add(*_fields(record)):
+            yield p
+    for p in scheduler.finish():
+        yield p
+
+
+class RollingMetrics:
+    """TAT/WT/RT averages over recent completions, plus running totals.
+
+    The window holds the last ``window`` completions and, with ``span``,
+    only those that completed within ``span`` time units of the latest one.
+    """
+
+    def __init__(self, window=1000, span=None):
+        if window < 1:
+            raise ValueError("The window must hold at least one completion.")
+        if span is not None and span <= 0:
+            raise ValueError("The span must be positive.")
+        self.window = window
+        self.span = span
+        self.count = 0
+        self.clock = 0
+        self._recent = deque()  # (completion, TAT, WT, RT)
+        self._sums = [0, 0, 0]
+        self._totals = [0, 0, 0]
+
+    def add(self, p):
+        """Count one completed process."""
+        tat = p.completion_time - p.arrival_time
+        values = (tat, tat - p.burst_time, p.start_time - p.arrival_time)
+        self._recent.append((p.completion_time,) + values)
+        for k, value in enumerate(values):
+            self._sums[k] += value
+            self._totals[k] += value
+        self.count += 1
+        self.clock = max(self.clock, p.completion_time)
+
+        recent = self._recent
+        while recent and (len(recent) > self.window
+                          or (self.span is not None and recent[0][0] <= self.clock - self.span)):
+            for k, value in enumerate(recent.popleft()[1:]):
+                self._sums[k] -= value
+
+    def metrics(self):
+        """Window averages as ``TAT``/``WT``/``RT`` and overall ones as ``TAT_all``/..."""
+        n = len(self._recent)
+        metrics = {'count': self.count, 'window': n, 'clock': self.clock}
+        for name, total, overall in zip(('TAT', 'WT', 'RT'), self._sums, self._totals):
+            metrics[name] = total / n if n else 0.0
+            metrics[f'{name}_all'] = overall / self.count if self.count else 0.0
+        return metrics
@@ -0,0 +1,164 @@
+"""Fan algorithm comparisons out over a process pool.
+
+The workload is copied once into a ``multiprocessing.shared_memory`` block
+(PID, arrival, burst and priority columns plus the precomputed arrival order)
+and each task receives only the block's name, so nothing workload-sized is
+pickled per task. Workers map the block as a read-only ``Workload`` and send
+back just the metrics dict.
+"""
+
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing.shared_memory import SharedMemory
+
+from .engine import ALGORITHMS, _scaled, resolve_algorithm, simulate
+from .workload import Workload, as_workload
+
+# Below this many processes a pool round-trip costs more than it saves.
+MIN_PARALLEL = 20000
+# How often a caller waiting on the pool reports progress (and so notices a cancel)
+POLL_INTERVAL = 0.1
+
+_COLUMNS = 5
+
+
+class SharedWorkload:
+    """Context manager owning a shared-memory copy of a workload."""
+
+    def __init__(self, workload):
+        workload = as_workload(workload)
+        self.n = len(workload)
+        self.shm = SharedMemory(create=True, size=max(1, _COLUMNS * self.n * 8))
+        columns = (workload.pid, workload.arrival, workload.burst, workload.priority,
+                   workload.arrival_order())
+        view = self.shm.buf.cast('q')
+        for k, column in enumerate(columns):
+            view[k * self.n:(k + 1) * self.n] = memoryview(column).cast('B').cast('q')
+        view.release()
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def attach(name, n):
+    """Map a ``SharedWorkload`` by name; returns ``(shm, workload)``.
+
+    The caller must drop every reference to the workload before
+    ``shm.close()``.
+    """
+    shm = SharedMemory(name=name)
+    size = n * 8
+    columns = [shm.buf[k * size:(k + 1) * size] for k in range(_COLUMNS)]
+    return shm, Workload.from_buffers(*columns)
+
+
+def _run_shared(name, n, algorithm, params):
+    shm, workload = attach(name, n)
+    try:
+        return simulate(algorithm, workload, **params).metrics()
+    finally:
+        del workload
+        shm.close()
+
+
+def gather(futures, progress=None):
+    """Results of ``futures`` in order, reporting how many have finished.
+
+    If a task fails or ``progress`` raises, the futures not yet started are
+    cancelled before the exception propagates.
+    """
+    try:
+        if progress is not None:
+            pending = set(futures)
+            while pending:
+                progress(len(futures) - len(pending), len(futures))
+                _, pending = wait(pending, timeout=POLL_INTERVAL, return_when=FIRST_COMPLETED)
+        return [future.result() for future in futures]
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
+
+
+def _tasks(algorithms, quanta, params):
+    """Expand the algorithm list into ``(label, algorithm, params)`` tasks."""
+    # A repeated quantum would repeat its label, and results are keyed by label
+    quanta = list(dict.fromkeys(quanta or ()))
+    for name in map(resolve_algorithm, algorithms):
+        _, accepted = ALGORITHMS[name]
+        if 'quantum' in accepted and quanta:
+            for quantum in quanta:
+                label = name if len(quanta) == 1 else f"{name} (q={quantum})"
+                yield label, name, dict(params, quantum=quantum)
+        else:
+            yield name, name, params
+
+
+def compare_parallel(processes, algorithms=None, quanta=None, executor=None,
+                     max_workers=None, min_parallel=MIN_PARALLEL, progress=None, cache=None, **params):
+    """Like ``engine.compare`` but runs each algorithm in its own process.
+
+    ``quanta`` (a list) expands every quantum-taking algorithm into one run
+    per quantum; ``'auto'`` uses the quantum picked by
+    ``tuning.tune_quantum``. Pass ``executor`` to reuse a long-lived pool;
+    otherwise one is created for the call. Workloads smaller than
+    ``min_parallel`` run in-process, where the pool round-trip would
+    dominate. ``progress`` counts in runs; a run already started in a worker
+    finishes even if ``progress`` raises, but no further runs start. With a
+    ``cache.ScheduleCache``, only runs it has no metrics for are simulated.
+    """
+    workload = as_workload(processes)
+    if not len(workload):
+        raise ValueError("No processes to schedule!")
+    if quanta == 'auto':
+        from .tuning import tune_quantum
+        quanta = [tune_quantum(workload, executor=executor, max_workers=max_workers,
+                               min_parallel=min_parallel, progress=progress)]
+    tasks = list(_tasks(algorithms or ALGORITHMS, list(quanta or ()), params))
+
+    cached = {}
+    if cache is not None:
+        for label, name, task_params in tasks:
+            metrics = cache.lookup_metrics(name, workload, task_params)
+            if metrics is not None:
+                cached[label] = metrics
+    todo = [task for task in tasks if task[0] not in cached]
+
+    if not todo:
+        results = []
+    elif len(workload) < min_parallel:
+        results = [(label, simulate(name, workload, progress=_scaled(progress, k, len(todo)),
+                                    **task_params).metrics())
+                   for k, (label, name, task_params) in enumerate(todo)]
+    else:
+        own_executor = executor is None
+        if own_executor:
+            executor = ProcessPoolExecutor(max_workers=max_workers or min(len(todo), os.cpu_count() or 1))
+        try:
+            with SharedWorkload(workload) as shared:
+                futures = [executor.submit(_run_shared, shared.name, shared.n, name, task_params)
+                           for _, name, task_params in todo]
+                results = list(zip([label for label, _, _ in todo], gather(futures, progress)))
+        finally:
+            if own_executor:
+                executor.shutdown()
+
+    if cache is not None:
+        for (_, name, task_params), (_, metrics) in zip(todo, results):
+            cache.store_metrics(name, workload, task_params, metrics)
+        computed = dict(results)
+        results = [(label, cached[label] if label in cached else computed[label]) for label, _, _ in tasks]
+
+    best = min(results, key=lambda x: x[1]['WT'])[0]
+    return results, best
@@ -0,0 +1,471 @@
+"""Local HTTP/JSON scheduling service.
+
+    python -m process_scheduler serve --port 8080
+
+One asyncio server owns a process pool and a ``ScheduleCache``, so every
+client shares the same warm cache. Endpoints:
+
+    GET  /algorithms  names, aliases and accepted parameters
+    GET  /stats       cache size, queue depth and request counters
+    POST /simulate    {"algorithm": "sjf", "processes": [...], "params": {...},
+                       "schedule": false}  ->  {"algorithm", "metrics"[, "schedule"]}
+    POST /compare     {"processes": [...], "algorithms": [...], "quanta": [2, 4],
+                       "params": {...}}  ->  {"results": [{"algorithm", "metrics"}], "best", "skipped"}
+
+``processes`` is a list of ``{"pid", "arrival", "burst", "priority"}``
+objects (the same spellings the JSON Lines loader accepts), or a
+``"columns"`` object of equal-length lists can be sent instead. Records are
+validated like ``add_process``. A bad one is a 400 whose message numbers
+it from 1, as a "line", like the file loaders do. With ``"cpus"`` above 1,
+``/compare`` leaves out the algorithms that have no multi-CPU model and
+lists them under ``"skipped"``, as ``run --cpus`` does.
+
+Runs already in the cache are answered without touching the pool, and
+identical runs in flight at the same time share one simulation. The rest
+go through a bounded queue: when it is full the server answers 503 with
+``Retry-After`` rather than buffering without limit, and a request needing
+more runs than the queue holds is a 400. Small runs are taken
+off the queue in batches, so one pool round-trip serves many of them;
+workloads of ``MIN_PARALLEL`` processes or more reach the workers through
+shared memory instead of being pickled.
+
+The server binds to 127.0.0.1 by default. It has no authentication, so
+only bind it elsewhere on a trusted network.
+"""
+
+import asyncio
+import json
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from multiprocessing import resource_tracker
+
+from .cache import ScheduleCache
+from .engine import ALGORITHMS, ALIASES, resolve_algorithm, resolve_params, simulate
+from .multicore import SUPPORTED
+from .parallel import MIN_PARALLEL, SharedWorkload, _tasks, attach
+from .workload import Workload
+from .workload_io import ALIASES as FIELD_ALIASES
+from .workload_io import FIELDS, WorkloadError, _check_columns, _check_unique, _to_int
+
+QUEUE_SIZE = 256
+BATCH_SIZE = 32
+# A batch stops growing once it holds this many processes in total
+BATCH_PROCESSES = MIN_PARALLEL
+MAX_BODY = 64 * 1024 * 1024
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message, headers=()):
+        super().__init__(message)
+        self.status = status
+        self.headers = dict(headers)
+
+
+def _run_batch(tasks):
+    """Worker side: ``[(source, algorithm, params, with_schedule)]`` -> one result per task.
+
+    ``source`` is a ``Workload`` or the ``(name, n)`` of a ``SharedWorkload``.
+    A rejected run yields its error message instead of failing the batch.
+    """
+    results = []
+    for source, algorithm, params, with_schedule in tasks:
+        shm = schedule = None
+        if isinstance(source, tuple):
+            shm, source = attach(*source)
+        try:
+            schedule = simulate(algorithm, source, **params)
+            result = {'metrics': schedule.metrics()}
+            if with_schedule:
+                result['schedule'] = {'pid': source.pid.tolist(), 'start': schedule.start.tolist(),
+                                      'completion': schedule.completion.tolist()}
+            results.append(result)
+        except ValueError as e:
+            results.append(str(e))
+        finally:
+            if shm is not None:
+                source = schedule = None
+                shm.close()
+    return results
+
+
+def _column(values, name):
+    if bool not in set(map(type, values)):
+        try:
+            return array('q', values)
+        except (TypeError, OverflowError):
+            pass
+    return array('q', [_to_int(value, name, k) for k, value in enumerate(values, 1)])
+
+
+def _positive_ints(values, name):
+    if not isinstance(values, list) or any(type(v) is not int or v <= 0 for v in values):
+        raise ValueError(f"{name!r} must be a list of positive integers.")
+    return values
+
+
+def _strings(values, name):
+    if not isinstance(values, list) or any(not isinstance(v, str) for v in values):
+        raise ValueError(f"{name!r} must be a list of algorithm names.")
+    return values
+
+
+def parse_params(body):
+    """The ``params`` object of a request body, with the type of every known parameter checked."""
+    params = body.get('params', {})
+    if not isinstance(params, dict):
+        raise ValueError("'params' must be an object.")
+    for key in ('quantum', 'cpus'):
+        value = params.get(key, 1)
+        if type(value) is not int or value <= 0:
+            raise ValueError(f"{key!r} must be a positive integer.")
+    boost = params.get('boost_interval')
+    if boost is not None and (type(boost) is not int or boost < 0):
+        raise ValueError("'boost_interval' must be a non-negative integer or null.")
+    for key in ('lower_is_higher', 'steal'):
+        if not isinstance(params.get(key, False), bool):
+            raise ValueError(f"{key!r} must be true or false.")
+    for key in ('queues', 'placement'):
+        if not isinstance(params.get(key, ''), str):
+            raise ValueError(f"{key!r} must be a string.")
+    if 'level_quanta' in params:
+        _positive_ints(params['level_quanta'], 'level_quanta')
+    return params
+
+
+def parse_workload(body):
+    """Build and validate the workload of a request body."""
+    columns = body.get('columns')
+    if columns is not None:
+        if not isinstance(columns, dict) or not isinstance(columns.get('pid'), list):
+            raise WorkloadError("'columns' must be an object of lists.")
+        n = len(columns['pid'])
+        values = [columns.get(name, [0] * n if name == 'priority' else None) for name in FIELDS]
+        if any(not isinstance(column, list) or len(column) != n for column in values):
+            raise WorkloadError("'columns' needs pid, arrival and burst lists (and optionally priority) "
+                                "of the same length.")
+    else:
+        records = body.get('processes')
+        if not isinstance(records, list):
+            raise WorkloadError("Expected 'processes' (a list) or 'columns'.")
+        normalized = []
+        for k, record in enumerate(records, 1):
+            if not isinstance(record, dict):
+                raise WorkloadError("each process must be an object.", k)
+            record = {FIELD_ALIASES.get(key, key): value for key, value in record.items()}
+            for name in FIELDS[:3]:
+                if name not in record:
+                    raise WorkloadError(f"missing field {name!r}.", k)
+            normalized.append(record)
+        values = [[record.get(name, 0) for record in normalized] for name in FIELDS]
+
+    workload = Workload(*(_column(column, name) for column, name in zip(values, FIELDS)))
+    if not len(workload):
+        raise WorkloadError("No processes to schedule!")
+    _check_columns(workload.pid, workload.arrival, workload.burst, workload.priority, (1).__add__)
+    _check_unique(workload, 0)
+    return workload
+
+
+class _Run:
+    __slots__ = ('source', 'algorithm', 'params', 'with_schedule', 'size', 'future')
+
+    def __init__(self, source, algorithm, params, with_schedule, size, future):
+        self.source = source
+        self.algorithm = algorithm
+        self.params = params
+        self.with_schedule = with_schedule
+        self.size = size
+        self.future = future
+
+
+class SchedulerService:
+    """The server's shared state: pool, cache, run queue and in-flight runs."""
+
+    def __init__(self, workers=None, cache=None, queue_size=QUEUE_SIZE, batch_size=BATCH_SIZE,
+                 max_body=MAX_BODY):
+        if queue_size < 1 or batch_size < 1:
+            raise ValueError("The queue and batch sizes must be positive.")
+        self.workers = workers or os.cpu_count() or 1
+        # Workers must inherit the tracker the shared workloads are registered
+        # with; one they start themselves would warn about them on exit
+        resource_tracker.ensure_running()
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        self.cache = cache if cache is not None else ScheduleCache()
+        self.queue = asyncio.Queue(queue_size)
+        self.batch_size = batch_size
+        self.max_body = max_body
+        self.in_flight = {}
+        self.counters = {'requests': 0, 'runs': 0, 'cache_hits': 0, 'shared_runs': 0, 'batches': 0,
+                         'rejected': 0}
+        self._slots = asyncio.Semaphore(self.workers)
+        self._dispatcher = None
+        self._batches = set()
+        self._connections = {}
+
+    async def start(self, host='127.0.0.1', port=8080):
+        # Fork the workers before there are sockets to inherit: a worker
+        # holding a client connection keeps it open after the server closes it
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self.pool, os.getpid) for _ in range(self.workers)))
+        self._dispatcher = asyncio.create_task(self._dispatch())
+        return await asyncio.start_server(self._handle, host, port)
+
+    async def close(self):
+        """Drop the connections, fail queued runs and wait for running ones."""
+        for writer in self._connections.values():
+            writer.close()
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+        while not self.queue.empty():
+            run = self.queue.get_nowait()
+            run.future.set_exception(HTTPError(HTTPStatus.SERVICE_UNAVAILABLE, "The server is shutting down."))
+        await asyncio.gather(*self._batches, *self._connections, return_exceptions=True)
+        self.pool.shutdown()
+
+    # Runs
+
+    def _lookup(self, workload, algorithm, params, with_schedule):
+        """A future for a run the cache or a run in flight can answer, or ``None``."""
+        if not with_schedule:
+            metrics = self.cache.lookup_metrics(algorithm, workload, params)
+            if metrics is not None:
+                self.counters['cache_hits'] += 1
+                future = asyncio.get_running_loop().create_future()
+                future.set_result({'metrics': metrics})
+                return future
+        future = self.in_flight.get(self.cache.key(algorithm, workload, params) + (with_schedule,))
+        if future is not None:
+            self.counters['shared_runs'] += 1
+        return future
+
+    def _enqueue(self, workload, source, algorithm, params, with_schedule):
+        key = self.cache.key(algorithm, workload, params) + (with_schedule,)
+        if key in self.in_flight:
+            return self.in_flight[key]
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait(_Run(source, algorithm, params, with_schedule, len(workload), future))
+        self.in_flight[key] = future
+        self.counters['runs'] += 1
+
+        def done(future):
+            del self.in_flight[key]
+            if future.exception() is None and isinstance(future.result(), dict):
+                self.cache.store_metrics(algorithm, workload, params, future.result()['metrics'])
+        future.add_done_callback(done)
+        return future
+
+    async def run(self, workload, tasks, with_schedule=False):
+        """Results of ``[(label, algorithm, params)]`` on ``workload``, in order.
+
+        A result is a dict with ``metrics`` (and ``schedule`` if asked for),
+        or the message of the ``ValueError`` the run raised.
+        """
+        futures = [self._lookup(workload, algorithm, params, with_schedule) for _, algorithm, params in tasks]
+        pending = [k for k, future in enumerate(futures) if future is None]
+        if len(pending) > self.queue.maxsize:
+            # Would never fit, however long the client waited
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"This request needs {len(pending)} runs; the server "
+                            f"queues at most {self.queue.maxsize} at once.")
+        if self.queue.maxsize - self.queue.qsize() < len(pending):
+            self.counters['rejected'] += 1
+            raise HTTPError(HTTPStatus.SERVICE_UNAVAILABLE, "The server is busy; retry shortly.",
+                            {'Retry-After': '1'})
+        shared = SharedWorkload(workload) if pending and len(workload) >= MIN_PARALLEL else None
+        try:
+            source = (shared.name, shared.n) if shared is not None else workload
+            for k in pending:
+                _, algorithm, params = tasks[k]
+                futures[k] = self._enqueue(workload, source, algorithm, params, with_schedule)
+            # Shielded, so a cancelled request can't cancel runs other requests share;
+            # and every run finishes before the shared memory goes away
+            results = await asyncio.gather(*map(asyncio.shield, futures), return_exceptions=True)
+        finally:
+            if shared is not None:
+                shared.close()
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+    async def _dispatch(self):
+        """Move queued runs into the pool in batches, at most one batch per worker."""
+        while True:
+            await self._slots.acquire()
+            batch = [await self.queue.get()]
+            size = batch[0].size
+            while len(batch) < self.batch_size and size < BATCH_PROCESSES and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+                size += batch[-1].size
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, batch):
+        loop = asyncio.get_running_loop()
+        self.counters['batches'] += 1
+        try:
+            results = await loop.run_in_executor(
+                self.pool, _run_batch, [(run.source, run.algorithm, run.params, run.with_schedule) for run in batch])
+        except Exception as e:
+            for run in batch:
+                if not run.future.done():
+                    run.future.set_exception(e)
+        else:
+            for run, result in zip(batch, results):
+                if not run.future.done():
+                    run.future.set_result(result)
+        finally:
+            self._slots.release()
+
+    # HTTP
+
+    async def _handle(self, reader, writer):
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        try:
+            while True:
+                request = None
+                try:
+                    request = await self._read_request(reader)
+                    if request is None:
+                        break
+                    method, path, headers, body = request
+                    self.counters['requests'] += 1
+                    status, payload, extra = HTTPStatus.OK, await self._route(method, path, body), {}
+                except HTTPError as e:
+                    status, payload, extra = e.status, {'error': str(e)}, e.headers
+                except Exception as e:
+                    status, payload, extra = HTTPStatus.INTERNAL_SERVER_ERROR, {'error': str(e)}, {}
+                # After a request that couldn't be read, the stream position is unknown
+                keep_alive = (request is not None and request[2].get('connection', '').lower() != 'close'
+                              and status != HTTPStatus.INTERNAL_SERVER_ERROR)
+                await self._respond(writer, status, payload, extra, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            del self._connections[task]
+            writer.close()
+
+    async def _read_request(self, reader):
+        line = await reader.readline()
+        if not line.strip():
+            return None
+        try:
+            method, path, _ = line.decode('latin-1').split()
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed request line.") from None
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get('content-length', 0))
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length.") from None
+        if length > self.max_body:
+            raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"Bodies are limited to {self.max_body} bytes.")
+        body = await reader.readexactly(length) if length else b''
+        return method, path.split('?', 1)[0], headers, body
+
+    async def _respond(self, writer, status, payload, extra, keep_alive):
+        body = json.dumps(payload).encode()
+        head = [f"HTTP/1.1 {status.value} {status.phrase}", "Content-Type: application/json",
+                f"Content-Length: {len(body)}", f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        head += [f"{name}: {value}" for name, value in extra.items()]
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode('latin-1') + body)
+        await writer.drain()
+
+    async def _route(self, method, path, body):
+        routes = {
+            ('GET', '/algorithms'): self._algorithms,
+            ('GET', '/stats'): self._stats,
+            ('POST', '/simulate'): self._simulate,
+            ('POST', '/compare'): self._compare,
+        }
+        handler = routes.get((method, path))
+        if handler is None:
+            if any(route_path == path for _, route_path in routes):
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, f"{method} is not allowed on {path}.")
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"No such endpoint: {path}")
+        if method == 'GET':
+            return handler()
+        try:
+            request = json.loads(body)
+        except ValueError as e:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Invalid JSON: {e}") from None
+        if not isinstance(request, dict):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "The request body must be a JSON object.")
+        try:
+            return await handler(request)
+        except (ValueError, TypeError) as e:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, str(e)) from None
+
+    def _algorithms(self):
+        aliases = {name: alias for alias, name in ALIASES.items()}
+        return {'algorithms': [{'name': name, 'alias': aliases.get(name), 'params': list(accepted)}
+                               for name, (_, accepted) in ALGORITHMS.items()]}
+
+    def _stats(self):
+        return dict(self.counters, queued=self.queue.qsize(), in_flight=len(self.in_flight),
+                    workers=self.workers, cache_entries=len(self.cache), cache_bytes=self.cache.nbytes)
+
+    async def _simulate(self, request):
+        workload = parse_workload(request)
+        params = parse_params(request)
+        algorithm = request.get('algorithm', '')
+        if not isinstance(algorithm, str):
+            raise ValueError("'algorithm' must be an algorithm name.")
+        name, _ = resolve_params(algorithm, params)
+        result, = await self.run(workload, [(name, name, params)], bool(request.get('schedule')))
+        if isinstance(result, str):
+            raise ValueError(result)
+        return dict(result, algorithm=name)
+
+    async def _compare(self, request):
+        workload = parse_workload(request)
+        params = parse_params(request)
+        algorithms = [resolve_algorithm(name) for name in _strings(request.get('algorithms') or list(ALGORITHMS),
+                                                                   'algorithms')]
+        skipped = []
+        if params.get('cpus', 1) > 1:
+            skipped = [name for name in algorithms if name not in SUPPORTED]
+            algorithms = [name for name in algorithms if name in SUPPORTED]
+            if not algorithms:
+                raise ValueError("None of the requested algorithms can run on more than one CPU.")
+        tasks = list(_tasks(algorithms, _positive_ints(request.get('quanta', []), 'quanta'), params))
+        for _, name, task_params in tasks:
+            resolve_params(name, task_params)
+        results = []
+        for (label, _, _), result in zip(tasks, await self.run(workload, tasks)):
+            if isinstance(result, str):
+                raise ValueError(f"{label}: {result}")
+            results.append({'algorithm': label, 'metrics': result['metrics']})
+        best = min(results, key=lambda record: record['metrics']['WT'])['algorithm']
+        return {'results': results, 'best': best, 'skipped': skipped}
+
+
+async def _serve(host, port, **options):
+    service = SchedulerService(**options)
+    server = await service.start(host, port)
+    try:
+        address = server.sockets[0].getsockname()
+        print(f"Serving on http://{address[0]}:{address[1]}", flush=True)
+        await server.serve_forever()
+    finally:
+        server.close()
+        await service.close()
+
+
+def serve(host='127.0.0.1', port=8080, **options):
+    """Run the service until interrupted."""
+    try:
+        asyncio.run(_serve(host, port, **options))
+    except KeyboardInterrupt:
+        pass
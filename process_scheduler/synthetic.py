@@ -0,0 +1,191 @@
+"""Seeded synthetic workloads for large-scale runs and benchmarks.
+
+``generate_workload`` draws arrival times, bursts and priorities from a few
+standard models and appends them to a ``Workload``:
+
+arrivals
+    ``poisson``  exponential gaps at a constant rate
+    ``bursty``   Poisson batches whose sizes are geometric with mean ``batch``;
+                 a batch arrives all at once
+    ``diurnal``  Poisson with rate ``rate * (1 + amplitude * sin(2 pi t / period))``,
+                 sampled by thinning
+bursts
+    ``exponential``  mean ``mean_burst``
+    ``pareto``       heavy-tailed with shape ``alpha`` (> 1), mean ``mean_burst``
+    ``bimodal``      a ``short_fraction`` of short jobs, the rest ``spread`` times
+                     longer on average; mean ``mean_burst`` overall
+priorities
+    ``uniform``  0 .. levels - 1 equally likely
+    ``skewed``   each level half as likely as the one before (0 most common)
+    ``constant`` all 0
+
+The arrival rate defaults to the one that keeps ``cpus`` CPUs busy a
+``load`` fraction of the time. Bursts are rounded to whole time units, at
+least 1 and at most ``max_burst``.
+
+With NumPy every column is drawn in one vectorized call; without it the same
+models are sampled one process at a time. The two draw from different random
+streams, so a seed reproduces a workload only under the same one.
+"""
+
+import math
+import random
+from array import array
+
+from ._optional import numpy
+from .workload import Workload
+
+ARRIVALS = ('poisson', 'bursty', 'diurnal')
+BURSTS = ('exponential', 'pareto', 'bimodal')
+PRIORITIES = ('uniform', 'skewed', 'constant')
+
+
+class _Model:
+    """Validated parameters, with the arrival rate and diurnal period resolved."""
+
+    def __init__(self, n, arrivals, bursts, priorities, mean_burst, load, cpus, rate, batch,
+                 amplitude, period, alpha, short_fraction, spread, levels, max_burst):
+        for kind, choices, what in ((arrivals, ARRIVALS, "arrival"), (bursts, BURSTS, "burst"),
+                                    (priorities, PRIORITIES, "priority")):
+            if kind not in choices:
+                raise ValueError(f"Unknown {what} distribution {kind!r}; expected one of {', '.join(choices)}.")
+        if n < 0:
+            raise ValueError("The number of processes must be non-negative.")
+        if mean_burst < 1:
+            raise ValueError("The mean burst must be at least 1.")
+        if rate is None:
+            if load <= 0 or cpus < 1:
+                raise ValueError("Load and the number of CPUs must be positive.")
+            rate = load * cpus / mean_burst
+        if rate <= 0:
+            raise ValueError("The arrival rate must be positive.")
+        if batch < 1:
+            raise ValueError("The mean batch size must be at least 1.")
+        if not 0 <= amplitude <= 1:
+            raise ValueError("The diurnal amplitude must be between 0 and 1.")
+        if alpha <= 1:
+            raise ValueError("The Pareto shape must be greater than 1 for the mean to exist.")
+        if not 0 < short_fraction <= 1 or spread < 1:
+            raise ValueError("Bimodal bursts need 0 < short_fraction <= 1 and spread >= 1.")
+        if levels < 1 or max_burst < 1:
+            raise ValueError("Priority levels and the burst cap must be positive.")
+        self.n = n
+        self.arrivals, self.bursts, self.priorities = arrivals, bursts, priorities
+        self.mean_burst, self.rate, self.batch = mean_burst, rate, batch
+        # By default the trace spans four periods
+        self.amplitude, self.period = amplitude, period or max(n, 1) / rate / 4
+        self.alpha, self.levels, self.max_burst = alpha, levels, max_burst
+        self.short_fraction = short_fraction
+        self.short_mean = mean_burst / (short_fraction + (1 - short_fraction) * spread)
+        self.long_mean = self.short_mean * spread
+        self.pareto_scale = mean_burst * (alpha - 1) / alpha
+
+
+def _numpy_arrivals(np, rng, m):
+    n = m.n
+    if m.arrivals == 'poisson':
+        times = np.cumsum(rng.exponential(1 / m.rate, n))
+    elif m.arrivals == 'bursty':
+        p = 1 / m.batch
+        sizes = rng.geometric(p, int(n / m.batch) + 16)
+        while sizes.sum() < n:
+            sizes = np.concatenate((sizes, rng.geometric(p, int(n / m.batch / 4) + 16)))
+        starts = np.cumsum(rng.exponential(m.batch / m.rate, len(sizes)))
+        times = np.repeat(starts, sizes)[:n]
+    else:
+        peak = m.rate * (1 + m.amplitude)
+        chunks, found, clock = [np.empty(0)], 0, 0.0
+        while found < n:
+            candidates = clock + np.cumsum(rng.exponential(1 / peak, int((n - found) * (1 + m.amplitude)) + 64))
+            clock = candidates[-1]
+            accept = rng.random(len(candidates)) * (1 + m.amplitude) < (
+                1 + m.amplitude * np.sin(2 * np.pi / m.period * candidates))
+            chunks.append(candidates[accept])
+            found += len(chunks[-1])
+        times = np.concatenate(chunks)[:n]
+    return np.floor(times)
+
+
+def _numpy_bursts(np, rng, m):
+    n = m.n
+    if m.bursts == 'exponential':
+        bursts = rng.exponential(m.mean_burst, n)
+    elif m.bursts == 'pareto':
+        bursts = m.pareto_scale * (1 + rng.pareto(m.alpha, n))
+    else:
+        bursts = rng.exponential(1.0, n) * np.where(rng.random(n) < m.short_fraction, m.short_mean, m.long_mean)
+    return np.clip(np.rint(bursts), 1, m.max_burst)
+
+
+def _numpy_priorities(np, rng, m):
+    if m.priorities == 'uniform':
+        return rng.integers(0, m.levels, m.n)
+    if m.priorities == 'skewed':
+        return np.minimum(rng.geometric(0.5, m.n) - 1, m.levels - 1)
+    return np.zeros(m.n, dtype=np.int64)
+
+
+def _numpy_columns(np, m, seed):
+    rng = np.random.default_rng(seed)
+    return [array('q', np.ascontiguousarray(column, dtype=np.int64).tobytes())
+            for column in (_numpy_arrivals(np, rng, m), _numpy_bursts(np, rng, m), _numpy_priorities(np, rng, m))]
+
+
+def _geometric(rng, p):
+    """Trials up to and including the first success (>= 1)."""
+    return 1 if p >= 1 else int(math.log(1 - rng.random()) / math.log(1 - p)) + 1
+
+
+def _python_columns(m, seed):
+    rng = random.Random(seed)
+    arrival, burst, priority = array('q'), array('q'), array('q')
+    clock, left = 0.0, 0
+    peak = m.rate * (1 + m.amplitude)
+    for _ in range(m.n):
+        if m.arrivals == 'poisson':
+            clock += rng.expovariate(m.rate)
+        elif m.arrivals == 'bursty':
+            if not left:
+                clock += rng.expovariate(m.rate / m.batch)
+                left = _geometric(rng, 1 / m.batch)
+            left -= 1
+        else:
+            while True:
+                clock += rng.expovariate(peak)
+                if rng.random() * (1 + m.amplitude) < 1 + m.amplitude * math.sin(2 * math.pi / m.period * clock):
+                    break
+        arrival.append(math.floor(clock))
+
+        if m.bursts == 'exponential':
+            b = rng.expovariate(1 / m.mean_burst)
+        elif m.bursts == 'pareto':
+            b = m.pareto_scale * rng.paretovariate(m.alpha)
+        else:
+            b = rng.expovariate(1.0) * (m.short_mean if rng.random() < m.short_fraction else m.long_mean)
+        burst.append(int(min(max(round(b), 1), m.max_burst)))
+
+        if m.priorities == 'uniform':
+            priority.append(rng.randrange(m.levels))
+        elif m.priorities == 'skewed':
+            priority.append(min(_geometric(rng, 0.5) - 1, m.levels - 1))
+        else:
+            priority.append(0)
+    return arrival, burst, priority
+
+
+def generate_workload(n, seed=0, arrivals='poisson', bursts='exponential', priorities='uniform',
+                      mean_burst=10, load=0.9, cpus=1, rate=None, batch=8, amplitude=0.8, period=None,
+                      alpha=1.5, short_fraction=0.8, spread=20, levels=10, max_burst=10**9, into=None):
+    """``n`` synthetic processes, appended to ``into`` when given.
+
+    PIDs continue from the largest one already in ``into`` (or start at 1),
+    and arrivals are non-decreasing in PID order.
+    """
+    model = _Model(n, arrivals, bursts, priorities, mean_burst, load, cpus, rate, batch,
+                   amplitude, period, alpha, short_fraction, spread, levels, max_burst)
+    workload = into if into is not None else Workload()
+    first = max(workload.pid) + 1 if len(workload) else 1
+    np = numpy()
+    columns = _numpy_columns(np, model, seed) if np is not None else _python_columns(model, seed)
+    workload.extend(array('q', range(first, first + n)), *columns)
+    return workload
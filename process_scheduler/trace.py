@@ -0,0 +1,272 @@
+"""Binary schedule traces (``.pstr``) for revisiting a run without re-running it.
+
+A trace holds everything a ``Schedule`` does: the workload, each process's
+start and completion, the display order and the CPU slice log. Like
+``.pswl`` workloads it is a fixed header followed by contiguous
+little-endian int64 columns, so ``load_trace`` maps it and hands out
+zero-copy views: the metrics, the Gantt chart and ``np.frombuffer`` all
+read straight from the page cache.
+
+    header    magic ``PSTR``, version, flags, process count n, slice count s,
+              metadata length
+    metadata  UTF-8 JSON (algorithm, params, cpus, caller extras), padded to 8 bytes
+    columns   pid, arrival, burst, priority, start, completion (n each),
+              then order (n) with ``FLAG_ORDER``
+    slices    index, start, end (s each), then cpu (s) with ``FLAG_CPU``;
+              absent without ``FLAG_TIMELINE``
+
+``TraceWriter`` writes one as slices come in. Slice columns are spooled to
+temporary files next to the trace in ``CHUNK_SIZE`` blocks and copied in
+after the per-process columns on ``finish``, so memory stays bounded
+however long the log grows.
+"""
+
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+
+from ._optional import numpy
+from .engine import Schedule, Timeline
+from .multicore import CoreTimeline, MulticoreSchedule
+from .workload import Workload, as_workload
+
+MAGIC = b'PSTR'
+VERSION = 1
+HEADER = struct.Struct('<4sHHQQQ')
+CHUNK_SIZE = 65536
+
+FLAG_ORDER = 1
+FLAG_TIMELINE = 2
+FLAG_CPU = 4
+
+WORKLOAD_COLUMNS = ('pid', 'arrival', 'burst', 'priority')
+SLICE_COLUMNS = ('index', 'start', 'end', 'cpu')
+
+
+class TraceError(ValueError):
+    """A file that is not a readable trace."""
+
+
+def _little_endian(column):
+    if sys.byteorder != 'little':
+        column = array('q', column)
+        column.byteswap()
+    return memoryview(column).cast('B')
+
+
+class TraceWriter:
+    """Write a trace of a run on ``workload`` incrementally.
+
+    Call ``add_slices`` any number of times, then ``finish`` with the
+    per-process columns. ``cpus`` marks a multi-CPU run, whose slices carry
+    a CPU each. Used as a context manager, a trace left unfinished by an
+    exception is deleted.
+    """
+
+    def __init__(self, path, workload, algorithm, params=None, cpus=None, metadata=None):
+        self.path = path
+        self.workload = as_workload(workload)
+        self.cpus = cpus
+        self.slices = 0
+        meta = dict(metadata or {}, algorithm=algorithm, params=dict(params or {}), cpus=cpus)
+        self._meta = json.dumps(meta).encode()
+        self._meta += b' ' * (-len(self._meta) % 8)
+        columns = SLICE_COLUMNS if cpus is not None else SLICE_COLUMNS[:3]
+        self._pending = {name: array('q') for name in columns}
+        self._spools = {}
+        self._file = open(path, 'wb')
+        try:
+            self._file.write(HEADER.pack(MAGIC, VERSION, 0, 0, 0, len(self._meta)))
+            self._file.write(self._meta)
+            for name in WORKLOAD_COLUMNS:
+                self._file.write(_little_endian(getattr(self.workload, name)))
+        except BaseException:
+            self.abort()
+            raise
+
+    def add_slices(self, index, start, end, cpu=None):
+        """Append slices given as parallel columns (arrays, lists or buffers of int64)."""
+        if (cpu is None) != (self.cpus is None):
+            raise ValueError("CPUs must be given for the slices of a multi-CPU run, and only then.")
+        columns = (index, start, end, cpu) if cpu is not None else (index, start, end)
+        if len({len(column) for column in columns}) != 1:
+            raise ValueError("Slice columns must have the same length.")
+        for (name, pending), column in zip(self._pending.items(), columns):
+            pending.extend(column)
+            if len(pending) >= CHUNK_SIZE:
+                self._spill(name)
+        self.slices += len(index)
+
+    def _spill(self, name):
+        spool = self._spools.get(name)
+        if spool is None:
+            spool = self._spools[name] = tempfile.TemporaryFile(dir=os.path.dirname(os.path.abspath(self.path)))
+        spool.write(_little_endian(self._pending[name]))
+        del self._pending[name][:]
+
+    def finish(self, start, completion, order=None):
+        """Write the per-process columns and the spooled slices, and close the file."""
+        n = len(self.workload)
+        if not len(start) == len(completion) == n or (order is not None and len(order) != n):
+            raise ValueError("Per-process columns must match the workload.")
+        slices = self.slices
+        flags = (FLAG_ORDER if order is not None else 0) | (FLAG_TIMELINE if slices else 0)
+        flags |= FLAG_CPU if slices and self.cpus is not None else 0
+        f = self._file
+        for column in (start, completion) + ((order,) if order is not None else ()):
+            f.write(_little_endian(column))
+        if slices:
+            for name in self._pending:
+                spool = self._spools.get(name)
+                if spool is not None:
+                    spool.seek(0)
+                    shutil.copyfileobj(spool, f, 1 << 20)
+                f.write(_little_endian(self._pending[name]))
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, flags, n, slices, len(self._meta)))
+        self._close()
+
+    def _close(self):
+        for spool in self._spools.values():
+            spool.close()
+        self._spools = {}
+        self._file.close()
+
+    def abort(self):
+        """Close and delete an unfinished trace."""
+        self._close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is not None and not self._file.closed:
+            self.abort()
+
+
+def save_trace(schedule, path, metadata=None):
+    """Write ``schedule`` to ``path``; ``metadata`` adds JSON-serializable extras."""
+    cpus = getattr(schedule, 'cpus', None)
+    with TraceWriter(path, schedule.workload, schedule.algorithm, schedule.params, cpus, metadata) as writer:
+        timeline = schedule.timeline
+        if timeline is not None:
+            cpu = getattr(timeline, 'cpu', None) if cpus is not None else None
+            for k in range(0, len(timeline), CHUNK_SIZE):
+                part = slice(k, k + CHUNK_SIZE)
+                writer.add_slices(timeline.index[part], timeline.start[part], timeline.end[part],
+                                  cpu[part] if cpu is not None else None)
+        writer.finish(schedule.start, schedule.completion, schedule.order)
+
+
+class Trace:
+    """A loaded trace. Columns are read-only views when memory-mapped."""
+
+    def __init__(self, metadata, workload, start, completion, order=None, timeline=None):
+        self.metadata = metadata
+        self.algorithm = metadata['algorithm']
+        self.params = metadata['params']
+        self.cpus = metadata.get('cpus')
+        self.workload = workload
+        self.start = start
+        self.completion = completion
+        self.order = order
+        self.timeline = timeline
+
+    def __len__(self):
+        return len(self.workload)
+
+    def schedule(self):
+        """The traced run as a ``Schedule`` sharing these columns."""
+        if self.cpus is not None:
+            return MulticoreSchedule(self.algorithm, self.workload, self.start, self.completion, self.order,
+                                     self.params, self.timeline, self.cpus)
+        return Schedule(self.algorithm, self.workload, self.start, self.completion, self.order, self.params,
+                        self.timeline)
+
+    def arrays(self):
+        """Every column as a zero-copy NumPy array, by name; slice columns are prefixed ``slice_``."""
+        np = numpy()
+        if np is None:
+            raise RuntimeError("NumPy is required for array views.")
+        columns = {name: getattr(self.workload, name) for name in WORKLOAD_COLUMNS}
+        columns.update(start=self.start, completion=self.completion)
+        if self.order is not None:
+            columns['order'] = self.order
+        if self.timeline is not None:
+            for name in SLICE_COLUMNS:
+                if hasattr(self.timeline, name):
+                    columns[f'slice_{name}'] = getattr(self.timeline, name)
+        return {name: np.frombuffer(column, dtype=np.int64) for name, column in columns.items()}
+
+
+def _timeline(columns, with_cpu):
+    cls = CoreTimeline if with_cpu else Timeline
+    timeline = cls.__new__(cls)
+    for name, column in zip(SLICE_COLUMNS, columns):
+        setattr(timeline, name, column)
+    if with_cpu:
+        timeline._last = array('q')
+    return timeline
+
+
+def load_trace(path, use_mmap=True):
+    """Load a ``.pstr`` trace.
+
+    With ``use_mmap`` the columns are zero-copy views of a read-only memory
+    map; otherwise they are copied into arrays.
+    """
+    with open(path, 'rb') as f:
+        header = f.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise TraceError(f"{path} is not a schedule trace.")
+        magic, version, flags, n, slices, meta_size = HEADER.unpack(header)
+        if magic != MAGIC:
+            raise TraceError(f"{path} is not a schedule trace.")
+        if version != VERSION:
+            raise TraceError(f"Unsupported trace version {version}.")
+        counts = [n] * (6 + bool(flags & FLAG_ORDER))
+        if flags & FLAG_TIMELINE:
+            counts += [slices] * (3 + bool(flags & FLAG_CPU))
+        expected = HEADER.size + meta_size + 8 * sum(counts)
+        if os.fstat(f.fileno()).st_size < expected:
+            raise TraceError(f"{path} is truncated: expected {expected} bytes.")
+        try:
+            metadata = json.loads(f.read(meta_size))
+        except ValueError as e:
+            raise TraceError(f"{path} has unreadable metadata: {e}") from None
+        if not (isinstance(metadata, dict) and isinstance(metadata.get('algorithm'), str)
+                and isinstance(metadata.get('params'), dict)):
+            raise TraceError(f"{path} has unreadable metadata: expected an algorithm and its params.")
+
+        columns = []
+        mapped = use_mmap and sys.byteorder == 'little'
+        if mapped:
+            view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            offset = HEADER.size + meta_size
+            for count in counts:
+                columns.append(view[offset:offset + count * 8].cast('q'))
+                offset += count * 8
+        else:
+            for count in counts:
+                column = array('q')
+                column.frombytes(f.read(count * 8))
+                if sys.byteorder != 'little':
+                    column.byteswap()
+                columns.append(column)
+
+    workload = Workload.from_buffers(*columns[:4]) if mapped else Workload(*columns[:4])
+    order = columns[6] if flags & FLAG_ORDER else None
+    timeline = None
+    if flags & FLAG_TIMELINE:
+        first = 7 if flags & FLAG_ORDER else 6
+        timeline = _timeline(columns[first:], flags & FLAG_CPU)
+    return Trace(metadata, workload, columns[4], columns[5], order, timeline)
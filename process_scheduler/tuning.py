@@ -0,0 +1,105 @@
+"""Round Robin quantum sweep and auto-tuner.
+
+A sweep runs RR once per quantum on the same workload and records the
+WT/TAT/RT averages and context-switch count for each. The arrival ordering is
+computed once and shared by every run; on large workloads the quanta are
+split into chunks that run in parallel over one shared-memory copy of the
+workload.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .engine import _scaled, run_rr
+from .parallel import MIN_PARALLEL, SharedWorkload, attach, gather
+from .workload import as_workload
+
+# Sweeps wider than this are thinned to an even stride.
+MAX_DEFAULT_QUANTA = 200
+
+
+def default_quanta(workload):
+    """1 up to the longest burst; beyond that RR degenerates to FCFS."""
+    longest = max(workload.burst)
+    step = -(-longest // MAX_DEFAULT_QUANTA)
+    return list(range(1, longest + 1, step))
+
+
+def _sweep_point(workload, quantum, progress=None):
+    schedule = run_rr(workload, quantum, progress)
+    metrics = schedule.metrics()
+    return {
+        'quantum': quantum,
+        'TAT': metrics['TAT'],
+        'WT': metrics['WT'],
+        'RT': metrics['RT'],
+        'context_switches': schedule.timeline.context_switches(),
+    }
+
+
+def _sweep_shared(name, n, quanta):
+    shm, workload = attach(name, n)
+    try:
+        return [_sweep_point(workload, quantum) for quantum in quanta]
+    finally:
+        del workload
+        shm.close()
+
+
+def sweep_quantum(processes, quanta=None, executor=None, max_workers=None, min_parallel=MIN_PARALLEL,
+                  progress=None):
+    """Evaluate RR for every quantum; returns one dict per quantum, in order.
+
+    Each dict holds ``quantum``, ``TAT``, ``WT``, ``RT`` and
+    ``context_switches``. ``quanta`` defaults to ``default_quanta``.
+    ``progress`` counts in quanta in-process and in chunks on the pool.
+    """
+    workload = as_workload(processes)
+    if not len(workload):
+        raise ValueError("No processes to schedule!")
+    quanta = sorted(set(quanta or default_quanta(workload)))
+    if quanta[0] <= 0:
+        raise ValueError("Time quantum must be greater than zero.")
+    workload.arrival_order()
+
+    if len(workload) < min_parallel or len(quanta) == 1:
+        return [_sweep_point(workload, quantum, _scaled(progress, k, len(quanta)))
+                for k, quantum in enumerate(quanta)]
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+    workers = max_workers or os.cpu_count() or 1
+    # Interleave so every chunk gets a mix of cheap (large) and costly (small) quanta
+    chunks = [quanta[k::workers] for k in range(min(workers, len(quanta)))]
+    try:
+        with SharedWorkload(workload) as shared:
+            futures = [executor.submit(_sweep_shared, shared.name, shared.n, chunk) for chunk in chunks]
+            points = [point for chunk in gather(futures, progress) for point in chunk]
+    finally:
+        if own_executor:
+            executor.shutdown()
+    points.sort(key=lambda point: point['quantum'])
+    return points
+
+
+def recommend(points, objective='WT'):
+    """Sweep point with the lowest ``objective``; fewer context switches break ties."""
+    return min(points, key=lambda point: (point[objective], point['context_switches'], point['quantum']))
+
+
+def tune_quantum(processes, quanta=None, objective='WT', **kwargs):
+    """Best quantum for ``processes`` under ``objective``."""
+    return recommend(sweep_quantum(processes, quanta, **kwargs), objective)['quantum']
+
+
+def format_sweep(points, best, objective='WT'):
+    lines = ["Round Robin Quantum Sweep:",
+             f"{'Quantum':<10}{'Avg TAT':<15}{'Avg WT':<15}{'Avg RT':<15}{'Switches':<10}"]
+    for point in points:
+        lines.append(f"{point['quantum']:<10}{point['TAT']:<15.2f}{point['WT']:<15.2f}"
+                     f"{point['RT']:<15.2f}{point['context_switches']:<10}")
+    lines.append("")
+    lines.append(f"Recommended Quantum (Lowest Avg {objective}): {best['quantum']}")
+    lines.append("")
+    return "\n".join(lines)
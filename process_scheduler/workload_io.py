@@ -0,0 +1,390 @@
+"""Bulk workload import/export: CSV, JSON Lines and a flat binary format.
+
+Text formats are read ``chunk_size`` records at a time and appended to the
+workload's int64 columns, so no more than one chunk of text is alive at once.
+Every record goes through the same rules ``add_process`` enforces: numeric
+and unique PID, arrival >= 0, burst > 0, priority >= 0.
+
+The binary format (``.pswl``) is a 16-byte header -- magic ``PSWL``, format
+version, reserved, record count -- followed by the PID, arrival, burst and
+priority columns as contiguous little-endian int64. ``load_binary`` can map
+it straight into a read-only ``Workload`` without copying.
+"""
+
+import csv
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from itertools import islice
+
+from ._optional import numpy
+from .workload import Workload
+
+CHUNK_SIZE = 65536
+FIELDS = ('pid', 'arrival', 'burst', 'priority')
+# Alternative spellings accepted in headers and JSON keys
+ALIASES = {'arrival_time': 'arrival', 'burst_time': 'burst', 'process_id': 'pid'}
+
+MAGIC = b'PSWL'
+VERSION = 1
+HEADER = struct.Struct('<4sHHQ')
+INT64_MIN, INT64_MAX = -2**63, 2**63 - 1
+
+
+class WorkloadError(ValueError):
+    """A record that ``add_process`` would have rejected."""
+
+    def __init__(self, message, line=None):
+        self.line = line
+        super().__init__(f"line {line}: {message}" if line is not None else message)
+
+
+def _check_record(pid, arrival, burst, priority, line):
+    if pid < 0:
+        raise WorkloadError("Process ID must be a number.", line)
+    if arrival < 0:
+        raise WorkloadError("Arrival time must be non-negative.", line)
+    if burst <= 0:
+        raise WorkloadError("Burst time must be greater than zero.", line)
+    if priority < 0:
+        raise WorkloadError("Priority must be non-negative.", line)
+
+
+def _first_invalid(pid, arrival, burst, priority):
+    """Index of the first record ``add_process`` would reject, or ``None``."""
+    np = numpy()
+    if np is not None:
+        pid, arrival, burst, priority = (np.frombuffer(c, dtype=np.int64) for c in (pid, arrival, burst, priority))
+        bad = (pid < 0) | (arrival < 0) | (burst <= 0) | (priority < 0)
+        return int(bad.argmax()) if bad.any() else None
+    for k, (p, a, b, q) in enumerate(zip(pid, arrival, burst, priority)):
+        if p < 0 or a < 0 or b <= 0 or q < 0:
+            return k
+    return None
+
+
+def _first_duplicate(pid, start):
+    """A PID at or after ``start`` that repeats an earlier one, or ``None``."""
+    np = numpy()
+    if np is not None:
+        values, counts = np.unique(np.frombuffer(pid, dtype=np.int64), return_counts=True)
+        duplicates = values[counts > 1]
+        return int(duplicates[0]) if len(duplicates) else None
+    seen = set(pid[:start])
+    for value in pid[start:]:
+        if value in seen:
+            return value
+        seen.add(value)
+    return None
+
+
+# The NumPy views above live only inside those helpers: a view still alive in
+# a traceback frame would pin the array and make rollback's resize fail.
+
+def _check_columns(pid, arrival, burst, priority, line_of):
+    """Validate equal-length columns; ``line_of(k)`` numbers the k-th record."""
+    k = _first_invalid(pid, arrival, burst, priority)
+    if k is not None:
+        _check_record(pid[k], arrival[k], burst[k], priority[k], line_of(k))
+
+
+def _check_unique(workload, start):
+    duplicate = _first_duplicate(workload.pid, start)
+    if duplicate is not None:
+        raise WorkloadError(f"Process ID must be unique (duplicate PID {duplicate}).")
+
+
+def _to_int(value, field, line):
+    try:
+        if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+            raise ValueError(value)
+        number = int(value)
+    except (TypeError, ValueError):
+        if field == 'pid':
+            raise WorkloadError("Process ID must be a number.", line) from None
+        raise WorkloadError(f"{field.capitalize()} must be an integer, got {value!r}.", line) from None
+    if not INT64_MIN <= number <= INT64_MAX:
+        name = "Process ID" if field == 'pid' else field.capitalize()
+        raise WorkloadError(f"{name} {value!r} does not fit in 64 bits.", line)
+    return number
+
+
+class _Loader:
+    """Accumulates validated chunks into a workload, rolling back on error."""
+
+    def __init__(self, into):
+        self.workload = into if into is not None else Workload()
+        self.start = len(self.workload)
+
+    def add_columns(self, pid, arrival, burst, priority, line_of):
+        _check_columns(pid, arrival, burst, priority, line_of)
+        self.workload.extend(pid, arrival, burst, priority)
+
+    def add_rows(self, rows):
+        """Add ``(line, pid, arrival, burst, priority)`` records."""
+        lines = array('q')
+        columns = tuple(array('q') for _ in FIELDS)
+        for line, *values in rows:
+            lines.append(line)
+            for column, value in zip(columns, values):
+                column.append(value)
+        self.add_columns(*columns, lines.__getitem__)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            try:
+                _check_unique(self.workload, self.start)
+            except WorkloadError:
+                self.workload.truncate(self.start)
+                raise
+        else:
+            self.workload.truncate(self.start)
+
+
+def _header_fields(header):
+    fields = [ALIASES.get(name.strip().lower(), name.strip().lower()) for name in header]
+    missing = [name for name in FIELDS[:3] if name not in fields]
+    if missing:
+        raise WorkloadError(f"CSV header is missing column(s): {', '.join(missing)}", 1)
+    return [fields.index(name) if name in fields else None for name in FIELDS]
+
+
+def _parse_csv_rows(lines, positions, first_line):
+    for offset, row in enumerate(csv.reader(lines)):
+        line = first_line + offset
+        if not row:
+            continue
+        try:
+            yield (line,) + tuple(_to_int(row[p], name, line) if p is not None else 0
+                                  for p, name in zip(positions, FIELDS))
+        except IndexError:
+            raise WorkloadError(f"expected {len(positions)} columns, got {len(row)}.", line) from None
+
+
+def _fast_csv_chunk(lines, positions):
+    """Parse a chunk with NumPy's C tokenizer; ``None`` if it needs the slow path."""
+    np = numpy()
+    if np is None or None in positions[:3]:
+        return None
+    try:
+        table = np.loadtxt(lines, delimiter=',', dtype=np.int64, ndmin=2)
+    except ValueError:
+        return None
+    if table.shape[0] != len(lines):  # blank lines shift line numbers
+        return None
+    columns = []
+    for p in positions:
+        column = array('q')
+        if p is None:
+            column.frombytes(bytes(8 * table.shape[0]))
+        else:
+            column.frombytes(np.ascontiguousarray(table[:, p]).tobytes())
+        columns.append(column)
+    return columns
+
+
+def load_csv(path, into=None, chunk_size=CHUNK_SIZE):
+    """Load ``pid,arrival,burst[,priority]`` rows (header required).
+
+    Appends to ``into`` when given, otherwise returns a new ``Workload``.
+    """
+    with open(path, newline='') as f, _Loader(into) as loader:
+        positions = _header_fields(next(csv.reader([f.readline()]), []))
+        line = 2
+        while True:
+            lines = list(islice(f, chunk_size))
+            if not lines:
+                break
+            columns = _fast_csv_chunk(lines, positions)
+            if columns is not None:
+                loader.add_columns(*columns, line.__add__)
+            else:
+                loader.add_rows(_parse_csv_rows(lines, positions, line))
+            line += len(lines)
+    return loader.workload
+
+
+def _parse_jsonl_rows(lines, first_line):
+    for offset, text in enumerate(lines):
+        line = first_line + offset
+        if not text.strip():
+            continue
+        try:
+            record = json.loads(text)
+        except ValueError as e:
+            raise WorkloadError(f"invalid JSON: {e}", line) from None
+        record = {ALIASES.get(k, k): v for k, v in record.items()}
+        for name in FIELDS[:3]:
+            if name not in record:
+                raise WorkloadError(f"missing field {name!r}.", line)
+        yield (line,) + tuple(_to_int(record.get(name, 0), name, line) for name in FIELDS)
+
+
+def _fast_jsonl_chunk(lines):
+    """Decode a chunk as one JSON array; ``None`` if it needs the slow path."""
+    try:
+        records = json.loads("[" + ",".join(lines) + "]")
+        values = [[r[name] for r in records] for name in FIELDS[:3]]
+        values.append([r.get('priority', 0) for r in records])
+        # array('q') takes true/false as 1/0; leave them for _to_int to reject
+        if any(bool in set(map(type, column)) for column in values):
+            return None
+        return [array('q', column) for column in values]
+    except (ValueError, KeyError, TypeError, AttributeError, OverflowError):
+        return None
+
+
+def load_jsonl(path, into=None, chunk_size=CHUNK_SIZE):
+    """Load one ``{"pid": .., "arrival": .., "burst": .., "priority": ..}`` object per line."""
+    with open(path) as f, _Loader(into) as loader:
+        line = 1
+        while True:
+            lines = list(islice(f, chunk_size))
+            if not lines:
+                break
+            columns = _fast_jsonl_chunk(lines)
+            if columns is not None:
+                loader.add_columns(*columns, line.__add__)
+            else:
+                loader.add_rows(_parse_jsonl_rows(lines, line))
+            line += len(lines)
+    return loader.workload
+
+
+def load_binary(path, into=None, use_mmap=True, validate=True):
+    """Load a ``.pswl`` file.
+
+    With ``use_mmap`` (and no ``into``) the columns are zero-copy views of a
+    read-only memory map; otherwise they are copied into a writable workload.
+    """
+    with open(path, 'rb') as f:
+        header = f.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise WorkloadError(f"{path} is not a binary workload file.")
+        magic, version, _, n = HEADER.unpack(header)
+        if magic != MAGIC:
+            raise WorkloadError(f"{path} is not a binary workload file.")
+        if version != VERSION:
+            raise WorkloadError(f"Unsupported binary workload version {version}.")
+        expected = HEADER.size + len(FIELDS) * n * 8
+        if os.fstat(f.fileno()).st_size < expected:
+            raise WorkloadError(f"{path} is truncated: expected {expected} bytes.")
+
+        if use_mmap and into is None and sys.byteorder == 'little':
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if n else b''
+            columns = [memoryview(buf)[HEADER.size + k * n * 8:HEADER.size + (k + 1) * n * 8]
+                       for k in range(len(FIELDS))]
+            workload = Workload.from_buffers(*columns)
+            if validate:
+                _check_columns(workload.pid, workload.arrival, workload.burst, workload.priority, (1).__add__)
+                _check_unique(workload, 0)
+            return workload
+
+        with _Loader(into) as loader:
+            columns = []
+            for _ in FIELDS:
+                column = array('q')
+                column.frombytes(f.read(n * 8))
+                if sys.byteorder != 'little':
+                    column.byteswap()
+                columns.append(column)
+            if validate:
+                loader.add_columns(*columns, (1).__add__)
+            else:
+                loader.workload.extend(*columns)
+        return loader.workload
+
+
+def save_binary(workload, path):
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(workload)))
+        for name in FIELDS:
+            column = getattr(workload, name)
+            if sys.byteorder != 'little':
+                column = array('q', column)
+                column.byteswap()
+            f.write(memoryview(column).cast('B'))
+
+
+def save_csv(workload, path, chunk_size=CHUNK_SIZE):
+    with open(path, 'w', newline='') as f:
+        f.write(",".join(FIELDS) + "\n")
+        rows = workload.rows()
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            f.write("".join(f"{pid},{arrival},{burst},{priority}\n" for pid, arrival, burst, priority in chunk))
+
+
+def save_jsonl(workload, path, chunk_size=CHUNK_SIZE):
+    with open(path, 'w') as f:
+        rows = workload.rows()
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            f.write("".join(
+                f'{{"pid": {pid}, "arrival": {arrival}, "burst": {burst}, "priority": {priority}}}\n'
+                for pid, arrival, burst, priority in chunk))
+
+
+FORMATS = {
+    '.csv': (load_csv, save_csv),
+    '.jsonl': (load_jsonl, save_jsonl),
+    '.ndjson': (load_jsonl, save_jsonl),
+    '.pswl': (load_binary, save_binary),
+}
+
+
+def _format(path):
+    ext = os.path.splitext(str(path))[1].lower()
+    try:
+        return FORMATS[ext]
+    except KeyError:
+        raise WorkloadError(f"Unknown workload format {ext!r}; expected one of {', '.join(FORMATS)}.") from None
+
+
+def iter_records(path, fmt=None):
+    """Yield validated ``(pid, arrival, burst, priority)`` records one at a time.
+
+    For traces too large to load, or still being written: ``path`` may be
+    ``'-'`` for stdin, with ``fmt`` (an extension such as ``'.csv'``) naming
+    the format. PIDs are not checked for uniqueness, which would take memory
+    proportional to the trace.
+    """
+    ext = fmt if fmt is not None else os.path.splitext(str(path))[1].lower()
+    if ext not in FORMATS:
+        raise WorkloadError(f"Unknown workload format {ext!r}; expected one of {', '.join(FORMATS)}.")
+    if ext == '.pswl':
+        if path == '-':
+            raise WorkloadError("Binary workloads can't be read from stdin.")
+        yield from load_binary(path).rows()
+        return
+    f = sys.stdin if path == '-' else open(path, newline='')
+    try:
+        if ext == '.csv':
+            rows = _parse_csv_rows(f, _header_fields(next(csv.reader([f.readline()]), [])), 2)
+        else:
+            rows = _parse_jsonl_rows(f, 1)
+        for line, pid, arrival, burst, priority in rows:
+            _check_record(pid, arrival, burst, priority, line)
+            yield pid, arrival, burst, priority
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def load_workload(path, into=None):
+    """Load any supported format, chosen by file extension."""
+    return _format(path)[0](path, into=into)
+
+
+def save_workload(workload, path):
+    _format(path)[1](workload, path)
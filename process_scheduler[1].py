@@ -1,21 +1,77 @@
-import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog, scrolledtext
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
-
-class Process:
-    def __init__(self, pid, arrival_time, burst_time, priority=0):
-        self.pid = pid
-        self.arrival_time = arrival_time
-        self.burst_time = burst_time
-        self.priority = priority
-        self.remaining_time = burst_time
-        self.start_time = -1
-        self.completion_time = 0
+import struct
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from process_scheduler import engine
+from process_scheduler.cache import ScheduleCache
+from process_scheduler.gantt import GanttChart
+from process_scheduler.incremental import RESUMABLE, IncrementalScheduler
+from process_scheduler.instrument import instrument
+from process_scheduler.jobs import Cancelled, Job
+from process_scheduler.listview import VirtualProcessList
+from process_scheduler.metrics import format_comparison, format_report
+from process_scheduler.parallel import compare_parallel
+from process_scheduler.synthetic import ARRIVALS, BURSTS, generate_workload
+from process_scheduler.trace import load_trace, save_trace
+from process_scheduler.tuning import format_sweep, recommend, sweep_quantum
+from process_scheduler.workload import Workload
+from process_scheduler.workload_io import load_workload, save_workload
+
+WORKLOAD_FILETYPES = [("CSV", "*.csv"), ("JSON Lines", "*.jsonl *.ndjson"),
+                      ("Binary workload", "*.pswl"), ("All files", "*.*")]
+TRACE_FILETYPES = [("Schedule trace", "*.pstr"), ("All files", "*.*")]
+
+# Tk is bound by load_tk() and matplotlib by ensure_chart(), so importing this
+# module (or the engine through it) doesn't pay for either.
+tk = ttk = messagebox = simpledialog = scrolledtext = filedialog = None
+
+
+def load_tk():
+    global tk, ttk, messagebox, simpledialog, scrolledtext, filedialog
+    if tk is None:
+        from tkinter import ttk, messagebox, simpledialog, scrolledtext, filedialog
+        import tkinter as tk
+
+
+def simulate_report(algorithm, workload, cache, schedulers, progress=None, **params):
+    """ Run one algorithm and format its report, both off the Tk thread.
+
+    ``schedulers`` keeps one IncrementalScheduler per algorithm, so a rerun
+    after adding processes resumes from where they arrive instead of
+    re-simulating the whole list.
+    """
+    if algorithm not in RESUMABLE:
+        schedule = cache.simulate(algorithm, workload, progress=progress, **params)
+        return schedule, format_report(schedule)
+    schedule = cache.lookup_schedule(algorithm, workload, params)
+    if schedule is None:
+        scheduler = IncrementalScheduler(algorithm, **params)
+        previous = schedulers.get(scheduler.algorithm)
+        if previous is not None and previous.params == scheduler.params and previous.extend_to(workload):
+            scheduler = previous
+        else:
+            scheduler.extend_to(workload)
+            schedulers[scheduler.algorithm] = scheduler
+        # A copy, as the scheduler's own arrays change with its next append
+        schedule = scheduler.schedule(progress).copy()
+        cache.store_schedule(algorithm, workload, params, schedule)
+    return schedule, format_report(schedule)
+
+
+def replay_report(path, progress=None):
+    """A saved trace as ``(schedule, report)``, without re-running it."""
+    schedule = load_trace(path).schedule()
+    return schedule, format_report(schedule)
+
+
+def instrumented_report(algorithm, workload, progress=None, profile=False, **params):
+    """ Like simulate_report, but uncached and followed by the run's statistics. """
+    schedule, stats = instrument(algorithm, workload, profile=profile or None, progress=progress, **params)
+    return schedule, f"{format_report(schedule)}\n{stats.format()}"
+
 
 class ProcessSchedulerApp:
     def __init__(self, root):
+        load_tk()
         self.root = root
         self.root.title("Process Scheduler Simulator")
         self.root.geometry("900x700")
@@ -26,9 +82,20 @@ class ProcessSchedulerApp:
         self.style.theme_use('clam')
         self.configure_styles()
         
-        self.processes = []
+        self.workload = Workload()
         self.priority_type = tk.IntVar(value=1) 
+        self.show_stats = tk.BooleanVar(value=False)
+        self.show_profile = tk.BooleanVar(value=False)
+        self.background = ThreadPoolExecutor(max_workers=1)
+        self.process_pool = None
+        self.job = None
+        # Keyed by workload content, so adding or clearing processes never hits stale results
+        self.cache = ScheduleCache()
+        self.schedulers = {}
+        self.mlfq_params = {'level_quanta': (2, 4, 8), 'boost_interval': 100}
+        self.last_schedule = None
         self.create_widgets()
+        self.root.protocol("WM_DELETE_WINDOW", self.exit_app)
         
     def configure_styles(self):
         self.style.configure('TFrame', background='#f0f0f0')
@@ -60,6 +127,21 @@ class ProcessSchedulerApp:
         self.clear_btn = ttk.Button(self.control_frame, text="Clear All Processes", command=self.clear_processes)
         self.clear_btn.pack(fill=tk.X, pady=5)
         
+        self.import_btn = ttk.Button(self.control_frame, text="Import Workload...", command=self.import_workload)
+        self.import_btn.pack(fill=tk.X, pady=5)
+        
+        self.export_btn = ttk.Button(self.control_frame, text="Export Workload...", command=self.export_workload)
+        self.export_btn.pack(fill=tk.X, pady=5)
+        
+        self.generate_btn = ttk.Button(self.control_frame, text="Generate Workload...", command=self.generate_processes)
+        self.generate_btn.pack(fill=tk.X, pady=5)
+        
+        self.save_trace_btn = ttk.Button(self.control_frame, text="Save Trace...", command=self.save_trace)
+        self.save_trace_btn.pack(fill=tk.X, pady=5)
+        
+        self.open_trace_btn = ttk.Button(self.control_frame, text="Open Trace...", command=self.open_trace)
+        self.open_trace_btn.pack(fill=tk.X, pady=5)
+        
         ttk.Separator(self.control_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=10)
         
         # Priority range settings
@@ -90,12 +172,40 @@ class ProcessSchedulerApp:
         self.rr_btn = ttk.Button(self.control_frame, text="Run Round Robin", command=self.run_rr)
         self.rr_btn.pack(fill=tk.X, pady=5)
         
+        self.srtf_btn = ttk.Button(self.control_frame, text="Run SRTF", command=self.run_srtf)
+        self.srtf_btn.pack(fill=tk.X, pady=5)
+        
+        self.preemptive_priority_btn = ttk.Button(self.control_frame, text="Run Preemptive Priority",
+                                                  command=self.run_preemptive_priority)
+        self.preemptive_priority_btn.pack(fill=tk.X, pady=5)
+        
+        self.mlfq_btn = ttk.Button(self.control_frame, text="Run MLFQ", command=self.run_mlfq)
+        self.mlfq_btn.pack(fill=tk.X, pady=5)
+        
         ttk.Separator(self.control_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=10)
         
+        ttk.Label(self.control_frame, text="Analysis RR Quantum(s)").pack()
+        self.quanta_entry = ttk.Entry(self.control_frame)
+        self.quanta_entry.insert(0, "2")
+        self.quanta_entry.pack(fill=tk.X, pady=2)
+        
+        self.tune_button = ttk.Button(self.control_frame, text="Tune RR Quantum", command=self.tune_quantum)
+        self.tune_button.pack(fill=tk.X, pady=5)
+        
         self.analyze_button = ttk.Button(self.control_frame, text="Analyze Best Algorithm", command=self.analyze_best_algorithm)
         self.analyze_button.pack(fill=tk.X, pady=5)
         
-        self.exit_btn = ttk.Button(self.control_frame, text="Exit", command=self.root.destroy)
+        ttk.Checkbutton(self.control_frame, text="Show Run Statistics", variable=self.show_stats).pack(anchor=tk.W)
+        ttk.Checkbutton(self.control_frame, text="Include Profile", variable=self.show_profile).pack(anchor=tk.W)
+        
+        self.progress_bar = ttk.Progressbar(self.control_frame, mode='determinate', maximum=100)
+        self.progress_bar.pack(fill=tk.X, pady=5)
+        
+        self.cancel_btn = ttk.Button(self.control_frame, text="Cancel", command=self.cancel_job)
+        self.cancel_btn.state(['disabled'])
+        self.cancel_btn.pack(fill=tk.X, pady=5)
+        
+        self.exit_btn = ttk.Button(self.control_frame, text="Exit", command=self.exit_app)
         self.exit_btn.pack(fill=tk.X, pady=5)
 
         # Process list display
@@ -115,7 +225,11 @@ class ProcessSchedulerApp:
         self.tree.column('Burst', width=100, anchor=tk.CENTER)
         self.tree.column('Priority', width=100, anchor=tk.CENTER)
         
-        self.tree.pack(fill=tk.BOTH, expand=True)
+        self.tree_scroll = ttk.Scrollbar(self.process_list_frame, orient=tk.VERTICAL)
+        self.tree_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # Only the rows in view exist as Treeview items; click a heading to sort
+        self.process_list = VirtualProcessList(self.tree, self.tree_scroll, self.workload, rowheight=25)
         
         # Metrics display
         self.metrics_frame = ttk.LabelFrame(self.output_frame, text="Metrics")
@@ -128,11 +242,30 @@ class ProcessSchedulerApp:
         self.gantt_frame = ttk.LabelFrame(self.output_frame, text="Gantt Chart")
         self.gantt_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        # Initialize empty figure for Gantt chart
+        # The figure is created by ensure_chart() when the first chart is drawn
+        self.fig = self.ax = self.canvas = self.gantt = None
+        self.gantt_placeholder = ttk.Label(self.gantt_frame, text="No data available", anchor=tk.CENTER)
+        self.gantt_placeholder.pack(fill=tk.BOTH, expand=True)
+        
+    def ensure_chart(self):
+        if self.canvas is not None:
+            return
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+        from matplotlib.figure import Figure
+
+        self.gantt_placeholder.destroy()
         self.fig = Figure(figsize=(8, 3), dpi=100)
         self.ax = self.fig.add_subplot(111)
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.gantt_frame)
+        # Pan/zoom re-bins the Gantt chart for the new viewport
+        NavigationToolbar2Tk(self.canvas, self.gantt_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.gantt = GanttChart(self.ax)
+
+    def reset_chart(self):
+        self.ensure_chart()
+        self.gantt.detach()
+        self.ax.clear()
         
     def add_process(self):
         
@@ -141,10 +274,11 @@ class ProcessSchedulerApp:
         if not pid or not pid.strip():
             messagebox.showerror("Error", "Process ID cannot be empty.")
             return
-        if not pid.isdigit():
+        if not pid.isdecimal():
             messagebox.showerror("Error", "Process ID must be a number.")
             return
-        if any(p.pid == pid for p in self.processes):
+        pid = int(pid)
+        if pid in self.workload:
             messagebox.showerror("Error", "Process ID must be unique.")
             return
 
@@ -170,13 +304,105 @@ class ProcessSchedulerApp:
             messagebox.showerror("Error", "Priority must be non-negative.")
             return
     
-        self.processes.append(Process(pid, arrival, burst, priority))
-        self.update_process_list()
+        self.workload.append(pid, arrival, burst, priority)
+        self.process_list.appended()
         messagebox.showinfo("Success", f"Process {pid} added successfully.")
         
+    def import_workload(self):
+        path = filedialog.askopenfilename(title="Import Workload", filetypes=WORKLOAD_FILETYPES)
+        if not path:
+            return
+        # Load into a copy so a rejected file leaves the current workload untouched
+        future = self.background.submit(load_workload, path, self.workload.copy())
+        self.import_btn.state(['disabled'])
+        self.when_done(future, self.finish_import)
+
+    def finish_import(self, future):
+        self.import_btn.state(['!disabled'])
+        try:
+            workload = future.result()
+        except (OSError, ValueError, OverflowError, struct.error) as e:
+            messagebox.showerror("Import Failed", str(e))
+            return
+        added = len(workload) - len(self.workload)
+        self.workload = workload
+        self.update_process_list()
+        messagebox.showinfo("Success", f"Imported {added} processes.")
+
+    def generate_processes(self):
+        count = simpledialog.askinteger("Generate Workload", "Number of processes to add (> 0):",
+                                        initialvalue=100000, minvalue=1)
+        if count is None:
+            return
+        kinds = simpledialog.askstring("Generate Workload",
+                                       f"Arrivals ({', '.join(ARRIVALS)}) and bursts ({', '.join(BURSTS)}):",
+                                       initialvalue="poisson, exponential")
+        if kinds is None:
+            return
+        arrivals, _, bursts = (part.strip().lower() for part in kinds.partition(','))
+        seed = simpledialog.askinteger("Generate Workload", "Random seed:", initialvalue=0)
+        if seed is None:
+            return
+        # Generate into a copy so bad settings leave the current workload untouched
+        future = self.background.submit(generate_workload, count, seed=seed, arrivals=arrivals,
+                                        bursts=bursts or 'exponential', into=self.workload.copy())
+        self.generate_btn.state(['disabled'])
+        self.when_done(future, self.finish_generate)
+
+    def finish_generate(self, future):
+        self.generate_btn.state(['!disabled'])
+        try:
+            workload = future.result()
+        except ValueError as e:
+            messagebox.showerror("Generation Failed", str(e))
+            return
+        added = len(workload) - len(self.workload)
+        self.workload = workload
+        self.update_process_list()
+        messagebox.showinfo("Success", f"Generated {added} processes.")
+
+    def export_workload(self):
+        if not self.workload:
+            messagebox.showwarning("Warning", "No processes to export!")
+            return
+        path = filedialog.asksaveasfilename(title="Export Workload", defaultextension=".csv",
+                                            filetypes=WORKLOAD_FILETYPES)
+        if not path:
+            return
+        try:
+            save_workload(self.workload, path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Export Failed", str(e))
+
+    def save_trace(self):
+        if self.last_schedule is None:
+            messagebox.showwarning("Warning", "Run an algorithm first!")
+            return
+        path = filedialog.asksaveasfilename(title="Save Trace", defaultextension=".pstr",
+                                            filetypes=TRACE_FILETYPES)
+        if not path:
+            return
+        future = self.background.submit(save_trace, self.last_schedule, path)
+        self.save_trace_btn.state(['disabled'])
+        self.when_done(future, self.finish_save_trace)
+
+    def finish_save_trace(self, future):
+        self.save_trace_btn.state(['!disabled'])
+        try:
+            future.result()
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Save Failed", str(e))
+
+    def open_trace(self):
+        path = filedialog.askopenfilename(title="Open Trace", filetypes=TRACE_FILETYPES)
+        if not path:
+            return
+        self.start_job(replay_report, path, message="Loading trace...", on_done=self.show_schedule,
+                       failure="Could not open the trace")
+
     def set_global_priority(self):
         """ Set the global priority before scheduling any process. """
-        if not self.processes:
+        if not self.workload:
             messagebox.showwarning("Warning", "No processes to schedule!")
             return
         
@@ -186,7 +412,7 @@ class ProcessSchedulerApp:
         # Update global priority type based on user selection
         self.priority_type.set(1 if user_choice else 0)
     def clear_processes(self):
-        self.processes = []
+        self.workload.clear()
         self.update_process_list()
         self.clear_metrics()
         self.clear_gantt_chart()
@@ -205,262 +431,240 @@ class ProcessSchedulerApp:
     
         
     def update_process_list(self):
-        # Clear current items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-            
-        # Add new items
-        for p in self.processes:
-            self.tree.insert('', tk.END, values=(p.pid, p.arrival_time, p.burst_time, p.priority))
+        self.process_list.set_workload(self.workload)
             
     def clear_metrics(self):
         self.metrics_text.delete(1.0, tk.END)
         
     def clear_gantt_chart(self):
-        self.ax.clear()
+        if self.canvas is None:
+            return
+        self.reset_chart()
         self.ax.set_title("No data available")
         self.canvas.draw()
         
-    def display_metrics(self, processes):
+    def display_metrics(self, schedule):
         self.clear_metrics()
-        output = "\nPID\tArrival\tBurst\tStart\tCompletion\tTurnaround\tWaiting\n"
-        total_tat = total_wt = 0
-        
-        for p in processes:
-            turnaround = p.completion_time - p.arrival_time
-            waiting = turnaround - p.burst_time
-            total_tat += turnaround
-            total_wt += waiting
-            output += (f"{p.pid}\t{p.arrival_time}\t{p.burst_time}\t{p.start_time}\t"
-                      f"{p.completion_time}\t\t{turnaround}\t\t{waiting}\n")
-            
-        n = len(processes)
-        output += f"\nAverage Turnaround Time: {total_tat/n:.2f}\n"
-        output += f"Average Waiting Time: {total_wt/n:.2f}\n"
-        
-        self.metrics_text.insert(tk.END, output)
+        self.metrics_text.insert(tk.END, format_report(schedule))
         
-    def show_gantt_chart(self, processes):
-        self.ax.clear()
+    def show_gantt_chart(self, schedule):
+        self.reset_chart()
         
-        if not processes:
+        if not len(schedule):
             self.ax.set_title("No processes to display")
             self.canvas.draw()
             return
             
-        self.ax.set_title("Gantt Chart")
-        self.ax.set_xlabel("Time")
-        self.ax.set_ylabel("Processes")
-        self.ax.set_yticks([10 * i for i in range(1, len(processes)+1)])
-        self.ax.set_yticklabels([p.pid for p in processes])
-        self.ax.grid(True)
-
-        for i, p in enumerate(processes):
-            self.ax.broken_barh([(p.start_time, p.burst_time)], (10 * (i+1)-5, 9), 
-                               facecolors=('tab:blue', 'tab:orange', 'tab:green', 'tab:red', 'tab:purple')[i%5])
-
-        self.canvas.draw()
+        self.gantt.set_schedule(schedule)
+        self.canvas.draw_idle()
         
     def calculate_metrics(self, processes):
-        n = len(processes)
-        tat_total = wt_total = rt_total = 0
-
-        for p in processes:
-            turnaround = p.completion_time - p.arrival_time
-            waiting = turnaround - p.burst_time
-            response = p.start_time - p.arrival_time
+        return engine.calculate_metrics(processes)
 
-            tat_total += turnaround
-            wt_total += waiting
-            rt_total += response
-
-        return {
-            'TAT': tat_total / n,
-            'WT': wt_total / n,
-            'RT': rt_total / n
-        }
+    def ask_quantum(self):
+        quantum = simpledialog.askinteger("Round Robin", "Enter Time Quantum (> 0):", initialvalue=2)
+        if quantum is None:
+            return None
+        if quantum <= 0:
+            messagebox.showerror("Error", "Time quantum must be greater than zero.")
+            return None
+        return quantum
 
-    def run_fcfs(self, simulate_only=False):
-        if not self.processes:
+    def run_algorithm(self, algorithm, simulate_only=False, **params):
+        if not self.workload:
             messagebox.showwarning("Warning", "No processes to schedule!")
             return
-            
-        processes_copy = [Process(p.pid, p.arrival_time, p.burst_time, p.priority) for p in self.processes]
-        processes_copy.sort(key=lambda x: x.arrival_time)
-        time = 0
-        
-        for p in processes_copy:
-            if time < p.arrival_time:
-                time = p.arrival_time
-            p.start_time = time
-            time += p.burst_time
-            p.completion_time = time
+        params['lower_is_higher'] = self.priority_type.get() == 1
         if simulate_only:
-            return self.calculate_metrics(processes_copy)
-        else:
-            self.display_metrics(processes_copy)
-            self.show_gantt_chart(processes_copy)    
-        
-    def run_sjf(self, simulate_only=False):
-        if not self.processes:
-            messagebox.showwarning("Warning", "No processes to schedule!")
+            return self.cache.metrics(algorithm, self.workload, **params)
+        if self.show_stats.get() or self.show_profile.get():
+            self.start_job(instrumented_report, algorithm, self.workload.copy(), profile=self.show_profile.get(),
+                           message=f"Running {algorithm}...", on_done=self.show_schedule,
+                           failure="Simulation failed", **params)
             return
-            
-        processes_copy = [Process(p.pid, p.arrival_time, p.burst_time, p.priority) for p in self.processes]
-        time = 0
-        completed = 0
-        n = len(processes_copy)
-        ready_queue = []
-
-        while completed < n:
-            for p in processes_copy:
-                if p.arrival_time <= time and p not in ready_queue and p.completion_time == 0:
-                    ready_queue.append(p)
-
-            if ready_queue:
-                ready_queue.sort(key=lambda x: x.burst_time)
-                current = ready_queue.pop(0)
-                if time < current.arrival_time:
-                    time = current.arrival_time
-                current.start_time = time
-                time += current.burst_time
-                current.completion_time = time
-                completed += 1
-            else:
-                time += 1
+        self.start_job(simulate_report, algorithm, self.workload.copy(), self.cache, self.schedulers,
+                       message=f"Running {algorithm}...", on_done=self.show_schedule,
+                       failure="Simulation failed", **params)
 
-        if simulate_only:
-            return self.calculate_metrics(processes_copy)
-        else:        
-            self.display_metrics(processes_copy)
-            self.show_gantt_chart(processes_copy)
+    def show_schedule(self, result):
+        schedule, report = result
+        self.last_schedule = schedule
+        self.metrics_text.insert(tk.END, report)
+        self.show_gantt_chart(schedule)
+
+    def run_fcfs(self, simulate_only=False):
+        return self.run_algorithm("FCFS", simulate_only)
+
+    def run_sjf(self, simulate_only=False):
+        return self.run_algorithm("SJF", simulate_only)
+
+    def run_priority(self, simulate_only=False):
+        return self.run_algorithm("Priority", simulate_only)
+
+    def run_srtf(self, simulate_only=False):
+        return self.run_algorithm("SRTF", simulate_only)
+
+    def run_preemptive_priority(self, simulate_only=False):
+        return self.run_algorithm("Preemptive Priority", simulate_only)
 
-    def run_priority(self,  simulate_only=False):
-        if not self.processes:
-            messagebox.showwarning("Warning", "No processes to schedule!")
-            return
-            
-        processes_copy = [Process(p.pid, p.arrival_time, p.burst_time, p.priority) for p in self.processes]
-        time = 0
-        completed = 0
-        n = len(processes_copy)
-        ready_queue = []
-
-        while completed < n:
-            for p in processes_copy:
-                if p.arrival_time <= time and p not in ready_queue and p.completion_time == 0:
-                    ready_queue.append(p)
-
-            if ready_queue:
-                if self.priority_type.get() == 1:
-                    ready_queue.sort(key=lambda x: (x.priority, x.arrival_time))  # Lower = higher
-                else:
-                    ready_queue.sort(key=lambda x: (-x.priority, x.arrival_time)) 
-                current = ready_queue.pop(0)
-                if time < current.arrival_time:
-                    time = current.arrival_time
-                current.start_time = time
-                time += current.burst_time
-                current.completion_time = time
-                completed += 1
-            else:
-                time += 1
-        if simulate_only:
-            return self.calculate_metrics(processes_copy)
-        else:         
-            self.display_metrics(processes_copy)
-            self.show_gantt_chart(processes_copy)
-    
     def run_rr(self, simulate_only=False):
-        if not self.processes:
+        if not self.workload:
             messagebox.showwarning("Warning", "No processes to schedule!")
             return
-            
-        quantum = simpledialog.askinteger("Round Robin", "Enter Time Quantum (> 0):", initialvalue=2)
+        quantum = self.ask_quantum()
         if quantum is None:
             return
-        if quantum <= 0:
-            messagebox.showerror("Error", "Time quantum must be greater than zero.")
-            return    
-        processes_copy = [Process(p.pid, p.arrival_time, p.burst_time, p.priority) for p in self.processes]
-        time = 0
-        queue = []
-        n = len(processes_copy)
-        completed = 0
-        i = 0
-        processes_copy.sort(key=lambda x: x.arrival_time)
-        queue.append(processes_copy[0])
-        i = 1
-
-        while completed < n:
-            if queue:
-                current = queue.pop(0)
-                if current.start_time == -1:
-                    current.start_time = time
-                if current.remaining_time <= quantum:
-                    time += current.remaining_time
-                    current.remaining_time = 0
-                    current.completion_time = time
-                    completed += 1
-                else:
-                    time += quantum
-                    current.remaining_time -= quantum
-
-                while i < n and processes_copy[i].arrival_time <= time:
-                    queue.append(processes_copy[i])
-                    i += 1
-
-                if current.remaining_time > 0:
-                    queue.append(current)
-            else:
-                if i < n:
-                    queue.append(processes_copy[i])
-                    time = processes_copy[i].arrival_time
-                    i += 1
-        if simulate_only:
-            return self.calculate_metrics(processes_copy)
-        else:             
-            self.display_metrics(processes_copy)
-            self.show_gantt_chart(processes_copy)
+        return self.run_algorithm("Round Robin", simulate_only, quantum=quantum)
+
+    def ask_mlfq_params(self):
+        current = ", ".join(str(q) for q in self.mlfq_params['level_quanta'])
+        levels = simpledialog.askstring("MLFQ", "Enter the quantum of each level, highest first:",
+                                        initialvalue=current)
+        if levels is None:
+            return None
+        try:
+            level_quanta = tuple(int(part) for part in levels.split(','))
+        except ValueError:
+            messagebox.showerror("Error", "Level quanta must be whole numbers separated by commas.")
+            return None
+        if min(level_quanta) <= 0:
+            messagebox.showerror("Error", "Level quanta must be greater than zero.")
+            return None
+        boost = simpledialog.askinteger("MLFQ", "Enter Priority Boost Interval (0 for none):",
+                                        initialvalue=self.mlfq_params['boost_interval'], minvalue=0)
+        if boost is None:
+            return None
+        self.mlfq_params = {'level_quanta': level_quanta, 'boost_interval': boost}
+        return self.mlfq_params
+
+    def run_mlfq(self, simulate_only=False):
+        if not self.workload:
+            messagebox.showwarning("Warning", "No processes to schedule!")
+            return
+        params = self.mlfq_params if simulate_only else self.ask_mlfq_params()
+        if params is None:
+            return
+        return self.run_algorithm("MLFQ", simulate_only, **params)
 
-    
     def analyze_best_algorithm(self):
-        if not self.processes:
+        if not self.workload:
             messagebox.showwarning("Warning", "No processes to analyze!")
             return
 
-        results = []
+        quanta = self.parse_quanta()
+        if quanta is None:
+            return
+        if self.process_pool is None:
+            self.process_pool = ProcessPoolExecutor()
+
+        self.start_job(compare_parallel, self.workload.copy(), quanta=quanta, executor=self.process_pool,
+                       cache=self.cache, lower_is_higher=self.priority_type.get() == 1, **self.mlfq_params,
+                       message="Analyzing...",
+                       on_done=self.show_comparison, failure="Analysis failed")
+
+    def show_comparison(self, result):
+        results, best_algo = result
+        self.metrics_text.insert(tk.END, format_comparison(results, best_algo))
+
+    def tune_quantum(self):
+        if not self.workload:
+            messagebox.showwarning("Warning", "No processes to analyze!")
+            return
+        if self.process_pool is None:
+            self.process_pool = ProcessPoolExecutor()
+        self.start_job(sweep_quantum, self.workload.copy(), executor=self.process_pool,
+                       message="Sweeping quanta...", on_done=self.show_sweep, failure="Quantum sweep failed")
 
-        algos = [
-            (self.run_fcfs, "FCFS"),
-            (self.run_sjf, "SJF"),
-            (self.run_priority, "Priority"),
-            (self.run_rr, "Round Robin")
-        ]
+    def show_sweep(self, points):
+        best = recommend(points)
+        self.quanta_entry.delete(0, tk.END)
+        self.quanta_entry.insert(0, str(best['quantum']))
+        self.metrics_text.insert(tk.END, format_sweep(points, best))
 
-        for func, name in algos:
-            try:
-                metrics = func(simulate_only=True)
-                if metrics:
-                    results.append((name, metrics))
-            except Exception as e:
-                print(f"Error in {name}: {e}")
+        quanta = [point['quantum'] for point in points]
+        self.reset_chart()
+        self.ax.set_title("Round Robin Quantum Sweep")
+        self.ax.set_xlabel("Time Quantum")
+        self.ax.set_ylabel("Average Time")
+        for series in ('TAT', 'WT', 'RT'):
+            self.ax.plot(quanta, [point[series] for point in points], label=series)
+        self.ax.axvline(best['quantum'], color='tab:red', linestyle='--')
+        self.ax.legend()
+        self.ax.grid(True)
+        self.canvas.draw()
 
-        # Determine best based on WT (or TAT if preferred)
-        best_algo = min(results, key=lambda x: x[1]['WT'])[0]
+    def when_done(self, future, callback, interval=50, job=None):
+        """ Call callback(future) on the Tk thread once future has finished. """
+        if future.done():
+            callback(future)
+        else:
+            if job is not None and job is self.job:
+                self.progress_bar['value'] = 100 * job.fraction
+            self.root.after(interval, self.when_done, future, callback, interval, job)
 
-        # Show comparison
-        output = "Algorithm Comparison:\n"
-        output += f"{'Algorithm':<15}{'Avg TAT':<15}{'Avg WT':<15}{'Avg RT':<15}\n"
-        for name, metric in results:
-            output += f"{name:<15}{metric['TAT']:<15.2f}{metric['WT']:<15.2f}{metric['RT']:<15.2f}\n"
+    def start_job(self, func, *args, message, on_done, failure, **kwargs):
+        """ Run func on the background thread with a Job as its progress callback.
 
-        output += f"\nBest Algorithm (Lowest Avg WT): {best_algo}\n"
+        Starting a job cancels the previous one; only the latest job's result
+        reaches on_done, on the Tk thread. Callers pass a copy of the workload
+        so processes added mid-run don't race the worker. """
+        if self.job is not None:
+            self.job.cancel()
+        job = self.job = Job()
+        future = self.background.submit(func, *args, progress=job, **kwargs)
+        self.clear_metrics()
+        self.metrics_text.insert(tk.END, message + "\n")
+        self.progress_bar['value'] = 0
+        self.cancel_btn.state(['!disabled'])
+        self.when_done(future, lambda f: self.finish_job(job, f, on_done, failure), job=job)
 
+    def finish_job(self, job, future, on_done, failure):
+        if job is not self.job:
+            return  # superseded by a newer job
+        self.job = None
+        self.cancel_btn.state(['disabled'])
+        self.progress_bar['value'] = 0
         self.clear_metrics()
-        self.metrics_text.insert(tk.END, output)
+        try:
+            result = future.result()
+        except Cancelled:
+            self.metrics_text.insert(tk.END, "Cancelled.\n")
+            return
+        except Exception as e:
+            messagebox.showerror("Error", f"{failure}: {e}")
+            return
+        on_done(result)
 
-if __name__ == "__main__":
+    def cancel_job(self):
+        if self.job is not None:
+            self.job.cancel()
+            self.metrics_text.insert(tk.END, "Cancelling...\n")
+
+    def parse_quanta(self):
+        if self.quanta_entry.get().strip().lower() == 'auto':
+            return 'auto'
+        try:
+            quanta = [int(q) for q in self.quanta_entry.get().replace(',', ' ').split()]
+            if not quanta or min(quanta) <= 0:
+                raise ValueError("Enter one or more quanta greater than zero.")
+        except ValueError as e:
+            messagebox.showerror("Invalid Input", f"Please enter valid time quanta, e.g. 2, 2,4,8 or auto.\n{e}")
+            return None
+        return quanta
+
+    def exit_app(self):
+        if self.job is not None:
+            self.job.cancel()
+        self.background.shutdown(wait=False, cancel_futures=True)
+        if self.process_pool is not None:
+            self.process_pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
+def main():
+    load_tk()
     root = tk.Tk()
     app = ProcessSchedulerApp(root)
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
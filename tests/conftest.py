@@ -0,0 +1,25 @@
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from process_scheduler.engine import Process  # noqa: E402
+
+
+@pytest.fixture
+def random_processes():
+    """Factory for ``n`` processes with unique PIDs, in no particular arrival order.
+
+    A small ``spread`` crowds arrivals together (ties, long queues); a large
+    one leaves the CPU idle between them.
+    """
+    rng = random.Random(2024)
+
+    def make(n, spread=3, max_burst=8, levels=5):
+        pids = rng.sample(range(1, 10 * n + 1), n)
+        return [Process(pid, rng.randint(0, spread * n), rng.randint(1, max_burst), rng.randint(0, levels))
+                for pid in pids]
+    return make
@@ -0,0 +1,61 @@
+import pytest
+
+from process_scheduler import batch as batch_module
+from process_scheduler.batch import BATCH_METRICS, WorkloadBatch, simulate_batch
+from process_scheduler.engine import ALGORITHMS, simulate
+from process_scheduler.workload import Workload
+
+PARAMS = {'quantum': 3, 'lower_is_higher': False}
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def backend(request, monkeypatch):
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(batch_module, 'numpy', lambda: None)
+    return request.param
+
+
+@pytest.fixture
+def workloads(random_processes):
+    # Sizes 1 to 40, with crowded and idle arrivals mixed in
+    return [Workload.from_processes(random_processes(1 + k % 40, spread=k % 4)) for k in range(120)]
+
+
+@pytest.mark.parametrize('algorithm', list(ALGORITHMS))
+def test_matches_simulate_per_workload(backend, workloads, algorithm):
+    metrics = simulate_batch(algorithm, workloads, **PARAMS)
+    assert sorted(metrics) == sorted(BATCH_METRICS)
+    for k, workload in enumerate(workloads):
+        expected = simulate(algorithm, workload, **PARAMS).metrics()
+        for name in BATCH_METRICS:
+            assert metrics[name][k] == pytest.approx(expected[name]), (k, name)
+
+
+def test_fcfs_restarts_the_clock_for_each_workload(backend):
+    # A late first workload must not delay the next one, and an early
+    # arrival after a long one must not start before its own workload does
+    batch = WorkloadBatch.from_workloads([Workload([1], [1000], [5]), Workload([1, 2], [3, 0], [2, 4])])
+    start, completion = batch_module.schedule_batch('fcfs', batch)
+    assert list(start) == [1000, 4, 0]
+    assert list(completion) == [1005, 6, 4]
+
+
+def test_views_share_the_packed_columns(workloads):
+    batch = WorkloadBatch.from_workloads(workloads)
+    assert len(batch) == len(workloads)
+    assert list(batch.sizes()) == [len(w) for w in workloads]
+    assert list(batch[-1].burst) == list(workloads[-1].burst)
+    view = batch[1]
+    view.burst[0] += 1
+    assert batch.burst[batch.offsets[1]] == workloads[1].burst[0] + 1
+
+
+def test_rejects_bad_batches():
+    with pytest.raises(ValueError):
+        WorkloadBatch([1, 2], [0, 0], [1, 1], offsets=[0, 2, 2])
+    with pytest.raises(ValueError):
+        WorkloadBatch().add(Workload())
+    with pytest.raises(ValueError):
+        simulate_batch('fcfs', [Workload([1], [0], [1])], cpus=2)
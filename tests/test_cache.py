@@ -0,0 +1,78 @@
+import pytest
+
+from process_scheduler.cache import ScheduleCache, _schedule_bytes
+from process_scheduler.engine import simulate
+from process_scheduler.workload import Workload
+
+
+@pytest.fixture
+def workload(random_processes):
+    return Workload.from_processes(random_processes(50))
+
+
+def test_fingerprint_follows_the_content(workload):
+    before = workload.fingerprint()
+    assert Workload.from_processes([]).fingerprint() != before
+    assert workload.copy().fingerprint() == before
+    workload.append(999, 0, 1)
+    appended = workload.fingerprint()
+    assert appended != before
+    workload.truncate(50)
+    assert workload.fingerprint() == before
+    workload.priority[0] += 1
+    workload.truncate(50)
+    assert workload.fingerprint() not in (before, appended)
+
+
+def test_hits_share_the_stored_schedule(workload):
+    cache = ScheduleCache()
+    first = cache.simulate('rr', workload, quantum=3)
+    again = cache.simulate('Round Robin', workload.copy(), quantum=3, lower_is_higher=False)
+    assert again.start is first.start
+    assert again.workload is not first.workload
+    assert cache.metrics('rr', workload, quantum=3) == first.metrics()
+    assert cache.simulate('rr', workload, quantum=4).start is not first.start
+    workload.append(999, 0, 1)
+    assert len(cache.simulate('rr', workload, quantum=3).start) == 51
+
+
+def test_evicts_the_least_recently_used_under_the_budget(workload):
+    size = _schedule_bytes(simulate('sjf', workload))
+    cache = ScheduleCache(max_bytes=2 * size + size // 2)
+    for params in ({}, {'lower_is_higher': True}, {'lower_is_higher': False}):
+        cache.simulate('sjf' if not params else 'priority', workload, **params)
+        assert cache.nbytes <= cache.max_bytes
+    assert cache.lookup_schedule('sjf', workload, {}) is None
+    # A hit refreshes the first priority run, so the next store evicts the second
+    assert cache.lookup_schedule('priority', workload, {'lower_is_higher': True}) is not None
+    other = workload.copy()
+    other.priority[0] += 1
+    cache.simulate('sjf', other)
+    assert cache.lookup_schedule('priority', workload, {'lower_is_higher': False}) is None
+    assert cache.lookup_schedule('priority', workload, {'lower_is_higher': True}) is not None
+    assert len(cache) == 2
+    assert cache.nbytes == 2 * size
+
+
+def test_skips_entries_larger_than_the_budget(workload):
+    cache = ScheduleCache(max_bytes=100)
+    cache.simulate('fcfs', workload)
+    assert len(cache) == 0 and cache.nbytes == 0
+
+
+def test_metrics_persist_in_the_directory(tmp_path, workload):
+    metrics = ScheduleCache(directory=tmp_path).metrics('srtf', workload)
+    cache = ScheduleCache(directory=tmp_path)
+    assert cache.lookup_metrics('srtf', workload, {}) == metrics
+    assert cache.lookup_metrics('srtf', workload, {'lower_is_higher': False}) == metrics
+    assert cache.lookup_metrics('sjf', workload, {}) is None
+
+
+def test_stored_schedules_outlive_appends(workload):
+    cache = ScheduleCache()
+    original = workload.copy()
+    cache.simulate('fcfs', workload)
+    workload.append(999, max(workload.arrival), 1)
+    schedule = cache.lookup_schedule('fcfs', original, {})
+    assert len(schedule.order) == len(original)
+    assert list(schedule.rows()) == list(simulate('fcfs', original).rows())
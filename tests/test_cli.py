@@ -0,0 +1,25 @@
+import json
+
+import pytest
+
+from process_scheduler.cli import EXIT_OK, EXIT_WORKLOAD, main
+
+
+def test_run(tmp_path, capsys):
+    path = tmp_path / 'w.csv'
+    path.write_text("pid,arrival,burst\n1,0,3\n2,1,2\n")
+    assert main(['run', '--algo', 'fcfs,sjf', '--format', 'json', str(path)]) == EXIT_OK
+    assert [record['algorithm'] for record in json.loads(capsys.readouterr().out)[0]['results']] == ['FCFS', 'SJF']
+
+
+@pytest.mark.parametrize('name, content', [
+    ('short.pswl', b'PSWL'),
+    ('huge.csv', b"pid,arrival,burst\n1,0,99999999999999999999\n"),
+    ('huge.jsonl', b'{"pid": 1, "arrival": 0, "burst": 99999999999999999999}\n'),
+    ('empty.csv', b"pid,arrival,burst\n"),
+])
+def test_unreadable_workloads_exit_3(tmp_path, capsys, name, content):
+    path = tmp_path / name
+    path.write_bytes(content)
+    assert main(['run', str(path)]) == EXIT_WORKLOAD
+    assert capsys.readouterr().err.startswith(f"error: {path}: ")
@@ -0,0 +1,171 @@
+"""The engine's runners against the loops they replaced.
+
+The ``baseline_*`` functions are the original ``ProcessSchedulerApp``
+algorithms with the Tk parts removed; every runner must reproduce them
+exactly, apart from the documented Round Robin fix.
+"""
+
+import pytest
+
+from process_scheduler.engine import Process, compare, run_fcfs, run_priority, run_rr, run_sjf, simulate
+
+
+def baseline_fcfs(processes):
+    processes_copy = [p.copy() for p in processes]
+    processes_copy.sort(key=lambda x: x.arrival_time)
+    time = 0
+    for p in processes_copy:
+        if time < p.arrival_time:
+            time = p.arrival_time
+        p.start_time = time
+        time += p.burst_time
+        p.completion_time = time
+    return processes_copy
+
+
+def _baseline_nonpreemptive(processes, key):
+    processes_copy = [p.copy() for p in processes]
+    time = 0
+    completed = 0
+    n = len(processes_copy)
+    ready_queue = []
+    while completed < n:
+        for p in processes_copy:
+            if p.arrival_time <= time and p not in ready_queue and p.completion_time == 0:
+                ready_queue.append(p)
+        if ready_queue:
+            ready_queue.sort(key=key)
+            current = ready_queue.pop(0)
+            if time < current.arrival_time:
+                time = current.arrival_time
+            current.start_time = time
+            time += current.burst_time
+            current.completion_time = time
+            completed += 1
+        else:
+            time += 1
+    return processes_copy
+
+
+def baseline_sjf(processes):
+    return _baseline_nonpreemptive(processes, lambda x: x.burst_time)
+
+
+def baseline_priority(processes, lower_is_higher=True):
+    if lower_is_higher:
+        return _baseline_nonpreemptive(processes, lambda x: (x.priority, x.arrival_time))
+    return _baseline_nonpreemptive(processes, lambda x: (-x.priority, x.arrival_time))
+
+
+def baseline_rr(processes, quantum):
+    processes_copy = [p.copy() for p in processes]
+    time = 0
+    queue = []
+    n = len(processes_copy)
+    completed = 0
+    processes_copy.sort(key=lambda x: x.arrival_time)
+    queue.append(processes_copy[0])
+    i = 1
+    while completed < n:
+        if queue:
+            current = queue.pop(0)
+            if current.start_time == -1:
+                current.start_time = time
+            if current.remaining_time <= quantum:
+                time += current.remaining_time
+                current.remaining_time = 0
+                current.completion_time = time
+                completed += 1
+            else:
+                time += quantum
+                current.remaining_time -= quantum
+            while i < n and processes_copy[i].arrival_time <= time:
+                queue.append(processes_copy[i])
+                i += 1
+            if current.remaining_time > 0:
+                queue.append(current)
+        else:
+            if i < n:
+                queue.append(processes_copy[i])
+                time = processes_copy[i].arrival_time
+                i += 1
+    return processes_copy
+
+
+def times(processes):
+    return {p.pid: (p.start_time, p.completion_time) for p in processes}
+
+
+SPREADS = [0, 1, 3, 20]
+
+
+@pytest.mark.parametrize('spread', SPREADS)
+def test_fcfs_matches_baseline(random_processes, spread):
+    for n in (1, 2, 7, 60):
+        processes = random_processes(n, spread)
+        assert times(run_fcfs(processes).processes) == times(baseline_fcfs(processes))
+
+
+@pytest.mark.parametrize('spread', SPREADS)
+def test_sjf_matches_baseline(random_processes, spread):
+    for n in (1, 2, 7, 60):
+        processes = random_processes(n, spread)
+        assert times(run_sjf(processes).processes) == times(baseline_sjf(processes))
+
+
+@pytest.mark.parametrize('spread', SPREADS)
+@pytest.mark.parametrize('lower_is_higher', [True, False])
+def test_priority_matches_baseline(random_processes, spread, lower_is_higher):
+    for n in (1, 2, 7, 60):
+        processes = random_processes(n, spread)
+        schedule = run_priority(processes, lower_is_higher=lower_is_higher)
+        assert times(schedule.processes) == times(baseline_priority(processes, lower_is_higher))
+
+
+@pytest.mark.parametrize('spread', SPREADS)
+@pytest.mark.parametrize('quantum', [1, 2, 5])
+def test_rr_matches_baseline_when_the_first_process_arrives_at_zero(random_processes, spread, quantum):
+    for n in (1, 2, 7, 60):
+        processes = random_processes(n, spread)
+        processes[0].arrival_time = 0
+        assert times(run_rr(processes, quantum).processes) == times(baseline_rr(processes, quantum))
+
+
+@pytest.mark.parametrize('spread', SPREADS)
+def test_rr_starts_the_clock_at_the_first_arrival(random_processes, spread):
+    # The baseline started at 0 whatever the first arrival; shifting every
+    # arrival down to start at 0 shows the rest of the schedule is unchanged
+    for n in (1, 2, 7, 60):
+        processes = random_processes(n, spread)
+        first = min(p.arrival_time for p in processes) + 3
+        for p in processes:
+            p.arrival_time += 3
+        shifted = [Process(p.pid, p.arrival_time - first, p.burst_time, p.priority) for p in processes]
+        expected = {pid: (start + first, completion + first)
+                    for pid, (start, completion) in times(baseline_rr(shifted, 2)).items()}
+        assert times(run_rr(processes, 2).processes) == expected
+
+
+def test_rr_never_starts_a_process_before_it_arrives():
+    schedule = run_rr([Process(1, 5, 3), Process(2, 6, 2)], quantum=2)
+    assert times(schedule.processes) == {1: (5, 10), 2: (7, 9)}
+    assert list(schedule.slices()) == [(1, 5, 7), (2, 7, 9), (1, 9, 10)]
+
+
+def test_runners_leave_the_input_alone(random_processes):
+    processes = random_processes(20)
+    before = [(p.pid, p.arrival_time, p.burst_time, p.priority, p.start_time, p.completion_time)
+              for p in processes]
+    compare(processes, quantum=3)
+    assert [(p.pid, p.arrival_time, p.burst_time, p.priority, p.start_time, p.completion_time)
+            for p in processes] == before
+
+
+def test_simulate_resolves_aliases_and_drops_unused_params(random_processes):
+    processes = random_processes(15)
+    assert times(simulate('sjf', processes, quantum=4).processes) == times(baseline_sjf(processes))
+    assert times(simulate('rr', processes, quantum=4).processes) == times(run_rr(processes, 4).processes)
+    with pytest.raises(ValueError):
+        simulate('nope', processes)
+    with pytest.raises(ValueError):
+        simulate('rr', processes, quantum=0)
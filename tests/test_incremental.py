@@ -0,0 +1,106 @@
+import pytest
+
+from process_scheduler import engine, incremental
+from process_scheduler.engine import simulate
+from process_scheduler.incremental import RESUMABLE, IncrementalScheduler
+from process_scheduler.workload import Workload
+
+PARAMS = {'quantum': 3, 'lower_is_higher': False}
+
+
+def same_schedule(schedule, expected):
+    assert list(schedule.start) == list(expected.start)
+    assert list(schedule.completion) == list(expected.completion)
+    assert schedule.order is None or list(schedule.order) == list(expected.order)
+    assert schedule.timeline is None or list(schedule.timeline) == list(expected.timeline)
+
+
+@pytest.fixture(autouse=True)
+def frequent_checkpoints(monkeypatch):
+    # Small workloads only reach checkpoints saved every few steps
+    monkeypatch.setattr(engine, 'PROGRESS_STEP', 4)
+
+
+@pytest.mark.parametrize('algorithm', list(RESUMABLE))
+@pytest.mark.parametrize('spread', [1, 3, 20])
+def test_appending_matches_a_full_run(random_processes, algorithm, spread):
+    processes = random_processes(120, spread)
+    scheduler = IncrementalScheduler(algorithm, **PARAMS)
+    workload = Workload()
+    for lo, hi in ((0, 1), (1, 40), (40, 45), (45, 120)):
+        for p in processes[lo:hi]:
+            workload.append(p.pid, p.arrival_time, p.burst_time, p.priority)
+            scheduler.append(p.pid, p.arrival_time, p.burst_time, p.priority)
+        same_schedule(scheduler.schedule(), simulate(algorithm, workload, **PARAMS))
+
+
+@pytest.mark.parametrize('algorithm', list(RESUMABLE))
+def test_late_arrivals_resume_from_a_checkpoint(random_processes, algorithm):
+    processes = sorted(random_processes(200), key=lambda p: p.arrival_time)
+    workload = Workload.from_processes(processes[:150])
+    scheduler = IncrementalScheduler(algorithm, workload, **PARAMS)
+    scheduler.schedule()
+    assert scheduler.resumed_at is None
+    for p in processes[150:]:
+        workload.append(p.pid, p.arrival_time, p.burst_time, p.priority)
+    assert scheduler.extend_to(workload)
+    same_schedule(scheduler.schedule(), simulate(algorithm, workload, **PARAMS))
+    assert scheduler.resumed_at is not None
+
+
+def test_extend_to_refuses_an_edited_workload(random_processes):
+    workload = Workload.from_processes(random_processes(10))
+    scheduler = IncrementalScheduler('sjf', workload)
+    edited = workload.copy()
+    edited.burst[3] += 1
+    assert not scheduler.extend_to(edited)
+    assert len(scheduler) == 10
+
+
+def test_schedules_share_the_growing_arrays(random_processes):
+    processes = random_processes(30)
+    scheduler = IncrementalScheduler('rr', Workload.from_processes(processes[:20]), quantum=2)
+    first = scheduler.schedule()
+    assert first.start is scheduler.start and first.timeline is scheduler.timeline
+    kept = first.copy()
+    completion = list(kept.completion)
+    for p in processes[20:]:
+        scheduler.append(p.pid, p.arrival_time, p.burst_time, p.priority)
+    assert scheduler.schedule().start is scheduler.start
+    assert list(kept.completion) == completion
+    assert len(kept) == 20 and len(kept.order) == 20
+
+
+@pytest.mark.parametrize('algorithm', list(RESUMABLE))
+def test_a_resumed_run_keeps_its_checkpoint(random_processes, monkeypatch, algorithm):
+    monkeypatch.setattr(incremental, 'MAX_CHECKPOINTS', 10 ** 6)
+    processes = sorted(random_processes(200), key=lambda p: p.arrival_time)
+    scheduler = IncrementalScheduler(algorithm, Workload.from_processes(processes[:150]), **PARAMS)
+    scheduler.schedule()
+    for p in processes[150:]:
+        scheduler.append(p.pid, p.arrival_time, p.burst_time, p.priority)
+    scheduler.schedule()
+    resumed_at = scheduler.resumed_at
+    assert resumed_at in [clock for clock, _ in scheduler.checkpoints]
+    # Another arrival just after it resumes from the same checkpoint
+    last = processes[-1]
+    scheduler.append(10 ** 6, resumed_at + 1, last.burst_time, last.priority)
+    scheduler.schedule()
+    assert scheduler.resumed_at == resumed_at
+
+
+def test_appends_grow_the_arrival_order_in_place():
+    workload = Workload([1, 2, 3], [0, 5, 5], [1, 1, 1])
+    order = workload.arrival_order()
+    workload.append(4, 5, 1)
+    workload.append(5, 2, 1)
+    assert workload.arrival_order() is order
+    assert list(order) == [0, 4, 1, 2, 3]
+    assert list(order) == sorted(range(5), key=workload.arrival.__getitem__)
+
+
+def test_rejects_algorithms_it_cannot_resume():
+    with pytest.raises(ValueError):
+        IncrementalScheduler('mlfq')
+    with pytest.raises(ValueError):
+        IncrementalScheduler('sjf').schedule()
@@ -0,0 +1,60 @@
+import pytest
+
+from process_scheduler.engine import Process, run_mlfq
+
+
+def slices(schedule):
+    pid = schedule.workload.pid
+    return [(pid[index], start, end) for index, start, end in schedule.timeline]
+
+
+def test_a_full_quantum_demotes_one_level():
+    schedule = run_mlfq([Process(1, 0, 10), Process(2, 0, 10)], level_quanta=(2, 4, 8), boost_interval=0)
+    # Level 0 runs 2 units each, level 1 runs 4, the rest finishes on level 2
+    assert slices(schedule) == [(1, 0, 2), (2, 2, 4), (1, 4, 8), (2, 8, 12), (1, 12, 16), (2, 16, 20)]
+
+
+def test_the_bottom_level_stays_round_robin():
+    schedule = run_mlfq([Process(1, 0, 7), Process(2, 0, 7)], level_quanta=(1, 2), boost_interval=0)
+    assert slices(schedule) == [(1, 0, 1), (2, 1, 2), (1, 2, 4), (2, 4, 6), (1, 6, 8), (2, 8, 10), (1, 10, 12),
+                                (2, 12, 14)]
+
+
+def test_an_arrival_preempts_a_lower_level():
+    schedule = run_mlfq([Process(1, 0, 10), Process(2, 3, 1)], level_quanta=(2, 4, 8), boost_interval=0)
+    # P1 is a unit into its level-1 quantum at 3; it keeps that unit after P2
+    assert slices(schedule) == [(1, 0, 3), (2, 3, 4), (1, 4, 11)]
+    assert list(schedule.completion) == [11, 4]
+
+
+def test_an_arrival_does_not_preempt_level_zero():
+    schedule = run_mlfq([Process(1, 0, 10), Process(2, 1, 1)], level_quanta=(4, 8), boost_interval=0)
+    assert slices(schedule)[:2] == [(1, 0, 4), (2, 4, 5)]
+
+
+def test_boost_returns_waiting_processes_to_level_zero():
+    processes = [Process(1, 0, 30), Process(2, 0, 30), Process(3, 5, 2)]
+    unboosted = run_mlfq(processes, level_quanta=(1, 100), boost_interval=0)
+    assert list(unboosted.completion) == [61, 35, 62]
+    # At the first dispatch after 10 (time 35), P1 and P3 are back on level 0,
+    # where P3 finishes before P1 drops to level 1 again
+    boosted = run_mlfq(processes, level_quanta=(1, 100), boost_interval=10)
+    assert slices(boosted)[-3:] == [(1, 35, 36), (3, 36, 37), (1, 37, 62)]
+    assert list(boosted.completion) == [62, 35, 37]
+
+
+def test_every_unit_of_burst_is_scheduled(random_processes):
+    processes = random_processes(200, spread=2, max_burst=30)
+    schedule = run_mlfq(processes, level_quanta=(2, 5, 9), boost_interval=40)
+    ran = {}
+    for index, start, end in schedule.timeline:
+        assert start >= schedule.workload.arrival[index]
+        ran[index] = ran.get(index, 0) + end - start
+    assert ran == {i: burst for i, burst in enumerate(schedule.workload.burst)}
+    assert all(a <= b for a, b in zip(schedule.timeline.end, schedule.timeline.start[1:]))
+
+
+@pytest.mark.parametrize('options', [{'level_quanta': ()}, {'level_quanta': (2, 0)}, {'boost_interval': -1}])
+def test_rejects_bad_parameters(options):
+    with pytest.raises(ValueError):
+        run_mlfq([Process(1, 0, 1)], **options)
@@ -0,0 +1,90 @@
+import itertools
+
+import pytest
+
+from process_scheduler.engine import Process, simulate
+from process_scheduler.multicore import PLACEMENTS, QUEUES, SUPPORTED, simulate_multicore
+
+PARAMS = {'quantum': 3, 'lower_is_higher': False}
+LAYOUTS = [(queues, placement, steal) for queues in QUEUES for placement in PLACEMENTS for steal in (False, True)
+           if queues == 'per-cpu' or (placement, steal) == ('least-loaded', False)]
+
+
+def slices(schedule):
+    t = schedule.timeline
+    return list(zip(t.index, t.start, t.end, t.cpu))
+
+
+@pytest.mark.parametrize('algorithm', SUPPORTED)
+@pytest.mark.parametrize('spread', [0, 1, 3])
+def test_one_cpu_reproduces_the_single_cpu_runner(random_processes, algorithm, spread):
+    processes = random_processes(80, spread)
+    expected = simulate(algorithm, processes, **PARAMS)
+    schedule = simulate_multicore(algorithm, processes, cpus=1, **PARAMS)
+    assert list(schedule.start) == list(expected.start)
+    assert list(schedule.completion) == list(expected.completion)
+    if expected.timeline is not None:
+        assert [s[:3] for s in slices(schedule)] == list(expected.timeline)
+
+
+@pytest.mark.parametrize('algorithm', SUPPORTED)
+@pytest.mark.parametrize('cpus', [2, 3])
+@pytest.mark.parametrize('queues, placement, steal', LAYOUTS)
+def test_slices_are_consistent(random_processes, algorithm, cpus, queues, placement, steal):
+    processes = random_processes(120, spread=1)
+    schedule = simulate_multicore(algorithm, processes, cpus=cpus, queues=queues, placement=placement, steal=steal,
+                                  **PARAMS)
+    workload = schedule.workload
+    by_cpu, by_process = {}, {}
+    for index, start, end, cpu in slices(schedule):
+        assert 0 <= cpu < cpus
+        assert start < end
+        assert start >= workload.arrival[index]
+        by_cpu.setdefault(cpu, []).append((start, end))
+        by_process.setdefault(index, []).append((start, end))
+    # No CPU runs two slices at once, and no process runs on two CPUs at once
+    for runs in itertools.chain(by_cpu.values(), by_process.values()):
+        runs.sort()
+        assert all(end <= next_start for (_, end), (next_start, _) in zip(runs, runs[1:]))
+    assert sorted(by_process) == list(range(len(workload)))
+    for index, runs in by_process.items():
+        assert sum(end - start for start, end in runs) == workload.burst[index]
+        assert runs[0][0] == schedule.start[index]
+        assert runs[-1][1] == schedule.completion[index]
+
+
+def test_global_queue_keeps_every_cpu_busy():
+    processes = [Process(pid, 0, 4) for pid in range(1, 5)]
+    schedule = simulate_multicore('fcfs', processes, cpus=2)
+    assert list(schedule.completion) == [4, 4, 8, 8]
+    assert schedule.core_busy() == [8, 8]
+
+
+def test_round_robin_placement_deals_arrivals_out_in_turn():
+    processes = [Process(1, 0, 10), Process(2, 0, 1), Process(3, 0, 5), Process(4, 0, 5)]
+    schedule = simulate_multicore('fcfs', processes, cpus=2, queues='per-cpu', placement='round-robin')
+    assert {index: cpu for index, _, _, cpu in slices(schedule)} == {0: 0, 1: 1, 2: 0, 3: 1}
+    assert list(schedule.start) == [0, 0, 10, 1]
+
+
+def test_least_loaded_placement_fills_the_emptier_queue():
+    processes = [Process(1, 0, 10), Process(2, 0, 10), Process(3, 5, 1)]
+    schedule = simulate_multicore('fcfs', processes, cpus=3, queues='per-cpu')
+    assert [cpu for _, _, _, cpu in sorted(slices(schedule))] == [0, 1, 2]
+
+
+def test_steal_takes_work_from_the_longest_queue():
+    processes = [Process(1, 0, 10), Process(2, 0, 1), Process(3, 0, 5), Process(4, 0, 5)]
+    options = dict(cpus=2, queues='per-cpu', placement='round-robin')
+    assert simulate_multicore('fcfs', processes, **options).start[2] == 10
+    stolen = simulate_multicore('fcfs', processes, steal=True, **options)
+    assert stolen.start[2] == 6
+    assert {index: cpu for index, _, _, cpu in slices(stolen)}[2] == 1
+
+
+@pytest.mark.parametrize('options', [{'algorithm': 'mlfq'}, {'cpus': 0}, {'queues': 'shared'},
+                                     {'placement': 'random'}, {'algorithm': 'rr', 'quantum': 0}])
+def test_rejects_bad_options(options):
+    options = dict({'algorithm': 'fcfs', 'processes': [Process(1, 0, 1)]}, **options)
+    with pytest.raises(ValueError):
+        simulate_multicore(**options)
@@ -0,0 +1,58 @@
+import pytest
+
+from process_scheduler.engine import Process, simulate
+from process_scheduler.online import ADVANCE, OnlineScheduler, RollingMetrics, stream
+
+PARAMS = {'quantum': 3, 'lower_is_higher': False}
+
+
+@pytest.mark.parametrize('algorithm', list(ADVANCE))
+@pytest.mark.parametrize('spread', [0, 1, 3, 20])
+def test_stream_matches_simulate(random_processes, algorithm, spread):
+    processes = sorted(random_processes(150, spread), key=lambda p: p.arrival_time)
+    expected = simulate(algorithm, processes, **PARAMS).processes
+    completed = list(stream(algorithm, processes, **PARAMS))
+    assert len(completed) == len(processes)
+    assert ({p.pid: (p.start_time, p.completion_time) for p in completed}
+            == {p.pid: (p.start_time, p.completion_time) for p in expected})
+    assert [p.completion_time for p in completed] == sorted(p.completion_time for p in completed)
+
+
+def test_stream_accepts_tuples():
+    assert [(p.pid, p.completion_time) for p in stream('fcfs', [(1, 0, 2), (2, 1, 3, 4)])] == [(1, 2), (2, 5)]
+
+
+def test_completions_are_released_once_certain():
+    scheduler = OnlineScheduler('rr', quantum=2)
+    assert scheduler.add(1, 0, 5) == []
+    done = scheduler.add(2, 10, 5)
+    assert [p.pid for p in done] == [1]
+    assert len(scheduler) == 1
+    assert [p.pid for p in scheduler.finish()] == [2]
+
+
+def test_rejects_out_of_order_arrivals_and_late_adds():
+    scheduler = OnlineScheduler('sjf')
+    scheduler.add(1, 5, 1)
+    with pytest.raises(ValueError):
+        scheduler.add(2, 4, 1)
+    scheduler.finish()
+    with pytest.raises(ValueError):
+        scheduler.add(3, 9, 1)
+
+
+def test_rolling_metrics_window():
+    rolling = RollingMetrics(window=2)
+    for pid, (arrival, start, completion) in enumerate([(0, 0, 4), (1, 4, 6), (2, 6, 7)], 1):
+        p = Process(pid, arrival, completion - start)
+        p.start_time, p.completion_time = start, completion
+        assert rolling.add(p) is None
+    metrics = rolling.metrics()
+    assert metrics['TAT'] == pytest.approx(5.0)
+    assert metrics['WT'] == pytest.approx(3.5)
+
+
+@pytest.mark.parametrize('options', [{'window': 0}, {'window': -1}, {'span': 0}, {'span': -5}])
+def test_rolling_metrics_rejects_empty_windows(options):
+    with pytest.raises(ValueError):
+        RollingMetrics(**options)
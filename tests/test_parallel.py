@@ -0,0 +1,53 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from process_scheduler.cache import ScheduleCache
+from process_scheduler.engine import ALGORITHMS, compare
+from process_scheduler.parallel import compare_parallel
+
+PARAMS = {'quantum': 3, 'lower_is_higher': False}
+
+
+@pytest.fixture(scope='module')
+def executor():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+@pytest.mark.parametrize('min_parallel', [0, 10 ** 9])
+def test_matches_compare(random_processes, executor, min_parallel):
+    processes = random_processes(300, spread=2)
+    expected = compare(processes, **PARAMS)
+    assert compare_parallel(processes, executor=executor, min_parallel=min_parallel, **PARAMS) == expected
+    assert [label for label, _ in expected[0]] == list(ALGORITHMS)
+
+
+def test_quanta_expand_the_quantum_algorithms(random_processes, executor):
+    processes = random_processes(100)
+    results, _ = compare_parallel(processes, algorithms=['fcfs', 'rr'], quanta=[2, 5, 2], executor=executor,
+                                  min_parallel=0)
+    assert [label for label, _ in results] == ['FCFS', 'Round Robin (q=2)', 'Round Robin (q=5)']
+    assert results[2][1] == compare(processes, ['Round Robin'], quantum=5)[0][0][1]
+    results, _ = compare_parallel(processes, algorithms=['rr'], quanta=[4, 4])
+    assert results == compare(processes, ['Round Robin'], quantum=4)[0]
+
+
+def test_only_uncached_runs_are_simulated(random_processes):
+    processes = random_processes(100)
+    cache = ScheduleCache()
+    first = compare_parallel(processes, algorithms=['fcfs', 'sjf'], cache=cache)
+    assert len(cache) == 2
+    calls = []
+    second = compare_parallel(processes, algorithms=['sjf', 'srtf', 'fcfs'], cache=cache,
+                              progress=lambda done, total: calls.append((done, total)))
+    assert second[0][0] == first[0][1] and second[0][2] == first[0][0]
+    assert second == compare(processes, ['SJF', 'SRTF', 'FCFS'])
+    # Progress counts in runs, and only SRTF was left to run
+    assert {total for _, total in calls} == {1}
+    assert len(cache) == 3
+
+
+def test_rejects_an_empty_workload():
+    with pytest.raises(ValueError):
+        compare_parallel([])
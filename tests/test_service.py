@@ -0,0 +1,159 @@
+import asyncio
+import http.client
+import json
+import socket
+import threading
+
+import pytest
+
+from process_scheduler.engine import ALGORITHMS, simulate
+from process_scheduler.service import SchedulerService, _Run
+from process_scheduler.workload import Workload
+
+PROCESSES = [{'pid': 1, 'arrival': 0, 'burst': 5, 'priority': 2}, {'pid': 2, 'arrival': 1, 'burst': 3},
+             {'pid': 3, 'arrival': 2, 'burst': 8, 'priority': 1}, {'pid': 4, 'arrival': 30, 'burst': 2}]
+
+
+class Server:
+    """A ``SchedulerService`` on an ephemeral port, with its event loop in a thread."""
+
+    def __init__(self, **options):
+        self.ready = threading.Event()
+        self.thread = threading.Thread(target=asyncio.run, args=(self._main(options),), daemon=True)
+        self.thread.start()
+        self.ready.wait()
+
+    async def _main(self, options):
+        self.loop = asyncio.get_running_loop()
+        self.service = SchedulerService(workers=2, **options)
+        server = await self.service.start('127.0.0.1', 0)
+        self.port = server.sockets[0].getsockname()[1]
+        self.stopped = asyncio.Event()
+        self.ready.set()
+        await self.stopped.wait()
+        server.close()
+        await self.service.close()
+
+    def call(self, func):
+        """Run ``func()`` on the server's loop and return its result."""
+        async def wrapper():
+            return func()
+        return asyncio.run_coroutine_threadsafe(wrapper(), self.loop).result()
+
+    def request(self, method, path, body=None):
+        conn = http.client.HTTPConnection('127.0.0.1', self.port, timeout=10)
+        try:
+            conn.request(method, path, json.dumps(body) if body is not None else None)
+            response = conn.getresponse()
+            return response.status, json.loads(response.read()), response
+        finally:
+            conn.close()
+
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.stopped.set)
+        self.thread.join()
+
+
+@pytest.fixture
+def server():
+    server = Server(queue_size=4)
+    yield server
+    server.stop()
+
+
+def test_first_request_with_connection_close_reaches_eof(server):
+    body = json.dumps({'algorithm': 'fcfs', 'processes': PROCESSES}).encode()
+    with socket.create_connection(('127.0.0.1', server.port), timeout=5) as s:
+        s.sendall(b"POST /simulate HTTP/1.1\r\nHost: test\r\nConnection: close\r\n"
+                  b"Content-Length: %d\r\n\r\n" % len(body) + body)
+        data = b''
+        while True:
+            chunk = s.recv(65536)
+            if not chunk:
+                break
+            data += chunk
+    assert data.startswith(b'HTTP/1.1 200')
+
+
+def test_algorithms(server):
+    status, body, _ = server.request('GET', '/algorithms')
+    assert status == 200
+    assert [entry['name'] for entry in body['algorithms']] == list(ALGORITHMS)
+
+
+@pytest.mark.parametrize('algorithm', list(ALGORITHMS))
+def test_simulate_matches_the_engine(server, algorithm):
+    status, body, _ = server.request('POST', '/simulate',
+                                     {'algorithm': algorithm, 'processes': PROCESSES, 'params': {'quantum': 3}})
+    assert status == 200
+    workload = Workload()
+    for p in PROCESSES:
+        workload.append(p['pid'], p['arrival'], p['burst'], p.get('priority', 0))
+    assert body['algorithm'] == algorithm
+    assert body['metrics'] == json.loads(json.dumps(simulate(algorithm, workload, quantum=3).metrics()))
+
+
+def test_simulate_columns_with_schedule(server):
+    columns = {name: [p.get(name, 0) for p in PROCESSES] for name in ('pid', 'arrival', 'burst')}
+    status, body, _ = server.request('POST', '/simulate', {'algorithm': 'sjf', 'columns': columns, 'schedule': True})
+    assert status == 200
+    assert sorted(body['schedule']['pid']) == [1, 2, 3, 4]
+
+
+def test_compare(server):
+    status, body, _ = server.request('POST', '/compare', {'processes': PROCESSES, 'algorithms': ['fcfs', 'rr'],
+                                                          'quanta': [2, 4]})
+    assert status == 200
+    assert [r['algorithm'] for r in body['results']] == ['FCFS', 'Round Robin (q=2)', 'Round Robin (q=4)']
+    assert body['best'] in {r['algorithm'] for r in body['results']}
+    assert body['skipped'] == []
+
+
+def test_compare_on_several_cpus_skips_algorithms_without_a_model(server):
+    status, body, _ = server.request('POST', '/compare', {'processes': PROCESSES, 'algorithms': ['fcfs', 'mlfq'],
+                                                          'params': {'cpus': 2}})
+    assert status == 200
+    assert [r['algorithm'] for r in body['results']] == ['FCFS']
+    assert body['skipped'] == ['MLFQ']
+    status, body, _ = server.request('POST', '/compare', {'processes': PROCESSES, 'algorithms': ['mlfq'],
+                                                          'params': {'cpus': 2}})
+    assert status == 400
+
+
+@pytest.mark.parametrize('path, request_body, message', [
+    ('/simulate', {'algorithm': 'sjf', 'processes': [{'pid': 1, 'arrival': 0, 'burst': True}]},
+     "line 1: Burst must be an integer, got True."),
+    ('/simulate', {'algorithm': 'sjf', 'processes': [{'pid': 1, 'arrival': 0, 'burst': 0}]},
+     "line 1: Burst time must be greater than zero."),
+    ('/simulate', {'algorithm': 'sjf', 'columns': {'pid': [1], 'arrival': [False], 'burst': [2]}},
+     "line 1: Arrival must be an integer, got False."),
+    ('/simulate', {'algorithm': 5, 'processes': PROCESSES}, "'algorithm' must be an algorithm name."),
+    ('/simulate', {'algorithm': 'nope', 'processes': PROCESSES}, "Unknown algorithm: nope"),
+    ('/simulate', {'algorithm': 'rr', 'processes': PROCESSES, 'params': {'quantum': 1.5}},
+     "'quantum' must be a positive integer."),
+    ('/simulate', {'algorithm': 'mlfq', 'processes': PROCESSES, 'params': {'level_quanta': 'ab'}},
+     "'level_quanta' must be a list of positive integers."),
+    ('/compare', {'processes': PROCESSES, 'algorithms': 'fcfs'}, "'algorithms' must be a list of algorithm names."),
+    ('/compare', {'processes': PROCESSES, 'algorithms': ['rr'], 'quanta': [0]},
+     "'quanta' must be a list of positive integers."),
+    ('/compare', {'processes': PROCESSES}, "This request needs 7 runs; the server queues at most 4 at once."),
+])
+def test_bad_fields_are_400(server, path, request_body, message):
+    status, body, response = server.request('POST', path, request_body)
+    assert (status, body) == (400, {'error': message})
+    assert response.getheader('Retry-After') is None
+
+
+def test_full_queue_is_503_with_retry_after(server):
+    service = server.service
+
+    def fill():
+        service._dispatcher.cancel()
+        for _ in range(service.queue.maxsize):
+            service.queue.put_nowait(_Run(None, 'FCFS', {}, False, 1, server.loop.create_future()))
+
+    server.call(fill)
+    status, body, response = server.request('POST', '/simulate', {'algorithm': 'fcfs', 'processes': PROCESSES})
+    assert status == 503
+    assert response.getheader('Retry-After') == '1'
+    server.call(lambda: [service.queue.get_nowait() for _ in range(service.queue.qsize())])
@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from process_scheduler import trace as trace_module
+from process_scheduler.engine import simulate
+from process_scheduler.multicore import MulticoreSchedule, simulate_multicore
+from process_scheduler.trace import HEADER, MAGIC, VERSION, TraceError, TraceWriter, load_trace, save_trace
+
+
+def columns(schedule):
+    w = schedule.workload
+    result = [list(c) for c in (w.pid, w.arrival, w.burst, w.priority, schedule.start, schedule.completion)]
+    result.append(list(schedule.order) if schedule.order is not None else None)
+    t = schedule.timeline
+    result.append([list(getattr(t, name)) for name in ('index', 'start', 'end', 'cpu') if hasattr(t, name)]
+                  if t is not None else None)
+    return result
+
+
+@pytest.mark.parametrize('use_mmap', [True, False])
+@pytest.mark.parametrize('algorithm', ['FCFS', 'SJF', 'Round Robin', 'SRTF'])
+def test_round_trip(tmp_path, random_processes, use_mmap, algorithm):
+    schedule = simulate(algorithm, random_processes(300), quantum=2)
+    path = tmp_path / 'run.pstr'
+    save_trace(schedule, path, metadata={'label': 'test'})
+    trace = load_trace(path, use_mmap=use_mmap)
+    assert (trace.algorithm, trace.params, trace.metadata['label']) == (algorithm, schedule.params, 'test')
+    replayed = trace.schedule()
+    assert columns(replayed) == columns(schedule)
+    assert replayed.metrics() == schedule.metrics()
+
+
+def test_multicore_round_trip(tmp_path, random_processes):
+    schedule = simulate_multicore('srtf', random_processes(200, spread=1), cpus=3, queues='per-cpu', steal=True)
+    path = tmp_path / 'run.pstr'
+    save_trace(schedule, path)
+    replayed = load_trace(path).schedule()
+    assert isinstance(replayed, MulticoreSchedule)
+    assert replayed.cpus == 3
+    assert columns(replayed) == columns(schedule)
+    assert replayed.metrics() == schedule.metrics()
+
+
+def test_writer_spools_long_slice_logs(tmp_path, random_processes, monkeypatch):
+    monkeypatch.setattr(trace_module, 'CHUNK_SIZE', 16)
+    schedule = simulate('rr', random_processes(100, max_burst=20), quantum=1)
+    assert len(schedule.timeline) > 4 * 16
+    path = tmp_path / 'run.pstr'
+    save_trace(schedule, path)
+    assert columns(load_trace(path).schedule()) == columns(schedule)
+
+
+def test_arrays_are_views(tmp_path, random_processes):
+    np = pytest.importorskip('numpy')
+    schedule = simulate('rr', random_processes(50))
+    path = tmp_path / 'run.pstr'
+    save_trace(schedule, path)
+    arrays = load_trace(path).arrays()
+    assert arrays['completion'].tolist() == list(schedule.completion)
+    assert arrays['slice_end'].tolist() == list(schedule.timeline.end)
+    assert not arrays['pid'].flags.writeable
+    assert arrays['pid'].dtype == np.int64
+
+
+def test_an_unfinished_trace_is_deleted(tmp_path, random_processes):
+    schedule = simulate('fcfs', random_processes(10))
+    path = tmp_path / 'run.pstr'
+    with pytest.raises(RuntimeError):
+        with TraceWriter(path, schedule.workload, 'FCFS'):
+            raise RuntimeError
+    assert not path.exists()
+
+
+def _metadata_only(meta):
+    meta = json.dumps(meta).encode()
+    return HEADER.pack(MAGIC, VERSION, 0, 0, 0, len(meta)) + meta
+
+
+@pytest.mark.parametrize('damage, message', [
+    (lambda data: data[:-8], 'truncated'),
+    (lambda data: data[:10], 'not a schedule trace'),
+    (lambda data: b'PSWL' + data[4:], 'not a schedule trace'),
+    (lambda data: data[:4] + b'\x09' + data[5:], 'Unsupported trace version'),
+    (lambda data: _metadata_only({'params': {}}), 'unreadable metadata'),
+    (lambda data: _metadata_only({'algorithm': 'FCFS', 'params': []}), 'unreadable metadata'),
+    (lambda data: _metadata_only([1]), 'unreadable metadata'),
+])
+def test_rejects_damaged_traces(tmp_path, random_processes, damage, message):
+    path = tmp_path / 'run.pstr'
+    save_trace(simulate('rr', random_processes(20)), path)
+    path.write_bytes(damage(path.read_bytes()))
+    with pytest.raises(TraceError, match=message):
+        load_trace(path)
@@ -0,0 +1,55 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from process_scheduler.engine import Process, run_rr
+from process_scheduler.tuning import MAX_DEFAULT_QUANTA, default_quanta, recommend, sweep_quantum, tune_quantum
+from process_scheduler.workload import Workload
+
+
+def point(quantum, wt, switches):
+    return {'quantum': quantum, 'TAT': 0.0, 'WT': wt, 'RT': 0.0, 'context_switches': switches}
+
+
+def test_sweep_matches_single_runs(random_processes):
+    processes = random_processes(150, max_burst=12)
+    points = sweep_quantum(processes, [3, 1, 3, 2])
+    assert [p['quantum'] for p in points] == [1, 2, 3]
+    for p in points:
+        schedule = run_rr(processes, p['quantum'])
+        metrics = schedule.metrics()
+        assert (p['TAT'], p['WT'], p['RT']) == (metrics['TAT'], metrics['WT'], metrics['RT'])
+        assert p['context_switches'] == schedule.timeline.context_switches()
+
+
+def test_parallel_sweep_matches_in_process(random_processes):
+    processes = random_processes(150, max_burst=12)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        parallel = sweep_quantum(processes, list(range(1, 10)), executor=executor, max_workers=2, min_parallel=0)
+    assert parallel == sweep_quantum(processes, list(range(1, 10)))
+
+
+def test_recommend_breaks_ties():
+    assert recommend([point(4, 2.0, 3), point(2, 1.0, 9), point(3, 1.0, 5)])['quantum'] == 3
+    # Equal on both, the smaller quantum wins whatever the order
+    assert recommend([point(6, 1.0, 5), point(3, 1.0, 5)])['quantum'] == 3
+    assert recommend([point(2, 1.0, 9), point(5, 3.0, 1)], objective='context_switches')['quantum'] == 5
+
+
+def test_tune_quantum_stops_where_rr_becomes_fcfs():
+    # Every quantum from the longest burst up gives the same schedule
+    processes = [Process(1, 0, 4), Process(2, 0, 4)]
+    assert tune_quantum(processes, [8, 4, 6]) == 4
+
+
+def test_default_quanta_are_thinned():
+    assert default_quanta(Workload([1, 2], [0, 0], [5, 3])) == [1, 2, 3, 4, 5]
+    quanta = default_quanta(Workload([1], [0], [10 * MAX_DEFAULT_QUANTA + 7]))
+    assert quanta[0] == 1 and len(quanta) <= MAX_DEFAULT_QUANTA
+
+
+def test_rejects_bad_sweeps():
+    with pytest.raises(ValueError):
+        sweep_quantum([])
+    with pytest.raises(ValueError):
+        sweep_quantum([Process(1, 0, 1)], [0, 1])
@@ -0,0 +1,136 @@
+import pytest
+
+from process_scheduler import workload_io
+from process_scheduler.workload import Workload
+from process_scheduler.workload_io import (
+    WorkloadError,
+    iter_records,
+    load_binary,
+    load_csv,
+    load_jsonl,
+    load_workload,
+    save_workload,
+)
+
+FORMATS = ['.csv', '.jsonl', '.pswl']
+
+
+def columns(workload):
+    return [list(getattr(workload, name)) for name in workload_io.FIELDS]
+
+
+@pytest.fixture
+def workload(random_processes):
+    return Workload.from_processes(random_processes(500, spread=2, levels=9))
+
+
+@pytest.mark.parametrize('ext', FORMATS)
+def test_round_trip(tmp_path, workload, ext):
+    path = tmp_path / f'w{ext}'
+    save_workload(workload, path)
+    assert columns(load_workload(path)) == columns(workload)
+    assert list(iter_records(path)) == list(workload.rows())
+
+
+@pytest.mark.parametrize('ext', ['.csv', '.jsonl'])
+def test_round_trip_in_small_chunks(tmp_path, workload, ext):
+    # Several chunks, the last one partial
+    path = tmp_path / f'w{ext}'
+    save_workload(workload, path)
+    load = load_csv if ext == '.csv' else load_jsonl
+    assert columns(load(path, chunk_size=64)) == columns(workload)
+
+
+def test_binary_copy_is_writable_and_map_is_not(tmp_path, workload):
+    path = tmp_path / 'w.pswl'
+    save_workload(workload, path)
+    copied = load_binary(path, use_mmap=False)
+    copied.append(10**6, 0, 1)
+    assert len(copied) == len(workload) + 1
+    mapped = load_binary(path)
+    assert columns(mapped) == columns(workload)
+    with pytest.raises(TypeError):
+        mapped.burst[0] = 1
+
+
+def test_loading_into_appends(tmp_path, workload):
+    path = tmp_path / 'w.csv'
+    path.write_text("pid,arrival,burst\n900001,1,2\n900002,3,4\n")
+    load_workload(path, into=workload)
+    assert list(workload.pid[-2:]) == [900001, 900002]
+    assert list(workload.priority[-2:]) == [0, 0]
+
+
+def test_header_and_key_aliases(tmp_path):
+    csv_path = tmp_path / 'w.csv'
+    csv_path.write_text("Process_ID, Arrival_Time ,burst_time,priority\n1,0,3,2\n")
+    jsonl_path = tmp_path / 'w.jsonl'
+    jsonl_path.write_text('{"process_id": 1, "arrival_time": 0, "burst_time": 3, "priority": 2}\n\n')
+    assert list(load_workload(csv_path).rows()) == list(load_workload(jsonl_path).rows()) == [(1, 0, 3, 2)]
+
+
+CSV_REJECTS = [
+    ("pid,arrival,burst\n1,0,3\n2,-1,3\n", "line 3: Arrival time must be non-negative."),
+    ("pid,arrival,burst\n1,0,0\n", "line 2: Burst time must be greater than zero."),
+    ("pid,arrival,burst,priority\n1,0,3,-2\n", "line 2: Priority must be non-negative."),
+    ("pid,arrival,burst\nx,0,3\n", "line 2: Process ID must be a number."),
+    ("pid,arrival,burst\n1,0,2.5\n", "line 2: Burst must be an integer, got '2.5'."),
+    ("pid,arrival,burst\n1,0,3\n1,2,3\n", "Process ID must be unique (duplicate PID 1)."),
+    ("pid,burst\n1,3\n", "line 1: CSV header is missing column(s): arrival"),
+    ("pid,arrival,burst\n1,0,99999999999999999999\n", "line 2: Burst '99999999999999999999' does not fit in 64 bits."),
+]
+
+JSONL_REJECTS = [
+    ('{"pid": 1, "arrival": 0, "burst": 3}\n{"pid": 2, "arrival": 0}\n', "line 2: missing field 'burst'."),
+    ('{"pid": 1, "arrival": 0, "burst": 3}\n{"pid": 2,\n', "line 2: invalid JSON"),
+    ('{"pid": 1, "arrival": 0, "burst": true}\n', "line 1: Burst must be an integer, got True."),
+    ('{"pid": 1, "arrival": 0, "burst": 3}\n{"pid": 2, "arrival": false, "burst": 3}\n',
+     "line 2: Arrival must be an integer, got False."),
+    ('{"pid": 1, "arrival": 0, "burst": 1.5}\n', "line 1: Burst must be an integer, got 1.5."),
+    ('{"pid": 1, "arrival": 0, "burst": 3}\n{"pid": 2, "arrival": 9223372036854775808, "burst": 3}\n',
+     "line 2: Arrival 9223372036854775808 does not fit in 64 bits."),
+    ('{"pid": 1, "arrival": 0, "burst": 3}\n{"pid": 1, "arrival": 0, "burst": 3}\n',
+     "Process ID must be unique (duplicate PID 1)."),
+]
+
+
+@pytest.mark.parametrize('ext, text, message',
+                         [('.csv',) + case for case in CSV_REJECTS] + [('.jsonl',) + case for case in JSONL_REJECTS])
+def test_rejects_what_add_process_would(tmp_path, ext, text, message):
+    path = tmp_path / f'w{ext}'
+    path.write_text(text)
+    with pytest.raises(WorkloadError) as e:
+        load_workload(path)
+    assert str(e.value).startswith(message)
+
+
+def test_integral_floats_are_accepted(tmp_path):
+    path = tmp_path / 'w.jsonl'
+    path.write_text('{"pid": 1, "arrival": 0.0, "burst": 3.0}\n')
+    assert list(load_workload(path).rows()) == [(1, 0, 3, 0)]
+
+
+def test_a_rejected_file_leaves_into_unchanged(tmp_path, workload):
+    before = columns(workload)
+    path = tmp_path / 'w.csv'
+    path.write_text("pid,arrival,burst\n900001,0,3\n" + f"{workload.pid[0]},0,3\n")
+    with pytest.raises(WorkloadError):
+        load_workload(path, into=workload)
+    assert columns(workload) == before
+
+
+def test_rejects_unknown_and_damaged_files(tmp_path, workload):
+    with pytest.raises(WorkloadError):
+        save_workload(workload, tmp_path / 'w.txt')
+    path = tmp_path / 'w.pswl'
+    save_workload(workload, path)
+    path.write_bytes(path.read_bytes()[:-8])
+    with pytest.raises(WorkloadError, match='truncated'):
+        load_workload(path)
+    path.write_bytes(b'NOPE' + bytes(12))
+    with pytest.raises(WorkloadError, match='not a binary workload'):
+        load_workload(path)
+    # Shorter than the header
+    path.write_bytes(b'PSWL')
+    with pytest.raises(WorkloadError, match='not a binary workload'):
+        load_workload(path)